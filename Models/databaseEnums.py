@@ -9,6 +9,8 @@
             Added a static method to Priority to get string and color associated with a given priority
         - 11/18/2024 Magaly Camacho
             Added helpful methods to Frequency enum
+        - 10/17/2026 BusyBee Team
+            Added closed-form occurrence arithmetic to Frequency (nth, index_on_or_after, first_on_or_after, occurs_on)
 
     Preconditions: 
         - None
@@ -26,7 +28,8 @@
 
 
 from enum import Enum
-from datetime import datetime, timedelta
+from calendar import monthrange
+from datetime import date, datetime, timedelta
 
 
 class ItemType(Enum):
@@ -173,5 +176,86 @@ class Frequency(Enum):
             
             # Normal
             return current_date.replace(year=next_year)
+
+
+    def nth(self, k:int, original_date:datetime) -> datetime:
+        """
+        Returns occurrence k (0 is original_date) without stepping through the earlier ones,
+        the same date k calls to get_next_date would return
+        
+        Parameters:
+            k (int): index of the occurrence, 0 or more
+            original_date (datetime): date of the first occurrence
+
+        Raises:
+            ValueError: if k is negative, or k > 0 for NO_REPEAT
+        """
+        if k < 0:
+            raise ValueError("Occurrence index must be 0 or more")
+        if k == 0:
+            return original_date
         
+        if self == Frequency.DAILY:
+            return original_date + timedelta(days=k)
+        
+        elif self == Frequency.WEEKLY:
+            return original_date + timedelta(weeks=k)
+        
+        elif self == Frequency.MONTHLY:
+            # month k months later, day clamped to the last day of that month
+            months = original_date.month - 1 + k
+            year = original_date.year + months // 12
+            month = months % 12 + 1
+            day = min(original_date.day, monthrange(year, month)[1])
+            return original_date.replace(year=year, month=month, day=day)
+        
+        elif self == Frequency.YEARLY:
+            # Feb 29 becomes Feb 28 after the first year and stays there
+            if original_date.month == 2 and original_date.day == 29:
+                return original_date.replace(year=original_date.year + k, day=28)
+            
+            return original_date.replace(year=original_date.year + k)
+        
+        raise ValueError("A series that doesn't repeat only has occurrence 0")
     
+
+    def index_on_or_after(self, current_date:datetime, original_date:datetime) -> int:
+        """
+        Returns the index of the first occurrence at or after current_date
+        
+        Parameters:
+            current_date (datetime): the date to search from
+            original_date (datetime): date of the first occurrence
+        """
+        if current_date <= original_date:
+            return 0
+        
+        if self == Frequency.DAILY or self == Frequency.WEEKLY:
+            step = timedelta(days=1) if self == Frequency.DAILY else timedelta(weeks=1)
+            return -(-(current_date - original_date) // step) # ceiling division
+
+        if self == Frequency.MONTHLY:
+            k = (current_date.year - original_date.year) * 12 + current_date.month - original_date.month
+        elif self == Frequency.YEARLY:
+            k = current_date.year - original_date.year
+        else:
+            return 1 # NO_REPEAT, the only occurrence is before current_date
+
+        # occurrence k is in the same month/year as current_date, if it's earlier the next one is after
+        return k if self.nth(k, original_date) >= current_date else k + 1
+    
+
+    def first_on_or_after(self, current_date:datetime, original_date:datetime) -> datetime:
+        """Returns the first occurrence at or after current_date (None for NO_REPEAT if it's after original_date)"""
+        k = self.index_on_or_after(current_date, original_date)
+        if Frequency.is_no_repeat(self) and k > 0:
+            return None
+        
+        return self.nth(k, original_date)
+    
+
+    def occurs_on(self, day:date, original_date:datetime) -> bool:
+        """Returns whether an occurrence falls on the given calendar day"""
+        start_of_day = datetime(day.year, day.month, day.day)
+        occurrence = self.first_on_or_after(start_of_day, original_date)
+        return occurrence is not None and occurrence < start_of_day + timedelta(days=1)
@@ -9,6 +9,8 @@
             Added __repr__() method, and added superclass attributes to docstring
         - 11/18/2024 Magaly Camacho
             Removed relation to recurrence (moved up to Item model)
+        - 10/17/2026 BusyBee Team
+            Indexed start_time for month and day range queries
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -63,7 +65,8 @@ class Event_(Item):
     place: Mapped[Optional[str]] = mapped_column(String(100))
     
     start_time: Mapped[datetime] = mapped_column(
-        default=datetime.now # defaults to inserted date and time
+        default=datetime.now, # defaults to inserted date and time
+        index=True # calendar and daily view query by start time
     )
     
     e_created: Mapped[datetime] = mapped_column(
@@ -7,6 +7,8 @@
     Revisions: 
         - 11/18/2024 Magaly Camacho
             Added relation to recurrence
+        - 10/17/2026 BusyBee Team
+            Indexed recurrence_id to find all items of a recurrence
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -83,7 +85,10 @@ class Item(Base):
 
 
     # Foreign Key to the Recurrence model
-    recurrence_id: Mapped[Optional[int]] = mapped_column(ForeignKey("Recurrence.id"))
+    recurrence_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("Recurrence.id"),
+        index=True # items are looked up by recurrence
+    )
 
 
     # Many-to-One Relationship with Recurrence
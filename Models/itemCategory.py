@@ -5,7 +5,8 @@
 
     Date Created: 10/21/2024
     Revisions: 
-        - None
+        - 10/17/2026 BusyBee Team
+            Added index on category_id (primary key leads with item_id, so it can't serve category lookups)
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -24,7 +25,7 @@
 
 # Imports
 from .base import Base # base model
-from sqlalchemy import Column, Table, ForeignKey
+from sqlalchemy import Column, Table, ForeignKey, Index
 
 
 item_category_association = Table(
@@ -41,5 +42,8 @@ item_category_association = Table(
     Column("category_id", 
         ForeignKey("Category.id"), 
         primary_key=True
-    )
+    ),
+
+    # index to find items by category
+    Index("ix_Item_Category_category_id", "category_id", "item_id")
 )
\ No newline at end of file
@@ -9,6 +9,8 @@
             Added __repr__() method
         - 11/18/2024 Magaly Camacho
             Removed relation to events, added relation to items
+        - 10/17/2026 BusyBee Team
+            Added virtual attribute, for series stored as a rule plus their first item
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -34,6 +36,7 @@ from .base import Base # base model
 from .item import Item # Event model
 from .databaseEnums import Frequency # Enum for frequency attribute
 from typing import List, Optional
+from sqlalchemy import false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -44,14 +47,18 @@ class Recurrence(Base):
     Attributes:
         __tablename__ (str): the name of the table
         id (int): recurrence id (primary key, automatically generated by database)
-        times (int): how many times to repeat, including original item
+        times (int): how many times to repeat, including original item (FOREVER for open-ended virtual series)
         frequency (Models.databaseEnums.Frequency): how often to repeat (daily, weekly, monthly, yearly)
+        virtual (bool): if True only the first item is stored and the other occurrences are expanded when queried
         r_created (datetime): date and time recurrence was created
         r_last_updated (datetime): date and time recurrence was last updated
         items (list[Item]): items associated with this recurrence
     """
     __tablename__ = "Recurrence"
 
+    # times value of a virtual series that never ends
+    FOREVER = 0
+
 
     # Attributes, all are NOT NULL (required)
     id: Mapped[int] = mapped_column(
@@ -62,6 +69,11 @@ class Recurrence(Base):
 
     frequency: Mapped[Frequency] # daily, weekly, monthly, yearly
 
+    virtual: Mapped[bool] = mapped_column(
+        default=False, # defaults to every occurrence being stored
+        server_default=false() # for rows that existed before this attribute
+    )
+
     r_created: Mapped[datetime.datetime] = mapped_column(
         default=datetime.datetime.now # defaults to inserted date and time
     )
@@ -84,6 +96,7 @@ class Recurrence(Base):
         string += f"\n\tid={self.id}"
         string += f"\n\ttimes={self.times}"
         string += f"\n\tfrequency={self.frequency}"
+        string += f"\n\tvirtual={self.virtual}"
         string += "\n)\n"
 
         return string
\ No newline at end of file
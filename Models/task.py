@@ -11,6 +11,8 @@
             Added __repr__() method, and added superclass attributes to docstring
         - 11/04/2024 Magaly Camacho
             Added due_date attribute
+        - 10/17/2026 BusyBee Team
+            Indexed due_date, and priority with due_date, for the to-do list sorts and filters
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -34,7 +36,7 @@ from typing import Optional
 from datetime import datetime
 from .item import Item # Superclass model
 from .databaseEnums import ItemType, Priority # enums for types of item, and complete and priority attributes 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column 
 
 
@@ -62,7 +64,9 @@ class Task(Item):
         primary_key=True # foreign key is primary key
     ) 
 
-    due_date: Mapped[Optional[datetime]] # optional due date
+    due_date: Mapped[Optional[datetime]] = mapped_column(
+        index=True # to-do list is sorted by due date
+    ) # optional due date
     
     complete: Mapped[bool] = mapped_column(
         default=False # defaults to not complete
@@ -87,6 +91,11 @@ class Task(Item):
         "polymorphic_identity": ItemType.TASK
     }
 
+    # Index for filtering by priority (and sorting by priority), ties ordered by due date
+    __table_args__ = (
+        Index("ix_Task_priority_due_date", "priority", "due_date"),
+    )
+
     def __repr__(self):
         """String representation of task instance"""
         string = "\nTask("
@@ -0,0 +1,27 @@
+"""
+    Name: Services Package Init file
+    Description: Make Services directory a package (query and data services built on the database)
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions: 
+        - None
+
+    Preconditions: 
+        - None
+    Postconditions: 
+        - None
+    Errors/Exceptions: 
+        - None
+    Side Effects: 
+        - None
+    Invariants: 
+        - None
+    Known Faults: 
+        - None
+"""
+
+# easy import from Services
+from .eventRepository import EventRepository, EventRecord
+from .eventCache import EventCache, get_event_cache
+from .taskRepository import TaskRepository, TaskRecord
@@ -0,0 +1,338 @@
+"""
+    Name: Archive
+    Description: Moves completed tasks and past events out of the live tables into an archive database next to it
+                 (busybee_archive.db), and reads them back only when history is asked for
+                 (run with "python -m Services.archive [--test] [--days=N]")
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Events are only archived when asked for (events=True, as the command line does), not by the idle run
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Event_, Task, Category, and Recurrence models must be implemented
+    Postconditions:
+        - Archived items are no longer in the live tables (or the search index), their copies are in the archive
+    Errors/Exceptions:
+        - ValueError if an unknown command line option is given
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - Creates the archive database the first time it's attached
+    Invariants:
+        - The archive is attached to a connection only while archiving or reading history, and detached before
+          the connection goes back to the pool, so everyday queries only ever see the live tables
+        - A batch is copied in one transaction and deleted in another, so an interrupted batch leaves items in both
+          databases (copied again by the next run), never in neither
+        - A series is only archived once all of its items can be, and virtual series never are
+          (their first event stands for occurrences still to come)
+    Known Faults:
+        - The calendar, daily view, and search only show live items, archived ones are only listed by the to-do list's "Archived" filter
+          (or archived_event_records_between), so past events are only archived when the user runs the command line
+        - Archived items keep their category ids, a category deleted later is missing from their history
+"""
+
+
+# Imports
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Iterator
+from sqlalchemy import Connection, MetaData, Select, Table, bindparam, delete, exists, func, insert, or_, select, update
+from database import Database, get_database # for typing, and the app's database for the command line
+from Models import Event_, Task, Category, Recurrence # models
+from Models.item import Item # Superclass model
+from Models.itemCategory import item_category_association # association table
+from Services.eventRepository import EventRecord # archived event read model
+from Services.taskRepository import TaskRecord # archived task read model
+from Services.queries import CATEGORY_SEPARATOR # to aggregate category names
+
+
+# Name the archive database is attached under
+ARCHIVE_SCHEMA = "archive"
+
+# Added to the live database's name for the archive's (busybee.db -> busybee_archive.db)
+ARCHIVE_SUFFIX = "_archive.db"
+
+# Completed tasks (by due date, or last update without one) and events older than this many days are archived
+DEFAULT_HORIZON_DAYS = 90
+
+# Items moved per batch (each batch is one copy and one delete transaction)
+BATCH_SIZE = 500
+
+# Live tables
+item_table = Item.__table__
+event_table = Event_.__table__
+task_table = Task.__table__
+category_table = Category.__table__
+recurrence_table = Recurrence.__table__
+link_table = item_category_association
+
+
+def _archive_tables() -> tuple[MetaData, dict[str, Table]]:
+    """Returns the archive's metadata and its copies of the live tables, by name (Category is copied only so foreign keys resolve, it stays live)"""
+    metadata = MetaData()
+    tables = {
+        table.name: table.to_metadata(metadata, schema=ARCHIVE_SCHEMA)
+        for table in (recurrence_table, item_table, event_table, task_table, link_table)
+    }
+    category_table.to_metadata(metadata, schema=ARCHIVE_SCHEMA)
+    return metadata, tables
+
+ARCHIVE_METADATA, ARCHIVE_TABLES = _archive_tables()
+archive_recurrence = ARCHIVE_TABLES[recurrence_table.name]
+archive_item = ARCHIVE_TABLES[item_table.name]
+archive_event = ARCHIVE_TABLES[event_table.name]
+archive_task = ARCHIVE_TABLES[task_table.name]
+archive_link = ARCHIVE_TABLES[link_table.name]
+
+
+def archive_path(db:Database) -> str:
+    """Returns the path of the database's archive (next to it)"""
+    return os.path.splitext(db.db_path)[0] + ARCHIVE_SUFFIX
+
+
+@contextmanager
+def attached_archive(db:Database) -> Iterator[Connection]:
+    """
+    Yields a connection with the archive attached (creating it and its tables if needed), detached afterwards
+
+    Parameters:
+        db (Database): live database
+
+    Yields:
+        Connection: connection to the live database, the archive's tables are in ARCHIVE_SCHEMA
+    """
+    with db.engine.connect() as connection:
+        # ATTACH can't run in a transaction, sqlite3 doesn't start one before it
+        connection.exec_driver_sql(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (archive_path(db),))
+        try:
+            ARCHIVE_METADATA.create_all(connection, tables=list(ARCHIVE_TABLES.values()))
+            connection.commit()
+            yield connection
+        finally:
+            connection.rollback() # DETACH can't run in a transaction either
+            connection.exec_driver_sql(f"DETACH DATABASE {ARCHIVE_SCHEMA}")
+
+
+def build_archivable_task_ids() -> Select:
+    """Returns statement selecting up to :batch_size ids of completed tasks last due (or updated) before :cutoff, whose series are done too"""
+    other_item = item_table.alias("other_item")
+    other_task = task_table.alias("other_task")
+
+    def done(task):
+        return task.c.complete.is_(True) & (func.coalesce(task.c.due_date, task.c.t_last_updated) < bindparam("cutoff"))
+
+    unfinished_sibling = exists().where(
+        other_item.c.recurrence_id == item_table.c.recurrence_id,
+        other_task.c.id == other_item.c.id,
+        ~done(other_task)
+    )
+    return (
+        select(item_table.c.id)
+        .join(task_table, task_table.c.id == item_table.c.id)
+        .where(done(task_table), or_(item_table.c.recurrence_id.is_(None), ~unfinished_sibling))
+        .limit(bindparam("batch_size"))
+    )
+
+
+def build_archivable_event_ids() -> Select:
+    """Returns statement selecting up to :batch_size ids of events that started before :cutoff, whose (not virtual) series are over too"""
+    other_item = item_table.alias("other_item")
+    other_event = event_table.alias("other_event")
+
+    upcoming_sibling = exists().where(
+        other_item.c.recurrence_id == item_table.c.recurrence_id,
+        other_event.c.id == other_item.c.id,
+        other_event.c.start_time >= bindparam("cutoff")
+    )
+    return (
+        select(item_table.c.id)
+        .join(event_table, event_table.c.id == item_table.c.id)
+        .outerjoin(recurrence_table, recurrence_table.c.id == item_table.c.recurrence_id)
+        .where(
+            event_table.c.start_time < bindparam("cutoff"),
+            or_(item_table.c.recurrence_id.is_(None), recurrence_table.c.virtual.is_not(True) & ~upcoming_sibling)
+        )
+        .limit(bindparam("batch_size"))
+    )
+
+
+def build_archived_task_records() -> Select:
+    """Returns statement selecting the TaskRecord columns of every archived task (categories from the live Category table), latest due first"""
+    return (
+        select(
+            archive_task.c.id, archive_item.c.name, archive_task.c.due_date, archive_task.c.priority, archive_task.c.complete,
+            func.group_concat(category_table.c.name, CATEGORY_SEPARATOR)
+        )
+        .join(archive_item, archive_item.c.id == archive_task.c.id)
+        .outerjoin(archive_link, archive_link.c.item_id == archive_task.c.id)
+        .outerjoin(category_table, category_table.c.id == archive_link.c.category_id)
+        .group_by(archive_task.c.id)
+        .order_by(archive_task.c.due_date.desc())
+    )
+
+
+def build_archived_event_records_between() -> Select:
+    """Returns statement selecting EventRecord columns of archived events with :start <= start_time < :end, ordered by start_time"""
+    return (
+        select(archive_event.c.id, archive_item.c.name, archive_event.c.start_time, archive_event.c.place)
+        .join(archive_item, archive_item.c.id == archive_event.c.id)
+        .where(archive_event.c.start_time >= bindparam("start"), archive_event.c.start_time < bindparam("end"))
+        .order_by(archive_event.c.start_time)
+    )
+
+
+# Prebuilt statements
+ARCHIVABLE_TASK_IDS = build_archivable_task_ids() # parameters: cutoff, batch_size
+ARCHIVABLE_EVENT_IDS = build_archivable_event_ids() # parameters: cutoff, batch_size
+ARCHIVED_TASK_RECORDS = build_archived_task_records()
+ARCHIVED_EVENT_RECORDS_BETWEEN = build_archived_event_records_between() # parameters: start, end
+
+
+def _renumber_conflicts(connection:Connection, live:Table, archived:Table, created:str, ids:list[int], references:list[tuple[Table, str]]) -> int:
+    """
+    Moves archived rows out of the way of the live rows about to be copied, where a live row reused the id of
+    a different (differently created) archived row, updating the archive's references to them
+
+    Parameters:
+        connection (Connection): connection with the archive attached
+        live (Table): live table
+        archived (Table): its archive copy
+        created (str): name of the creation time column
+        ids (list[int]): ids about to be copied
+        references (list[tuple[Table, str]]): archive (table, column) pairs that refer to archived's id
+
+    Returns:
+        int: number of archived rows renumbered
+    """
+    conflicts = connection.execute(
+        select(archived.c.id)
+        .join(live, live.c.id == archived.c.id)
+        .where(archived.c.id.in_(ids), archived.c[created] != live.c[created])
+    ).scalars().all()
+    if not conflicts:
+        return 0
+
+    # New ids after every id used in either database, so they can't conflict again until the live ids catch up
+    next_id = max(
+        connection.execute(select(func.coalesce(func.max(archived.c.id), 0))).scalar(),
+        connection.execute(select(func.coalesce(func.max(live.c.id), 0))).scalar()
+    ) + 1
+    for old_id in conflicts:
+        for table, column in references + [(archived, "id")]:
+            connection.execute(update(table).where(table.c[column] == old_id).values({column: next_id}))
+        next_id += 1
+    return len(conflicts)
+
+
+def _copy(connection:Connection, live:Table, archived:Table, condition):
+    """Copies the live rows matching condition to the archive, replacing copies left by an interrupted batch"""
+    columns = [column.name for column in live.c]
+    connection.execute(insert(archived).prefix_with("OR REPLACE").from_select(columns, select(live).where(condition)))
+
+
+def _archive_batch(connection:Connection, ids:list[int]):
+    """Copies the items with the given ids (and their recurrences and category links) to the archive, then deletes them, in two transactions"""
+    recurrence_ids = select(item_table.c.recurrence_id).where(item_table.c.id.in_(ids), item_table.c.recurrence_id.is_not(None))
+    used_recurrence_ids = connection.execute(recurrence_ids).scalars().all()
+
+    # Copy (one transaction on the archive)
+    _renumber_conflicts(connection, recurrence_table, archive_recurrence, "r_created", used_recurrence_ids, [(archive_item, "recurrence_id")])
+    _renumber_conflicts(connection, item_table, archive_item, "i_created", ids,
+                        [(archive_event, "id"), (archive_task, "id"), (archive_link, "item_id")])
+    _copy(connection, recurrence_table, archive_recurrence, recurrence_table.c.id.in_(used_recurrence_ids))
+    for live, archived in ((item_table, archive_item), (event_table, archive_event), (task_table, archive_task)):
+        _copy(connection, live, archived, live.c.id.in_(ids))
+    connection.execute(delete(archive_link).where(archive_link.c.item_id.in_(ids)))
+    _copy(connection, link_table, archive_link, link_table.c.item_id.in_(ids))
+    connection.commit()
+
+    # Delete (one transaction on the live database, the search index's trigger removes them from it)
+    # their recurrences are left for maintenance's garbage collection, other live items may still use them
+    connection.execute(delete(link_table).where(link_table.c.item_id.in_(ids)))
+    for table in (event_table, task_table, item_table):
+        connection.execute(delete(table).where(table.c.id.in_(ids)))
+    connection.commit()
+
+
+def archive_old_items(db:Database, horizon_days:int=DEFAULT_HORIZON_DAYS, batch_size:int=BATCH_SIZE, events:bool=False) -> dict:
+    """
+    Moves completed tasks (and events, if asked) older than horizon_days days into the archive, batch_size items per batch
+
+    Parameters:
+        db (Database): live database
+        horizon_days (int): how many days of history stay live, DEFAULT_HORIZON_DAYS by default
+        batch_size (int): most items moved per batch, BATCH_SIZE by default
+        events (bool): whether to archive past events too (the calendar stops showing them), False by default
+
+    Returns:
+        dict: "tasks" and "events" archived, "batches", and "seconds" taken
+    """
+    start = perf_counter()
+    parameters = {"cutoff": datetime.now() - timedelta(days=horizon_days), "batch_size": batch_size}
+    report = {"tasks": 0, "events": 0, "batches": 0}
+
+    kinds = (("tasks", ARCHIVABLE_TASK_IDS), ("events", ARCHIVABLE_EVENT_IDS)) if events else (("tasks", ARCHIVABLE_TASK_IDS),)
+    with attached_archive(db) as connection:
+        for kind, statement in kinds:
+            while True:
+                ids = connection.execute(statement, parameters).scalars().all()
+                if not ids:
+                    break
+                _archive_batch(connection, ids)
+                report[kind] += len(ids)
+                report["batches"] += 1
+
+    report["seconds"] = perf_counter() - start
+    return report
+
+
+def format_archive_report(report:dict) -> str:
+    """Returns a one line summary of archive_old_items's report"""
+    return f"Archive: moved {report['tasks']} tasks and {report['events']} events in {report['batches']} batches ({report['seconds'] * 1000:.1f} ms)"
+
+
+def archived_task_records(db:Database) -> list[TaskRecord]:
+    """Returns TaskRecords for every archived task, latest due first"""
+    with attached_archive(db) as connection:
+        return [TaskRecord(*row) for row in connection.execute(ARCHIVED_TASK_RECORDS)]
+
+
+def archived_event_records_between(db:Database, start:datetime, end:datetime) -> list[EventRecord]:
+    """Returns EventRecords for the archived events with start <= start_time < end, ordered by start_time"""
+    with attached_archive(db) as connection:
+        return [EventRecord(*row) for row in connection.execute(ARCHIVED_EVENT_RECORDS_BETWEEN, {"start": start, "end": end})]
+
+
+def archive_counts(db:Database) -> dict:
+    """Returns how many tasks and events are live and archived ("live_tasks", "archived_tasks", "live_events", "archived_events")"""
+    with attached_archive(db) as connection:
+        count = lambda table: connection.execute(select(func.count()).select_from(table)).scalar()
+        return {
+            "live_tasks": count(task_table), "archived_tasks": count(archive_task),
+            "live_events": count(event_table), "archived_events": count(archive_event),
+        }
+
+
+# Command line options ("--days=N" is also accepted)
+OPTIONS = {
+    "--test": "use the test database instead of busybee.db",
+}
+
+
+if __name__ == "__main__":
+    horizon_days = DEFAULT_HORIZON_DAYS
+    options = sys.argv[1:]
+    for option in options:
+        if option.startswith("--days="):
+            horizon_days = int(option.removeprefix("--days="))
+        elif option not in OPTIONS:
+            raise ValueError(f"Unknown option: {option} (choose from {', '.join(OPTIONS)}, --days=N)")
+
+    db = get_database(test="--test" in options)
+    print(format_archive_report(archive_old_items(db, horizon_days, events=True)))
+    print(", ".join(f"{kind.replace('_', ' ')}: {count}" for kind, count in archive_counts(db).items()))
@@ -0,0 +1,579 @@
+"""
+    Name: Benchmarks
+    Description: Headless timing benchmarks for the database services (run with "python -m Services.benchmarks [name ...]")
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added recurrence expansion benchmark
+        - 10/17/2026 BusyBee Team
+            Added task list statement count benchmark
+        - 10/17/2026 BusyBee Team
+            Added read model memory and latency benchmark
+        - 10/17/2026 BusyBee Team
+            Added full-text search latency benchmark
+        - 10/17/2026 BusyBee Team
+            Added prebuilt statement benchmark
+        - 10/17/2026 BusyBee Team
+            Added .ics import throughput and memory benchmark
+        - 10/17/2026 BusyBee Team
+            Added .ics export throughput and memory benchmark
+        - 10/17/2026 BusyBee Team
+            Added task CSV import throughput benchmark
+        - 10/17/2026 BusyBee Team
+            Added archive benchmark (to-do list load before and after archiving, archive throughput)
+        - 10/17/2026 BusyBee Team
+            Added to-do list first page benchmark (keyset pages versus the whole list, by backlog size)
+        - 10/17/2026 BusyBee Team
+            Added sync versus async executor throughput benchmark under concurrent load (skipped without aiosqlite)
+        - 10/17/2026 BusyBee Team
+            The Task and Event_ entity queries moved here from the repositories as baselines, the task list benchmark
+            compares them with TaskRecords (the statement count is checked by Tests/test_taskRepository.py)
+        - 10/17/2026 BusyBee Team
+            Consolidated the imports (one line per module)
+        - 10/17/2026 BusyBee Team
+            Removed the sync versus async executor benchmark, with the async engine
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Must be run from the project directory (so Models, Services, and database can be imported)
+    Postconditions:
+        - Timings are printed to the console
+    Errors/Exceptions:
+        - ValueError if an unknown benchmark name is given
+    Side Effects:
+        - Creates and deletes temporary databases
+    Invariants:
+        - Benchmarks never touch busybee.db
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import csv
+import os
+import random
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from time import perf_counter
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import contains_eager, subqueryload
+from database import Database
+from Models import Event_, Task, Category, Recurrence
+from Models.databaseEnums import Frequency, Priority
+from Services import queries, recurrenceExpansion
+from Services.seriesWriter import series_dates, insert_recurrence, insert_events, insert_tasks, insert_task_rows
+from Services.eventRepository import EventRepository, month_range
+from Services.taskRepository import TaskRepository
+from Services.itemSearch import ItemSearch
+from Services.queryCounter import QueryCounter
+from Services.icsImport import IcsImporter
+from Services.icsExport import IcsExporter
+from Services.taskCsv import TaskCsvImporter, CSV_COLUMNS, export_tasks
+from Services.archive import archive_old_items, archived_task_records, DEFAULT_HORIZON_DAYS
+
+
+@contextmanager
+def temporary_database():
+    """Yields a Database in a temporary directory, disposed of and deleted afterwards"""
+    with tempfile.TemporaryDirectory() as directory:
+        db = Database(db_path=os.path.join(directory, "benchmark.db"))
+        try:
+            yield db
+        finally:
+            db.engine.dispose()
+
+
+def timed(function, *args, **kwargs) -> float:
+    """Returns how many milliseconds function(*args, **kwargs) took"""
+    start = perf_counter()
+    function(*args, **kwargs)
+    return (perf_counter() - start) * 1000
+
+
+def _orm_event_series(db:Database, start:datetime, times:int):
+    """Saves an event series one ORM object at a time (previous AddEventModal.save_event)"""
+    with db.get_session() as session, session.begin():
+        recurrence = Recurrence(times=times, frequency=Frequency.DAILY)
+        session.add(recurrence)
+        session.flush()
+        for start_time in series_dates(Frequency.DAILY, start, times):
+            session.add(Event_(name="Benchmark", notes="", start_time=start_time, recurrence_id=recurrence.id))
+
+
+def _bulk_event_series(db:Database, start:datetime, times:int):
+    """Saves an event series with the series writer"""
+    with db.get_session() as session, session.begin():
+        recurrence_id = insert_recurrence(session, Frequency.DAILY, times)
+        insert_events(session, "Benchmark", "", series_dates(Frequency.DAILY, start, times), recurrence_id=recurrence_id)
+
+
+def _orm_task_series(db:Database, start:datetime, times:int, category_ids:list[int]):
+    """Saves a task series one ORM object at a time, copying categories (previous AddTaskModal.save_task)"""
+    with db.get_session() as session, session.begin():
+        categories = session.query(Category).filter(Category.id.in_(category_ids)).all()
+        recurrence = Recurrence(times=times, frequency=Frequency.DAILY)
+        session.add(recurrence)
+        session.flush()
+        for due_date in series_dates(Frequency.DAILY, start, times):
+            task = Task(name="Benchmark", notes="", due_date=due_date, recurrence_id=recurrence.id)
+            task.categories = categories
+            session.add(task)
+
+
+def _bulk_task_series(db:Database, start:datetime, times:int, category_ids:list[int]):
+    """Saves a task series with the series writer"""
+    with db.get_session() as session, session.begin():
+        recurrence_id = insert_recurrence(session, Frequency.DAILY, times)
+        insert_tasks(session, "Benchmark", "", series_dates(Frequency.DAILY, start, times), category_ids=category_ids, recurrence_id=recurrence_id)
+
+
+def benchmark_series_insert(sizes:tuple[int, ...]=(10, 365, 5000)):
+    """Compares saving event and task series through the ORM versus the bulk series writer"""
+    start = datetime(2025, 1, 1, 9, 0)
+    print("Series insert (ms)      ORM     bulk  speedup")
+    for times in sizes:
+        with temporary_database() as db:
+            with db.get_session() as session, session.begin():
+                categories = [Category(name=f"Category {i}") for i in range(3)]
+                session.add_all(categories)
+                session.flush()
+                category_ids = [category.id for category in categories]
+
+            results = [
+                ("events", timed(_orm_event_series, db, start, times), timed(_bulk_event_series, db, start, times)),
+                ("tasks", timed(_orm_task_series, db, start, times, category_ids), timed(_bulk_task_series, db, start, times, category_ids)),
+            ]
+        for kind, orm_ms, bulk_ms in results:
+            print(f"{times:>6} {kind:<10} {orm_ms:>9.1f} {bulk_ms:>8.1f} {orm_ms / bulk_ms:>7.1f}x")
+
+
+def _loop_dates(frequency:Frequency, start:datetime, times:int) -> list[datetime]:
+    """Computes occurrence dates one get_next_date call at a time (previous save_event/save_task loop)"""
+    dates = [start]
+    for _ in range(times - 1):
+        dates.append(frequency.get_next_date(dates[-1], start))
+    return dates
+
+
+def benchmark_expansion(sizes:tuple[int, ...]=(10_000, 100_000)):
+    """Compares the get_next_date loop with expand_dates (NumPy and pure Python) for each frequency"""
+    start = datetime(2024, 1, 31, 9, 0)
+    numpy = recurrenceExpansion.np
+    print(f"Recurrence expansion (ms), NumPy {'installed' if numpy is not None else 'not installed'}")
+    print("   times frequency     loop    numpy   python")
+    for times in sizes:
+        for frequency in (Frequency.DAILY, Frequency.WEEKLY, Frequency.MONTHLY, Frequency.YEARLY):
+            # stay inside datetime's year range (year 9999)
+            count = min(times, {Frequency.MONTHLY: 90_000, Frequency.YEARLY: 7_000}.get(frequency, times))
+            loop_ms = timed(_loop_dates, frequency, start, count)
+
+            numpy_ms = float("nan")
+            if numpy is not None:
+                numpy_ms = timed(recurrenceExpansion.expand_dates, frequency, start, count)
+
+            recurrenceExpansion.np = None
+            try:
+                python_ms = timed(recurrenceExpansion.expand_dates, frequency, start, count)
+            finally:
+                recurrenceExpansion.np = numpy
+            print(f"{count:>8} {frequency.name:<9} {loop_ms:>8.1f} {numpy_ms:>8.1f} {python_ms:>8.1f}")
+
+
+def _task_rows(tasks:list[Task]) -> list[tuple]:
+    """Reads the columns the to-do list displays, including every task's categories"""
+    return [(task.id, task.name, task.priority, task.due_date, [category.name for category in task.categories]) for task in tasks]
+
+
+def _lazy_task_list(db:Database) -> list[tuple]:
+    """Loads the task list with lazy loaded categories (previous ToDoListView.populate)"""
+    with db.get_session() as session:
+        return _task_rows(session.scalars(select(Task).order_by(Task.due_date)).all())
+
+
+def _orm_sorted_tasks(session, sort:str) -> list[Task]:
+    """Loads all tasks sorted by the given option as Task entities, categories subquery loaded (previous TaskRepository.sorted_tasks)"""
+    if sort == "Priority":
+        stmt = select(Task).order_by(queries.priority_order())
+    elif sort == "Category":
+        stmt = select(Task).outerjoin(Task.categories).order_by(func.coalesce(Category.name, "").asc())
+    else:
+        stmt = select(Task).order_by(Task.due_date.asc())
+    return list(session.scalars(stmt.options(subqueryload(Task.categories))))
+
+
+def _subquery_task_list(db:Database, sort:str) -> list[tuple]:
+    """Loads the task list with subquery loaded categories"""
+    with db.get_session() as session:
+        return _task_rows(_orm_sorted_tasks(session, sort))
+
+
+def _orm_events_between(db:Database, start:datetime, end:datetime) -> list[Event_]:
+    """Loads the events in [start, end) as Event_ entities, virtual occurrences as transient copies (previous EventRepository.events_between)"""
+    with db.get_session() as session:
+        events = list(session.scalars(
+            select(Event_)
+            .outerjoin(Event_.recurrence)
+            .where(Event_.start_time >= start, Event_.start_time < end, or_(Event_.recurrence_id.is_(None), Recurrence.virtual.is_(False)))
+            .order_by(Event_.start_time)
+        ))
+        firsts = session.scalars(
+            select(Event_)
+            .join(Event_.recurrence)
+            .where(Recurrence.virtual.is_(True), Event_.start_time < end)
+            .options(contains_eager(Event_.recurrence))
+        ).all()
+
+    if firsts:
+        for first in firsts:
+            recurrence = first.recurrence
+            events.extend(
+                Event_(id=first.id, name=first.name, notes=first.notes, place=first.place, start_time=occurrence, recurrence_id=first.recurrence_id)
+                for occurrence in recurrenceExpansion.occurrences_between(recurrence.frequency, first.start_time, recurrence.times, start, end)
+            )
+        events.sort(key=lambda event: event.start_time)
+    return events
+
+
+def benchmark_task_list(sizes:tuple[int, ...]=(100, 2000)):
+    """Compares statements and time to load the to-do list with lazy or subquery loaded categories, versus TaskRecords"""
+    start = datetime(2025, 1, 1, 9, 0)
+    print("Task list                    statements                 ms")
+    print("  tasks sort           lazy  subquery records    lazy subquery records")
+    for times in sizes:
+        with temporary_database() as db:
+            with db.get_session() as session, session.begin():
+                categories = [Category(name=f"Category {i}") for i in range(3)]
+                session.add_all(categories)
+                session.flush()
+                insert_tasks(session, "Benchmark", "", series_dates(Frequency.DAILY, start, times), category_ids=[category.id for category in categories])
+
+            with QueryCounter(db.engine) as lazy:
+                lazy_ms = timed(_lazy_task_list, db)
+
+            for sort in ("Due Date", "Priority", "Category"):
+                with QueryCounter(db.engine) as subquery:
+                    subquery_ms = timed(_subquery_task_list, db, sort)
+                with QueryCounter(db.engine) as records:
+                    records_ms = timed(_record_tasks, db, sort)
+                print(f"{times:>7} {sort:<10} {lazy.count:>8} {subquery.count:>9} {records.count:>7} {lazy_ms:>7.1f} {subquery_ms:>8.1f} {records_ms:>7.1f}")
+
+
+def peak_kib(function, *args, **kwargs) -> float:
+    """Returns the peak memory (KiB) allocated while function(*args, **kwargs) ran, including its result"""
+    tracemalloc.start()
+    try:
+        result = function(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def _orm_tasks(db:Database, sort:str) -> list[Task]:
+    """Loads the task list as Task entities (with their categories)"""
+    with db.get_session() as session:
+        tasks = _orm_sorted_tasks(session, sort)
+        _task_rows(tasks) # read what the view displays
+        return tasks
+
+
+def _record_tasks(db:Database, sort:str) -> list:
+    """Loads the task list as TaskRecords"""
+    with db.get_session() as session:
+        return TaskRepository.sorted_records(session, sort)
+
+
+def benchmark_read_models(rows:int=50_000):
+    """Compares memory and time to load rows events and rows tasks as ORM entities versus read model records"""
+    start = datetime(2000, 1, 1, 9, 0)
+    dates = series_dates(Frequency.DAILY, start, rows)
+    window = (dates[0], dates[-1] + (dates[1] - dates[0]))
+
+    with temporary_database() as db:
+        with db.get_session() as session, session.begin():
+            categories = [Category(name=f"Category {i}") for i in range(3)]
+            session.add_all(categories)
+            session.flush()
+            insert_events(session, "Benchmark", "", dates)
+            insert_tasks(session, "Benchmark", "", dates, category_ids=[category.id for category in categories])
+
+        repository = EventRepository(db)
+        results = [
+            ("events", (_orm_events_between, db, *window), (repository.records_between, *window)),
+            ("tasks", (_orm_tasks, db, "Due Date"), (_record_tasks, db, "Due Date")),
+        ]
+
+        print(f"Read models, {rows} rows      ORM   records  speedup")
+        for kind, (orm, *orm_args), (records, *records_args) in results:
+            orm_ms, records_ms = timed(orm, *orm_args), timed(records, *records_args)
+            orm_kib, records_kib = peak_kib(orm, *orm_args), peak_kib(records, *records_args)
+            print(f"{kind:<7} time (ms)   {orm_ms:>9.1f} {records_ms:>9.1f} {orm_ms / records_ms:>7.1f}x")
+            print(f"{kind:<7} peak (KiB)  {orm_kib:>9.0f} {records_kib:>9.0f} {orm_kib / records_kib:>7.1f}x")
+
+
+def _search_vocabulary(generator:random.Random, size:int=8000) -> tuple[list[str], list[float]]:
+    """Returns made up words and cumulative weights for picking them with a Zipf distribution, like real text"""
+    syllables = ("ba", "de", "ri", "mo", "ta", "ne", "ku", "li", "so", "pa", "ven", "tor", "mi", "al", "gr", "on")
+    words = sorted({"".join(generator.choice(syllables) for _ in range(generator.randint(2, 4))) for _ in range(size)})
+    generator.shuffle(words)
+
+    weights, total = [], 0.0
+    for rank in range(1, len(words) + 1):
+        total += 1 / rank # the nth most common word is n times rarer than the most common one
+        weights.append(total)
+    return words, weights
+
+
+def benchmark_search(items:int=100_000, repeats:int=20):
+    """Times ItemSearch.search (median and worst of repeats) on items events and tasks with Zipf distributed words"""
+    generator = random.Random(0) # same items every run
+    words, weights = _search_vocabulary(generator)
+    start = datetime(2020, 1, 1, 9, 0)
+    dates = series_dates(Frequency.DAILY, start, items // 2)
+
+    def phrase(length:int) -> str:
+        return " ".join(generator.choices(words, cum_weights=weights, k=length))
+
+    with temporary_database() as db:
+        with db.get_session() as session, session.begin():
+            for date in dates:
+                insert_events(session, phrase(3).capitalize(), phrase(8), [date])
+                insert_tasks(session, phrase(3).capitalize(), phrase(8), [date])
+
+        # what a user types while searching for the most common, a common, and a rare word
+        common, second, rare = words[0], words[1], words[2000]
+        searches = (
+            common[:2], common[:3], common, common + " ", f"{common} {second[:3]}", f"{common} {second}", 
+            words[50], rare, "zzz"
+        )
+
+        search = ItemSearch(db)
+        print(f"Search, {items} items            median     worst  results")
+        for search_text in searches:
+            times = [timed(search.search, search_text) for _ in range(repeats)]
+            print(f"{search_text!r:<29} {statistics.median(times):>7.2f} {max(times):>9.2f} {len(search.search(search_text)):>8}")
+
+
+def _navigate_months(connection, months:list[tuple[int, int]], prebuilt:bool):
+    """Runs the calendar's month queries for each (year, month), with the prebuilt or newly built statements"""
+    for year, month in months:
+        start, end = month_range(year, month)
+        between = queries.EVENT_RECORDS_BETWEEN if prebuilt else queries.build_event_records_between()
+        virtual = queries.VIRTUAL_EVENT_RECORDS_BEFORE if prebuilt else queries.build_virtual_event_records_before()
+        connection.execute(between, {"start": start, "end": end}).all()
+        connection.execute(virtual, {"end": end}).all()
+
+
+def _switch_sorts(connection, switches:int, prebuilt:bool):
+    """Runs the to-do list query switches times, cycling through the sort options"""
+    for i in range(switches):
+        sort = queries.SORT_OPTIONS[i % len(queries.SORT_OPTIONS)]
+        statement = queries.task_records_sorted(sort) if prebuilt else queries.build_task_records_sorted(sort)
+        connection.execute(statement).all()
+
+
+def benchmark_statements(calls:int=600):
+    """Compares microseconds per call for the month navigation and sort switch queries: compiled every call (no cache), rebuilt, and prebuilt"""
+    start = datetime(2025, 1, 1, 9, 0)
+    months = [(2025 + i // 12, i % 12 + 1) for i in range(calls)]
+
+    with temporary_database() as db:
+        # a small database, so statement overhead isn't hidden by the query itself
+        with db.get_session() as session, session.begin():
+            insert_events(session, "Benchmark", "", series_dates(Frequency.WEEKLY, start, 50))
+            insert_tasks(session, "Benchmark", "", series_dates(Frequency.WEEKLY, start, 50))
+
+        print(f"Statements (us per call)   no cache   rebuilt  prebuilt")
+        with db.engine.connect() as connection, db.engine.connect() as uncached:
+            uncached.execution_options(compiled_cache=None) # what building without SQLAlchemy's cache costs (changes uncached in place)
+            for name, run, args in (("month navigation", _navigate_months, (months,)), ("sort switch", _switch_sorts, (calls,))):
+                run(connection, *args, True) # warm up the cache
+                compiled_us = timed(run, uncached, *args, False) * 1000 / calls
+                rebuilt_us = timed(run, connection, *args, False) * 1000 / calls
+                prebuilt_us = timed(run, connection, *args, True) * 1000 / calls
+                print(f"{name:<25} {compiled_us:>9.1f} {rebuilt_us:>9.1f} {prebuilt_us:>9.1f}")
+
+
+def _write_ics(path:str, components:int):
+    """Writes an .ics file of alternating events and tasks, every tenth one weekly for 10 weeks"""
+    start = datetime(2020, 1, 1, 9, 0)
+    with open(path, "w", newline="") as file:
+        file.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//BusyBee//Benchmark//EN\r\n")
+        for i in range(components):
+            kind = "VEVENT" if i % 2 == 0 else "VTODO"
+            date = (start + timedelta(hours=i)).strftime("%Y%m%dT%H%M%S")
+            file.write(f"BEGIN:{kind}\r\nUID:{i}@busybee\r\nSUMMARY:Imported item {i}\r\n")
+            file.write(f"DESCRIPTION:Notes for item {i}\\, with an escaped comma and a folded\r\n  line\r\n")
+            file.write(f"{'DTSTART' if kind == 'VEVENT' else 'DUE'}:{date}\r\n")
+            if kind == "VTODO":
+                file.write(f"PRIORITY:{i % 10}\r\nCATEGORIES:Work,Home\r\n")
+            if i % 10 == 0:
+                file.write("RRULE:FREQ=WEEKLY;COUNT=10\r\n")
+            file.write(f"END:{kind}\r\n")
+        file.write("END:VCALENDAR\r\n")
+
+
+def benchmark_ics_import(sizes:tuple[int, ...]=(10_000, 50_000)):
+    """Measures .ics import throughput, and that peak memory doesn't grow with the file"""
+    print("ICS import        file MB  items/s  peak KiB    rows")
+    for components in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "benchmark.ics")
+            _write_ics(path, components)
+
+            # throughput and memory from separate imports, tracing memory slows Python down
+            with temporary_database() as db:
+                stats = IcsImporter(db).import_file(path)
+            with temporary_database() as db:
+                kib = peak_kib(IcsImporter(db).import_file, path)
+            print(f"{components:>10} items {stats.total_bytes / 1e6:>8.1f} {stats.events_per_second:>8.0f} {kib:>9.0f} {stats.rows:>7}")
+
+
+def benchmark_ics_export(items:int=100_000):
+    """Measures .ics export throughput and peak memory on a database of about items events and tasks"""
+    print("ICS export        file MB  items/s  peak KiB  components  collapsed")
+    with tempfile.TemporaryDirectory() as directory, temporary_database() as db:
+        path = os.path.join(directory, "benchmark.ics")
+        _write_ics(path, items * 10 // 19) # every tenth component is a series of 10, so 1.9 items per component
+        IcsImporter(db).import_file(path)
+
+        # throughput and memory from separate exports, tracing memory slows Python down
+        stats = IcsExporter(db).export_file(path)
+        kib = peak_kib(IcsExporter(db).export_file, path)
+        size = os.path.getsize(path) / 1e6
+        print(f"{stats.items:>10} items {size:>8.1f} {stats.items_per_second:>8.0f} {kib:>9.0f} {stats.events + stats.tasks:>11} {stats.collapsed:>10}")
+
+
+def _write_task_csv(path:str, rows:int):
+    """Writes a CSV of rows tasks, a third with one category and a third with two, every hundredth row invalid"""
+    start = datetime(2024, 1, 1, 9, 0)
+    categories = ["", "Work", "Home;Errands"]
+    priorities = ["", "Low", "Medium", "High"]
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_COLUMNS)
+        for i in range(rows):
+            due_date = "not a date" if i % 100 == 99 else (start + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M")
+            writer.writerow([f"Backlog task {i}", f"Notes for task {i}", due_date, priorities[i % 4], "no", categories[i % 3]])
+
+
+def benchmark_task_csv(rows:int=100_000):
+    """Measures task CSV import throughput (target: more than 50k rows per second) and export throughput"""
+    print("Task CSV          file MB   rows/s  rejected  export rows/s  (median of 3)")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.csv")
+        _write_task_csv(path, rows)
+
+        import_rates, export_rates = [], []
+        for _ in range(3):
+            with temporary_database() as db:
+                stats = TaskCsvImporter(db).import_file(path)
+                import_rates.append(stats.rows_per_second)
+
+                start = perf_counter()
+                exported = export_tasks(db, os.path.join(directory, "export.csv"))
+                export_rates.append(exported / (perf_counter() - start))
+
+        size = os.path.getsize(path) / 1e6
+        print(f"{rows:>10} rows {size:>8.1f} {statistics.median(import_rates):>8.0f} {stats.rejected_count:>9} {statistics.median(export_rates):>14.0f}")
+
+
+def _todo_list_ms(db:Database, repeats:int=5) -> float:
+    """Returns the median milliseconds to load the to-do list (sorted by due date)"""
+    with db.get_session() as session:
+        return statistics.median(timed(TaskRepository.sorted_records, session, "Due Date") for _ in range(repeats))
+
+
+def benchmark_archive(items:int=100_000):
+    """Compares loading the to-do list before and after archiving two years of tasks and events (half each), and times the archiving"""
+    print(f"Archive ({DEFAULT_HORIZON_DAYS} days)  live tasks  to-do ms  archived  items/s  archived to-do ms")
+    with temporary_database() as db:
+        start = datetime.now() - timedelta(days=730)
+        step = timedelta(days=730) / (items // 2)
+        dates = [start + step * i for i in range(items // 2)]
+        with db.get_session() as session, session.begin():
+            insert_events(session, "Benchmark", "", dates)
+            insert_tasks(session, "Benchmark", "", dates)
+            session.execute(update(Task).where(Task.due_date < datetime.now() - timedelta(days=30)).values(complete=True))
+
+        before = _todo_list_ms(db)
+        report = archive_old_items(db, events=True)
+        after = _todo_list_ms(db)
+        with db.get_session() as session:
+            live = session.execute(select(Task.id)).all()
+
+        archived = report["tasks"] + report["events"]
+        history = timed(archived_task_records, db)
+        print(f"{items:>10} items {len(live):>10} {before:>6.1f} -> {after:<6.1f} {archived:>8} {archived / report['seconds']:>8.0f} {history:>18.1f}")
+
+
+def _add_backlog(db:Database, tasks:int, generator:random.Random):
+    """Adds tasks with random due dates (a tenth without one), priorities, and up to two of ten categories"""
+    with db.get_session() as session, session.begin():
+        category_ids = session.execute(select(Category.id)).scalars().all()
+        if not category_ids:
+            session.add_all(Category(name=f"Category {i}") for i in range(10))
+            session.flush()
+            category_ids = session.execute(select(Category.id)).scalars().all()
+
+        start = datetime(2024, 1, 1)
+        priorities = [None, Priority.LOW, Priority.MEDIUM, Priority.HIGH]
+        insert_task_rows(session, [
+            {
+                "name": f"Backlog task {i}", "notes": "",
+                "due_date": None if generator.random() < 0.1 else start + timedelta(minutes=generator.randrange(1_000_000)),
+                "priority": generator.choice(priorities),
+                "category_ids": generator.sample(category_ids, generator.randrange(3)),
+            }
+            for i in range(tasks)
+        ])
+
+
+def benchmark_task_pages(sizes:tuple[int, ...]=(1_000, 10_000, 100_000)):
+    """Compares the to-do list's first paint (milliseconds to load the first page) with loading every task, for each sort and backlog size"""
+    print("Task pages         sort       first page ms  next page ms  whole list ms")
+    generator = random.Random(7)
+    with temporary_database() as db:
+        total = 0
+        for size in sizes:
+            _add_backlog(db, size - total, generator)
+            total = size
+            with db.get_session() as session:
+                for sort in ("Due Date", "Priority", "Category"):
+                    first_page, cursor = TaskRepository.records_page(session, sort)
+                    first = statistics.median(timed(TaskRepository.records_page, session, sort) for _ in range(5))
+                    following = statistics.median(timed(TaskRepository.records_page, session, sort, cursor) for _ in range(5))
+                    whole = timed(TaskRepository.sorted_records, session, sort)
+                    print(f"{size:>10} tasks {sort:>10} {first:>15.2f} {following:>13.2f} {whole:>14.1f}")
+
+
+# Benchmarks by name
+BENCHMARKS = {
+    "series": benchmark_series_insert,
+    "expansion": benchmark_expansion,
+    "tasklist": benchmark_task_list,
+    "readmodels": benchmark_read_models,
+    "search": benchmark_search,
+    "statements": benchmark_statements,
+    "icsimport": benchmark_ics_import,
+    "icsexport": benchmark_ics_export,
+    "taskcsv": benchmark_task_csv,
+    "archive": benchmark_archive,
+    "taskpages": benchmark_task_pages,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name} (choose from {', '.join(BENCHMARKS)})")
+        BENCHMARKS[name]()
@@ -0,0 +1,201 @@
+"""
+    Name: Database Executor
+    Description: Runs database work on a background thread and hands results back to the Kivy main loop
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added get_file_executor, a second worker for long file jobs so they don't hold up the UI's queries
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Kivy must be installed to use the default dispatcher (headless callers can pass their own)
+    Postconditions:
+        - Callbacks run on the thread the dispatcher delivers to (the Kivy main loop by default)
+    Errors/Exceptions:
+        - Exceptions raised by the work are passed to on_error (printed by default), never raised on the worker
+    Side Effects:
+        - Starts worker thread(s) on first use
+    Invariants:
+        - Each worker thread has its own session, closed after every job
+        - With one worker (the default) jobs run in the order they were submitted, so a save is always
+          finished before a refresh submitted after it
+        - Long jobs (file imports and exports, archiving, maintenance) go to the file executor, so the shared executor's
+          queue only ever waits on short queries and saves (in WAL mode, reads aren't blocked by the file executor's writes)
+        - A cancelled job's callbacks are never called
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import os # to read BUSYBEE_SYNC_DB
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from database import Database, get_database
+
+
+def kivy_dispatch(callback:Callable[[], None]):
+    """Runs callback on the Kivy main loop at the next frame"""
+    from kivy.clock import Clock # imported here so the executor can be used without Kivy
+    Clock.schedule_once(lambda dt: callback())
+
+
+def print_error(error:BaseException):
+    """Default on_error, prints the error like the rest of the app does"""
+    print(f"Database error: {error!r}")
+
+
+class DatabaseJob:
+    """
+    Handle to submitted database work
+
+    Attributes:
+        future (Future): the underlying future (None when the executor runs inline)
+        cancelled (bool): whether cancel() was called
+    """
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self.cancelled = False
+
+
+    def cancel(self):
+        """Cancels the job, it won't run if it hasn't started and its callbacks won't be called either way"""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+    def done(self) -> bool:
+        """Returns whether the job finished, failed, or was cancelled"""
+        return self.future is None or self.future.done()
+
+
+    def result(self, timeout:Optional[float]=None) -> Any:
+        """Waits for and returns the job's result (for headless use, never call this on the main loop)"""
+        return None if self.future is None else self.future.result(timeout)
+
+
+class DatabaseExecutor:
+    """
+    Runs work(session) on background thread(s) with a per-thread session
+
+    Attributes:
+        db (Database): database the sessions connect to
+        inline (bool): if True, run work and callbacks immediately on the calling thread (the old synchronous behavior)
+    """
+    def __init__(self, db:Database, workers:int=1, dispatch:Callable[[Callable[[], None]], None]=kivy_dispatch, inline:bool=False):
+        """
+        Initialize executor
+
+        Parameters:
+            db (Database): database the sessions connect to
+            workers (int): number of worker threads, 1 by default (keeps jobs in submission order)
+            dispatch (function): delivers a callback to the UI thread, Kivy's Clock by default
+            inline (bool): run everything synchronously on the calling thread, False by default
+        """
+        self.db = db
+        self.inline = inline
+        self._dispatch = dispatch
+        self._sessions = scoped_session(sessionmaker(db.engine)) # one session per thread
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="busybee-db")
+
+
+    def submit(self, work:Callable[[Session], Any], on_result:Optional[Callable[[Any], None]]=None, on_error:Callable[[BaseException], None]=print_error) -> DatabaseJob:
+        """
+        Runs work(session) in the background, then on_result(result) or on_error(exception) on the UI thread
+
+        Parameters:
+            work (function): takes the worker's session and returns the result (commit inside it when writing)
+            on_result (function): called with the result (optional)
+            on_error (function): called with the exception if work raises, prints it by default
+
+        Returns:
+            DatabaseJob: handle to cancel or wait for the work
+        """
+        job = DatabaseJob()
+
+        if self.inline:
+            try:
+                result = self._run(job, work)
+            except Exception as error:
+                on_error(error)
+            else:
+                if on_result is not None:
+                    on_result(result)
+            return job
+
+        job.future = self._pool.submit(self._run, job, work)
+        job.future.add_done_callback(lambda future: self._deliver(job, future, on_result, on_error))
+        return job
+
+
+    def _run(self, job:DatabaseJob, work:Callable[[Session], Any]) -> Any:
+        """Runs work with this thread's session (skipped if the job was cancelled while queued)"""
+        if job.cancelled:
+            return None
+
+        session = self._sessions()
+        try:
+            return work(session)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close() # release the connection, and don't keep objects between jobs
+
+
+    def _deliver(self, job:DatabaseJob, future:Future, on_result, on_error):
+        """Passes the finished job's result or error to the UI thread (called on the worker)"""
+        if future.cancelled() or job.cancelled:
+            return
+
+        error = future.exception()
+        if error is not None:
+            callback = lambda: on_error(error)
+        elif on_result is not None:
+            result = future.result()
+            callback = lambda: on_result(result)
+        else:
+            return
+
+        # the job might be cancelled between now and when the UI thread runs the callback
+        self._dispatch(lambda: None if job.cancelled else callback())
+
+
+    def shutdown(self, wait:bool=True):
+        """Stops the worker thread(s), waiting for queued jobs by default"""
+        self._pool.shutdown(wait=wait)
+        self._sessions.remove()
+
+
+# Shared executors, created on first use
+_db_executor: Optional[DatabaseExecutor] = None
+_file_executor: Optional[DatabaseExecutor] = None
+_db_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> DatabaseExecutor:
+    """Returns the shared database executor for busybee (inline if BUSYBEE_SYNC_DB is set), creating it on first use"""
+    global _db_executor
+    with _db_executor_lock:
+        if _db_executor is None:
+            _db_executor = DatabaseExecutor(get_database(), inline=bool(os.environ.get("BUSYBEE_SYNC_DB")))
+        return _db_executor
+
+
+def get_file_executor() -> DatabaseExecutor:
+    """
+    Returns the executor for long file jobs (imports, exports, archiving, maintenance), creating it on first use
+
+    It has its own worker, so these jobs don't queue up the UI's queries on get_db_executor, but they aren't ordered
+    with the jobs submitted there (refresh from the job's on_result instead)
+    """
+    global _file_executor
+    with _db_executor_lock:
+        if _file_executor is None:
+            _file_executor = DatabaseExecutor(get_database(), inline=bool(os.environ.get("BUSYBEE_SYNC_DB")))
+        return _file_executor
@@ -0,0 +1,141 @@
+"""
+    Name: Event Cache
+    Description: In-process LRU cache of lightweight event records keyed by (year, month), invalidated by the months writes touch
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Months are loaded as EventRecords directly (EventRecord moved to eventRepository)
+        - 10/17/2026 BusyBee Team
+            A month loaded while the cache was invalidated isn't stored (invalidation generation)
+
+    Preconditions:
+        - EventRepository must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - SQLAlchemyError for any SQLAlchemy-related errors (when a month has to be loaded)
+    Side Effects:
+        - Queries the database on a miss
+    Invariants:
+        - At most max_months months are cached, the least recently used month is evicted first
+        - Every write to an event must invalidate the months of its old and new start times
+        - A month is only stored if no invalidation happened while it was loading, so a load that read the database
+          before a write (on another thread) is never served after the write's invalidation
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import threading # cache can be used from more than one thread
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Iterable, Optional
+from database import get_database # to get the shared database
+from Services.eventRepository import EventRepository, EventRecord # to load months
+
+
+class EventCache:
+    """
+    Caches each month's events as EventRecords
+
+    Attributes:
+        repository (EventRepository): used to load months that aren't cached
+        max_months (int): most months kept in the cache
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups that had to query the database
+    """
+    def __init__(self, repository:EventRepository, max_months:int=24):
+        """
+        Initialize empty cache
+
+        Parameters:
+            repository (EventRepository): used to load months that aren't cached
+            max_months (int): most months kept in the cache, 24 by default
+        """
+        self.repository = repository
+        self.max_months = max_months
+        self.hits = 0
+        self.misses = 0
+        self._months: OrderedDict[tuple[int, int], tuple[EventRecord, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0 # bumped by every invalidation
+
+
+    def month(self, year:int, month:int) -> tuple[EventRecord, ...]:
+        """Returns the events starting in the given month, ordered by start time"""
+        key = (year, month)
+        with self._lock:
+            records = self._months.get(key)
+            if records is not None:
+                self.hits += 1
+                self._months.move_to_end(key) # most recently used
+                return records
+            self.misses += 1
+            generation = self._generation
+
+        # load outside the lock so other months can still be served
+        records = tuple(self.repository.records_in_month(year, month))
+
+        with self._lock:
+            if generation != self._generation: # invalidated while loading, the records may be from before the write
+                return records
+            self._months[key] = records
+            self._months.move_to_end(key)
+            while len(self._months) > self.max_months:
+                self._months.popitem(last=False) # evict least recently used
+        return records
+
+
+    def day(self, day:date) -> list[EventRecord]:
+        """Returns the events starting on the given day, ordered by start time"""
+        return [record for record in self.month(day.year, day.month) if record.start_time.date() == day_of(day)]
+
+
+    def invalidate(self, dates:Iterable[Optional[date]]):
+        """Forgets the months of the given dates (None is ignored)"""
+        with self._lock:
+            self._generation += 1
+            for changed in dates:
+                if changed is not None:
+                    self._months.pop((changed.year, changed.month), None)
+
+
+    def invalidate_all(self):
+        """Forgets every month (e.g. when a virtual recurrence, which spans any number of months, changes)"""
+        with self._lock:
+            self._generation += 1
+            self._months.clear()
+
+
+    def stats(self) -> dict:
+        """Returns hits, misses, hit_rate, and the number of cached months"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "months": len(self._months),
+            }
+
+
+def day_of(value:date) -> date:
+    """Returns the calendar day of a date or datetime"""
+    return value.date() if isinstance(value, datetime) else value
+
+
+# Shared cache, created on first use
+_event_cache: Optional[EventCache] = None
+_event_cache_lock = threading.Lock()
+
+
+def get_event_cache() -> EventCache:
+    """Returns the shared event cache for busybee, creating it on first use"""
+    global _event_cache
+    with _event_cache_lock:
+        if _event_cache is None:
+            _event_cache = EventCache(EventRepository(get_database()))
+        return _event_cache
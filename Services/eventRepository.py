@@ -0,0 +1,128 @@
+"""
+    Name: Event Repository
+    Description: Date range queries for events, written as half-open ranges on Event_.start_time so the index can serve them
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions: 
+        - 10/17/2026 BusyBee Team
+            Expand virtual recurrences into the requested range
+        - 10/17/2026 BusyBee Team
+            Added EventRecord read model queries (only the columns the views display, no ORM entities)
+        - 10/17/2026 BusyBee Team
+            EventRecord queries use the prebuilt statements in queries, query_plan explains the one records_between runs
+        - 10/17/2026 BusyBee Team
+            Removed query_plan, Tests/test_eventRepository.py checks the plan instead
+        - 10/17/2026 BusyBee Team
+            Removed the Event_ entity queries (events_between, events_on, events_in_month), the views only use EventRecords
+            (the old path is kept in Services.benchmarks as the read model baseline)
+
+    Preconditions: 
+        - SQLAlchemy must be installed and configured in the environment
+        - Event_ model must be implemented, with an index on start_time
+    Postconditions: 
+        - None
+    Errors/Exceptions: 
+        - ValueError if an invalid year, month, or day is given
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects: 
+        - None
+    Invariants: 
+        - Every query compares the stored start_time directly (never wrapped in a function), so it stays sargable
+        - Occurrences of a virtual recurrence are returned as EventRecords with the first item's id
+    Known Faults: 
+        - None
+"""
+
+
+# Imports
+from datetime import date, datetime, timedelta
+from typing import Optional
+from database import Database # for typing
+from Services.recurrenceExpansion import occurrences_between # to expand virtual recurrences
+from Services import queries # prebuilt statements
+
+
+class EventRecord:
+    """
+    Lightweight, read-only copy of the event columns the views display
+
+    Attributes:
+        id (int): event id
+        name (str): event name
+        start_time (datetime): event start time
+        place (str): event place (optional)
+    """
+    __slots__ = ("id", "name", "start_time", "place")
+
+    def __init__(self, id:int, name:str, start_time:datetime, place:Optional[str]=None):
+        self.id = id
+        self.name = name
+        self.start_time = start_time
+        self.place = place
+
+    def __repr__(self):
+        """String representation of event record"""
+        return f"EventRecord(id={self.id}, name={self.name!r}, start_time={self.start_time})"
+
+
+def month_range(year:int, month:int) -> tuple[datetime, datetime]:
+    """Returns the half-open range [first day of month, first day of next month)"""
+    start = datetime(year, month, 1)
+    end = datetime(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def day_range(day:date) -> tuple[datetime, datetime]:
+    """Returns the half-open range [start of day, start of next day)"""
+    start = datetime(day.year, day.month, day.day)
+    return start, start + timedelta(days=1)
+
+
+class EventRepository:
+    """
+    Queries events by date range
+
+    Attributes:
+        db (Database): database to query
+    """
+    def __init__(self, db:Database):
+        """
+        Initialize repository
+
+        Parameters:
+            db (Database): database to query
+        """
+        self.db = db
+
+
+    def records_between(self, start:datetime, end:datetime) -> list[EventRecord]:
+        """
+        Returns EventRecords for the events starting in the half-open range [start, end), ordered by start time
+
+        Parameters:
+            start (datetime): inclusive lower bound
+            end (datetime): exclusive upper bound
+
+        Returns:
+            list[EventRecord]: the events, including virtual occurrences
+        """
+        with self.db.get_session() as session:
+            records = [EventRecord(*row) for row in session.execute(queries.EVENT_RECORDS_BETWEEN, {"start": start, "end": end})]
+            firsts = session.execute(queries.VIRTUAL_EVENT_RECORDS_BEFORE, {"end": end}).all()
+
+        # add occurrences of virtual recurrences, keeping the start time order
+        if firsts:
+            for id, name, first_time, place, frequency, times in firsts:
+                records.extend(
+                    EventRecord(id, name, occurrence, place)
+                    for occurrence in occurrences_between(frequency, first_time, times, start, end)
+                )
+            records.sort(key=lambda record: record.start_time)
+
+        return records
+
+
+    def records_in_month(self, year:int, month:int) -> list[EventRecord]:
+        """Returns EventRecords for the events starting in the given month, ordered by start time"""
+        return self.records_between(*month_range(year, month))
@@ -0,0 +1,323 @@
+"""
+    Name: iCalendar Export
+    Description: Streams events (VEVENT) and tasks (VTODO) from the database into an iCalendar (.ics) file,
+                 collapsing series back into repeat rules (RRULE)
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Event_, Task, Category, Recurrence models and the Item-Category association must be implemented
+    Postconditions:
+        - The file can be imported by Services.icsImport (and other calendar apps)
+    Errors/Exceptions:
+        - OSError if the file can't be written
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - Creates or overwrites the file
+    Invariants:
+        - Rows are fetched CHUNK_SIZE at a time (yield_per), in recurrence order, so only one series is held in memory
+        - A stored series is written as one component with an RRULE only if the rule reproduces every occurrence
+          exactly (same dates, and the same name, notes, place or priority, completion, and categories),
+          otherwise each occurrence is written on its own
+    Known Faults:
+        - Times are written as floating local times (no time zone)
+        - Events have no end time, so none is written
+        - Occurrences of a series written on their own are imported back as separate events or tasks, not a series
+"""
+
+
+# Imports
+from datetime import datetime, timezone
+from itertools import groupby
+from time import perf_counter
+from typing import Callable, Iterator, Optional, TextIO
+from sqlalchemy import Select, select, func
+from sqlalchemy.orm import Session
+from database import Database # for typing
+from Models import Event_, Task, Category, Recurrence # models
+from Models.databaseEnums import Frequency, Priority # enums
+from Models.item import Item # Superclass model
+from Models.itemCategory import item_category_association # to list each task's categories
+from Services.queries import CATEGORY_SEPARATOR # separates aggregated category names
+from Services.seriesWriter import series_dates # to check a series still follows its rule
+
+
+# Rows fetched from the database at a time
+CHUNK_SIZE = 1000
+
+# iCalendar FREQ of each Frequency
+RRULE_NAMES = {
+    Frequency.DAILY: "DAILY",
+    Frequency.WEEKLY: "WEEKLY",
+    Frequency.MONTHLY: "MONTHLY",
+    Frequency.YEARLY: "YEARLY",
+}
+
+# iCalendar PRIORITY of each Priority (read back the same way by icsImport.parse_priority)
+ICS_PRIORITIES = {
+    Priority.HIGH: 1,
+    Priority.MEDIUM: 5,
+    Priority.LOW: 9,
+}
+
+# Longest content line in octets, longer ones are folded
+LINE_OCTETS = 75
+
+
+class ExportStats:
+    """
+    Progress and totals of an export
+
+    Attributes:
+        events (int): VEVENTs written
+        tasks (int): VTODOs written
+        items (int): events and tasks read (each stored occurrence counts)
+        total_items (int): events and tasks in the database
+        collapsed (int): stored series written as a single component with an RRULE
+        bytes_written (int): characters written to the file
+        seconds (float): time taken so far
+    """
+    __slots__ = ("events", "tasks", "items", "total_items", "collapsed", "bytes_written", "seconds")
+
+    def __init__(self, total_items:int=0):
+        self.events = 0
+        self.tasks = 0
+        self.items = 0
+        self.total_items = total_items
+        self.collapsed = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the items read, 0 to 1"""
+        return self.items / self.total_items if self.total_items else 1.0
+
+
+    @property
+    def items_per_second(self) -> float:
+        """Events and tasks read per second"""
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+    def __repr__(self):
+        """String representation of export stats"""
+        return (
+            f"ExportStats(events={self.events}, tasks={self.tasks}, items={self.items}, "
+            f"collapsed={self.collapsed}, {self.items_per_second:.0f} per second)"
+        )
+
+
+def escape(text:Optional[str]) -> str:
+    """Returns text as iCalendar TEXT (backslashes, semicolons, commas, and newlines escaped)"""
+    if text is None:
+        return ""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def format_date(value:datetime) -> str:
+    """Returns a naive local datetime as a floating iCalendar DATE-TIME"""
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def fold(line:str) -> str:
+    """Returns a content line folded into lines of at most LINE_OCTETS octets, each ending in CRLF"""
+    if len(line) <= LINE_OCTETS // 4 or len(line.encode("utf-8")) <= LINE_OCTETS:
+        return line + "\r\n"
+
+    parts = []
+    part, octets, limit = [], 0, LINE_OCTETS
+    for character in line:
+        size = len(character.encode("utf-8"))
+        if octets + size > limit:
+            parts.append("".join(part))
+            part, octets, limit = [], 0, LINE_OCTETS - 1 # continuation lines start with a space
+        part.append(character)
+        octets += size
+    parts.append("".join(part))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_rule(frequency:Frequency, times:int) -> str:
+    """Returns the RRULE value for a frequency repeated times times (Recurrence.FOREVER has no COUNT)"""
+    if times == Recurrence.FOREVER:
+        return f"FREQ={RRULE_NAMES[frequency]}"
+    return f"FREQ={RRULE_NAMES[frequency]};COUNT={times}"
+
+
+def build_event_rows() -> Select:
+    """Returns statement selecting every event with its recurrence, ordered by recurrence_id then id (served by Item's recurrence_id index)"""
+    return (
+        select(
+            Event_.id, Event_.name, Event_.notes, Event_.start_time, Event_.place,
+            Event_.recurrence_id, Recurrence.frequency, Recurrence.times, Recurrence.virtual
+        )
+        .outerjoin(Recurrence, Event_.recurrence_id == Recurrence.id)
+        .order_by(Item.recurrence_id, Item.id)
+    )
+
+
+def build_task_rows() -> Select:
+    """Returns statement selecting every task with its recurrence and category names, ordered by recurrence_id then id"""
+    categories = (
+        select(func.group_concat(Category.name, CATEGORY_SEPARATOR))
+        .join(item_category_association, item_category_association.c.category_id == Category.id)
+        .where(item_category_association.c.item_id == Task.id)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Task.id, Task.name, Task.notes, Task.due_date, Task.priority, Task.complete, categories,
+            Task.recurrence_id, Recurrence.frequency, Recurrence.times, Recurrence.virtual
+        )
+        .outerjoin(Recurrence, Task.recurrence_id == Recurrence.id)
+        .order_by(Item.recurrence_id, Item.id)
+    )
+
+
+# Prebuilt statements
+EVENT_ROWS = build_event_rows()
+TASK_ROWS = build_task_rows()
+
+
+def _series(rows) -> Iterator[list]:
+    """Groups rows ordered by recurrence into series (a list per recurrence, one row per list without one), ordered by date"""
+    for recurrence_id, group in groupby(rows, key=lambda row: row.recurrence_id):
+        if recurrence_id is None:
+            for row in group:
+                yield [row]
+        else:
+            yield sorted(group, key=lambda row: (row[3] is None, row[3] or datetime.min, row.id)) # by start_time/due_date
+
+
+def _follows_rule(series:list, fields:Callable) -> bool:
+    """Whether a stored series has the same fields in every row and dates exactly matching its frequency"""
+    first = series[0]
+    if len(series) < 2 or first.frequency is None or Frequency.is_no_repeat(first.frequency) or first[3] is None:
+        return False
+    if any(fields(row) != fields(first) for row in series):
+        return False
+    return [row[3] for row in series] == series_dates(first.frequency, first[3], len(series))
+
+
+class IcsExporter:
+    """Writes the database's events and tasks to an .ics file"""
+
+    def __init__(self, db:Database, chunk_size:int=CHUNK_SIZE):
+        """
+        Parameters:
+            db (Database): database to export
+            chunk_size (int): rows fetched at a time, CHUNK_SIZE by default
+        """
+        self.db = db
+        self.chunk_size = chunk_size
+        self.stamp = ""
+
+
+    def export_file(self, path:str, on_progress:Optional[Callable[[ExportStats], None]]=None) -> ExportStats:
+        """
+        Exports every event and task to an .ics file
+
+        Parameters:
+            path (str): path of the .ics file to write
+            on_progress (function): called with the stats after every chunk_size items (on the exporting thread)
+
+        Returns:
+            ExportStats: totals and throughput
+        """
+        start = perf_counter()
+        self.stamp = format_date(datetime.now(timezone.utc)) + "Z"
+
+        with open(path, "w", encoding="utf-8", newline="") as file, self.db.get_session() as session, session.begin():
+            stats = ExportStats(session.execute(select(func.count(Item.id))).scalar())
+            self._write(file, stats, "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//BusyBee//BusyBee//EN\r\n")
+
+            for series in _series(self._rows(session, EVENT_ROWS)):
+                self._write_events(file, series, stats)
+                self._report(stats, len(series), start, on_progress)
+            for series in _series(self._rows(session, TASK_ROWS)):
+                self._write_tasks(file, series, stats)
+                self._report(stats, len(series), start, on_progress)
+
+            self._write(file, stats, "END:VCALENDAR\r\n")
+
+        stats.seconds = perf_counter() - start
+        if on_progress is not None:
+            on_progress(stats)
+        return stats
+
+
+    def _rows(self, session:Session, statement:Select):
+        """Returns the statement's rows, fetched chunk_size at a time"""
+        return session.execute(statement, execution_options={"yield_per": self.chunk_size})
+
+
+    def _report(self, stats:ExportStats, items:int, start:float, on_progress:Optional[Callable]):
+        """Counts items read and calls on_progress each time another chunk_size items have been read"""
+        previous = stats.items
+        stats.items += items
+        if on_progress is not None and stats.items // self.chunk_size != previous // self.chunk_size:
+            stats.seconds = perf_counter() - start
+            on_progress(stats)
+
+
+    def _write(self, file:TextIO, stats:ExportStats, text:str):
+        """Writes text to the file and counts it"""
+        file.write(text)
+        stats.bytes_written += len(text)
+
+
+    def _component(self, kind:str, uid:str, properties:list[tuple[str, str]]) -> str:
+        """Returns a component's lines, skipping properties without a value"""
+        lines = [f"BEGIN:{kind}\r\n", fold(f"UID:{uid}"), f"DTSTAMP:{self.stamp}\r\n"]
+        lines.extend(fold(f"{name}:{value}") for name, value in properties if value)
+        lines.append(f"END:{kind}\r\n")
+        return "".join(lines)
+
+
+    def _rules(self, series:list, fields:Callable, stats:ExportStats) -> list[tuple]:
+        """Returns (row, RRULE or None) for each component to write for a series"""
+        first = series[0]
+        if first.virtual: # only the first occurrence is stored, the rule is the series
+            return [(first, format_rule(first.frequency, first.times))] + [(row, None) for row in series[1:]]
+        if _follows_rule(series, fields):
+            stats.collapsed += 1
+            return [(first, format_rule(first.frequency, len(series)))]
+        return [(row, None) for row in series]
+
+
+    def _write_events(self, file:TextIO, series:list, stats:ExportStats):
+        """Writes a series of events (or a single event) as one VEVENT with an RRULE if possible, otherwise one each"""
+        for row, rule in self._rules(series, lambda row: (row.name, row.notes, row.place), stats):
+            self._write(file, stats, self._component("VEVENT", f"event-{row.id}@busybee", [
+                ("SUMMARY", escape(row.name)),
+                ("DTSTART", format_date(row.start_time)),
+                ("LOCATION", escape(row.place)),
+                ("DESCRIPTION", escape(row.notes)),
+                ("RRULE", rule),
+            ]))
+            stats.events += 1
+
+
+    def _write_tasks(self, file:TextIO, series:list, stats:ExportStats):
+        """Writes a series of tasks (or a single task) as one VTODO with an RRULE if possible, otherwise one each"""
+        def fields(row):
+            names = sorted(row[6].split(CATEGORY_SEPARATOR)) if row[6] else []
+            return row.name, row.notes, row.priority, row.complete, names
+
+        for row, rule in self._rules(series, fields, stats):
+            self._write(file, stats, self._component("VTODO", f"task-{row.id}@busybee", [
+                ("SUMMARY", escape(row.name)),
+                ("DUE", row.due_date and format_date(row.due_date)),
+                ("PRIORITY", row.priority and str(ICS_PRIORITIES[row.priority])),
+                ("STATUS", "COMPLETED" if row.complete else "NEEDS-ACTION"),
+                ("CATEGORIES", ",".join(escape(name) for name in fields(row)[4])),
+                ("DESCRIPTION", escape(row.notes)),
+                ("RRULE", rule),
+            ]))
+            stats.tasks += 1
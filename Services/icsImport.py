@@ -0,0 +1,450 @@
+"""
+    Name: iCalendar Import
+    Description: Streams events (VEVENT) and tasks (VTODO) from an iCalendar (.ics) file into the database in chunked bulk inserts
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            A COUNT that isn't a positive number is rejected, and an UNTIL before DTSTART is a single occurrence
+            (0 times used to be stored as Recurrence.FOREVER)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Event_, Task, Category, Recurrence models and the Item-Category association must be implemented
+    Postconditions:
+        - Every chunk of imported items is committed on its own (an error keeps the chunks before it)
+    Errors/Exceptions:
+        - OSError if the file can't be read
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - Inserts rows into Item, Event_/Task, Recurrence, Category, and Item_Category
+    Invariants:
+        - The file is read one line at a time and at most chunk_size components are held in memory
+        - Recurring events are stored like the ones added in the app (long series are virtual)
+    Known Faults:
+        - Times with a TZID are read as local times, UTC times ("Z") are converted to local time
+        - Rules with INTERVAL, BYDAY, or other parts besides FREQ, COUNT, and UNTIL only import their first occurrence,
+          and EXDATE and changed occurrences (RECURRENCE-ID) are skipped
+"""
+
+
+# Imports
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import BinaryIO, Callable, Iterator, Optional
+from sqlalchemy import insert, select
+from database import Database # for typing
+from Models import Category, Recurrence # models
+from Models.databaseEnums import Frequency, Priority # enums
+from Services.seriesWriter import VIRTUAL_MIN_TIMES, series_dates, insert_event_rows, insert_task_rows # bulk inserts
+
+
+# Components written per transaction
+CHUNK_SIZE = 1000
+
+# RRULE frequencies that map to a Frequency
+RRULE_FREQUENCIES = {
+    "DAILY": Frequency.DAILY,
+    "WEEKLY": Frequency.WEEKLY,
+    "MONTHLY": Frequency.MONTHLY,
+    "YEARLY": Frequency.YEARLY,
+}
+
+# RRULE parts a Recurrence can represent
+SUPPORTED_RULE_PARTS = {"FREQ", "COUNT", "UNTIL", "WKST"}
+
+
+class IcsComponent:
+    """
+    A VEVENT or VTODO read from a file
+
+    Attributes:
+        kind (str): "VEVENT" or "VTODO"
+        properties (dict): property name to (parameters, value) of its first occurrence in the component
+    """
+    __slots__ = ("kind", "properties")
+
+    def __init__(self, kind:str):
+        self.kind = kind
+        self.properties: dict[str, tuple[dict, str]] = {}
+
+
+    def value(self, name:str) -> Optional[str]:
+        """Returns a property's raw value (None if missing)"""
+        prop = self.properties.get(name)
+        return prop[1] if prop else None
+
+
+class ImportStats:
+    """
+    Progress and totals of an import
+
+    Attributes:
+        events (int): events (series count once) read
+        tasks (int): tasks (series count once) read
+        rows (int): events and tasks stored (each occurrence of a materialized series counts)
+        skipped (int): components that couldn't be imported (no date, or a changed occurrence)
+        simplified_rules (int): rules only their first occurrence was imported for
+        bytes_read (int): bytes of the file read so far
+        total_bytes (int): size of the file
+        seconds (float): time taken so far
+    """
+    __slots__ = ("events", "tasks", "rows", "skipped", "simplified_rules", "bytes_read", "total_bytes", "seconds")
+
+    def __init__(self, total_bytes:int=0):
+        self.events = 0
+        self.tasks = 0
+        self.rows = 0
+        self.skipped = 0
+        self.simplified_rules = 0
+        self.bytes_read = 0
+        self.total_bytes = total_bytes
+        self.seconds = 0.0
+
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the file read, 0 to 1"""
+        return self.bytes_read / self.total_bytes if self.total_bytes else 1.0
+
+
+    @property
+    def events_per_second(self) -> float:
+        """Events and tasks read per second"""
+        return (self.events + self.tasks) / self.seconds if self.seconds else 0.0
+
+
+    def __repr__(self):
+        """String representation of import stats"""
+        return (
+            f"ImportStats(events={self.events}, tasks={self.tasks}, rows={self.rows}, skipped={self.skipped}, "
+            f"simplified_rules={self.simplified_rules}, {self.events_per_second:.0f} per second)"
+        )
+
+
+def content_lines(stream:BinaryIO) -> Iterator[tuple[str, int]]:
+    """
+    Yields the unfolded content lines of an iCalendar file, with the bytes read so far
+
+    Parameters:
+        stream (BinaryIO): file opened in binary mode
+
+    Yields:
+        tuple[str, int]: a content line (continuation lines joined) and the number of bytes read up to its end
+    """
+    bytes_read = 0
+    current = None
+    for raw in stream:
+        bytes_read += len(raw)
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+        # lines starting with a space or tab continue the previous line
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+
+        if current:
+            yield current, bytes_read - len(raw)
+        current = line
+
+    if current:
+        yield current, bytes_read
+
+
+def parse_line(line:str) -> tuple[str, dict, str]:
+    """Splits a content line, e.g. 'DTSTART;TZID=X:20240101T090000', into ("DTSTART", {"TZID": "X"}, "20240101T090000")"""
+    head, _, value = line.partition(":")
+    if '"' in head: # a quoted parameter value can contain ":"
+        quoted = False
+        for index, char in enumerate(line):
+            if char == '"':
+                quoted = not quoted
+            elif char == ":" and not quoted:
+                head, value = line[:index], line[index + 1:]
+                break
+
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def components(stream:BinaryIO) -> Iterator[tuple[IcsComponent, int]]:
+    """
+    Yields each VEVENT and VTODO in the file, one at a time, with the bytes read so far
+
+    Parameters:
+        stream (BinaryIO): file opened in binary mode
+
+    Yields:
+        tuple[IcsComponent, int]: the component and the number of bytes read up to its end
+    """
+    component = None
+    nested = 0 # depth inside the component (e.g. VALARM), their properties aren't the component's
+    for line, bytes_read in content_lines(stream):
+        name, parameters, value = parse_line(line)
+
+        if name == "BEGIN":
+            if component is None and value.upper() in ("VEVENT", "VTODO"):
+                component = IcsComponent(value.upper())
+            elif component is not None:
+                nested += 1
+
+        elif name == "END":
+            if component is not None and nested:
+                nested -= 1
+            elif component is not None and value.upper() == component.kind:
+                yield component, bytes_read
+                component = None
+
+        elif component is not None and not nested and name not in component.properties:
+            component.properties[name] = (parameters, value)
+
+
+def unescape(text:Optional[str]) -> Optional[str]:
+    """Returns iCalendar TEXT with its escapes (\\n, \\, \\; \\\\) replaced"""
+    if text is None:
+        return None
+    return re.sub(r"\\([nN,;\\])", lambda match: "\n" if match.group(1) in "nN" else match.group(1), text)
+
+
+def split_text_list(text:str) -> list[str]:
+    """Splits an iCalendar TEXT list (e.g. CATEGORIES) at unescaped commas"""
+    return [unescape(part).strip() for part in re.split(r"(?<!\\),", text) if part.strip()]
+
+
+def parse_date(value:Optional[str], parameters:Optional[dict]=None) -> Optional[datetime]:
+    """
+    Returns an iCalendar DATE or DATE-TIME as a naive local datetime
+
+    Parameters:
+        value (str): e.g. "20240101", "20240101T090000", or "20240101T090000Z" (UTC)
+        parameters (dict): the property's parameters (TZID is read as local time)
+
+    Returns:
+        datetime: the date and time (midnight for dates), None if missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        if len(value) == 8: # DATE
+            return datetime.strptime(value, "%Y%m%d")
+
+        utc = value.endswith("Z")
+        moment = datetime.strptime(value.rstrip("Z")[:15], "%Y%m%dT%H%M%S")
+        if utc:
+            moment = moment.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        return moment
+    except ValueError:
+        return None
+
+
+def parse_rule(value:Optional[str], start:datetime) -> tuple[Optional[Frequency], Optional[int], bool]:
+    """
+    Maps an RRULE to a Frequency and times
+
+    Parameters:
+        value (str): the RRULE value, e.g. "FREQ=WEEKLY;COUNT=10"
+        start (datetime): date of the first occurrence (to count occurrences until UNTIL)
+
+    Returns:
+        tuple: (frequency, times, simplified), frequency and times are None if there's no usable rule,
+               simplified is True if the rule had parts that can't be stored (only its first occurrence is kept)
+    """
+    if not value:
+        return None, None, False
+
+    parts = dict(part.partition("=")[::2] for part in value.upper().split(";") if part)
+    frequency = RRULE_FREQUENCIES.get(parts.get("FREQ"))
+    if frequency is None or set(parts) - SUPPORTED_RULE_PARTS or parts.get("INTERVAL", "1") != "1":
+        return None, None, True
+
+    if "COUNT" in parts:
+        if not parts["COUNT"].isdigit() or int(parts["COUNT"]) == 0: # invalid, and 0 would mean Recurrence.FOREVER
+            return None, None, True
+        times = int(parts["COUNT"])
+    elif "UNTIL" in parts:
+        until = parse_date(parts["UNTIL"])
+        if until is None:
+            return None, None, True
+        times = frequency.index_on_or_after(until + timedelta(microseconds=1), start) # occurrences up to UNTIL
+        if times <= 1: # DTSTART is always an occurrence, even with UNTIL before it (0 would mean Recurrence.FOREVER)
+            return None, None, False
+    else:
+        times = Recurrence.FOREVER
+
+    if times == 1:
+        return None, None, False
+    return frequency, times, False
+
+
+def parse_priority(value:Optional[str]) -> Optional[Priority]:
+    """Maps an iCalendar PRIORITY (1 highest to 9 lowest, 0 undefined) to a Priority"""
+    try:
+        level = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    if level == 0:
+        return None
+    if level <= 4:
+        return Priority.HIGH
+    if level == 5:
+        return Priority.MEDIUM
+    return Priority.LOW
+
+
+class IcsImporter:
+    """
+    Imports .ics files into a database
+
+    Attributes:
+        db (Database): database to import into
+        chunk_size (int): components written per transaction
+    """
+    def __init__(self, db:Database, chunk_size:int=CHUNK_SIZE):
+        """
+        Initialize importer
+
+        Parameters:
+            db (Database): database to import into
+            chunk_size (int): components written per transaction, CHUNK_SIZE by default
+        """
+        self.db = db
+        self.chunk_size = chunk_size
+
+
+    def import_file(self, path:str, on_progress:Optional[Callable[[ImportStats], None]]=None) -> ImportStats:
+        """
+        Imports every event and task in an .ics file
+
+        Parameters:
+            path (str): path of the .ics file
+            on_progress (function): called with the stats after every chunk (on the importing thread)
+
+        Returns:
+            ImportStats: totals and throughput
+        """
+        stats = ImportStats(os.path.getsize(path))
+        start = perf_counter()
+
+        with open(path, "rb") as stream, self.db.get_session() as session:
+            with session.begin():
+                category_ids = dict(session.execute(select(Category.name, Category.id)).all())
+
+            chunk = []
+            for component, bytes_read in components(stream):
+                chunk.append(component)
+                if len(chunk) >= self.chunk_size:
+                    self._write_chunk(session, chunk, category_ids, stats)
+                    chunk = []
+                    self._report(stats, bytes_read, start, on_progress)
+
+            self._write_chunk(session, chunk, category_ids, stats)
+            self._report(stats, stats.total_bytes, start, on_progress)
+
+        return stats
+
+
+    def _report(self, stats:ImportStats, bytes_read:int, start:float, on_progress):
+        """Updates progress and calls on_progress"""
+        stats.bytes_read = bytes_read
+        stats.seconds = perf_counter() - start
+        if on_progress is not None:
+            on_progress(stats)
+
+
+    def _write_chunk(self, session, chunk:list[IcsComponent], category_ids:dict, stats:ImportStats):
+        """Writes a chunk of components in one transaction (one executemany per table)"""
+        events, tasks, rules = [], [], [] # rules: (row, frequency, times, virtual, kind)
+
+        for component in chunk:
+            if component.value("RECURRENCE-ID") is not None: # a changed occurrence of a series
+                stats.skipped += 1
+                continue
+
+            if component.kind == "VEVENT":
+                row = self._event_row(component)
+                date = row["start_time"]
+            else:
+                row = self._task_row(component)
+                date = row["due_date"]
+
+            if component.kind == "VEVENT" and date is None: # events need a start time
+                stats.skipped += 1
+                continue
+
+            frequency, times, simplified = parse_rule(component.value("RRULE"), date) if date else (None, None, False)
+            stats.simplified_rules += simplified
+
+            if component.kind == "VEVENT":
+                stats.events += 1
+                virtual = frequency is not None and (times == Recurrence.FOREVER or times >= VIRTUAL_MIN_TIMES)
+            else:
+                stats.tasks += 1
+                row["category_names"] = split_text_list(component.value("CATEGORIES") or "")
+                virtual = False
+                if times == Recurrence.FOREVER: # only event series can be virtual
+                    frequency, times = None, None
+                    stats.simplified_rules += 1
+
+            if frequency is None:
+                (events if component.kind == "VEVENT" else tasks).append(row)
+            else:
+                rules.append((row, frequency, times, virtual, component.kind))
+
+        with session.begin():
+            # Recurrences of the chunk in one statement, then every occurrence of a stored series
+            if rules:
+                recurrence_ids = session.execute(
+                    insert(Recurrence).returning(Recurrence.id, sort_by_parameter_order=True),
+                    [{"frequency": frequency, "times": times, "virtual": virtual} for row, frequency, times, virtual, kind in rules]
+                ).scalars().all()
+
+                for recurrence_id, (row, frequency, times, virtual, kind) in zip(recurrence_ids, rules):
+                    date_key = "start_time" if kind == "VEVENT" else "due_date"
+                    dates = [row[date_key]] if virtual else series_dates(frequency, row[date_key], times)
+                    rows = events if kind == "VEVENT" else tasks
+                    rows.extend({**row, date_key: date, "recurrence_id": recurrence_id} for date in dates)
+
+            # Categories by name, adding the ones that don't exist yet
+            for task in tasks:
+                for name in task["category_names"]:
+                    if name not in category_ids:
+                        category_ids[name] = session.execute(insert(Category).returning(Category.id), [{"name": name}]).scalar_one()
+                task["category_ids"] = [category_ids[name] for name in task.pop("category_names")]
+
+            insert_event_rows(session, events)
+            insert_task_rows(session, tasks)
+
+        stats.rows += len(events) + len(tasks)
+
+
+    def _event_row(self, component:IcsComponent) -> dict:
+        """Returns insert_event_rows values of a VEVENT"""
+        parameters, value = component.properties.get("DTSTART", ({}, None))
+        return {
+            "name": unescape(component.value("SUMMARY")) or "(No title)",
+            "notes": unescape(component.value("DESCRIPTION")),
+            "start_time": parse_date(value, parameters),
+            "place": unescape(component.value("LOCATION")),
+        }
+
+
+    def _task_row(self, component:IcsComponent) -> dict:
+        """Returns insert_task_rows values of a VTODO (without category ids)"""
+        parameters, value = component.properties.get("DUE", ({}, None))
+        return {
+            "name": unescape(component.value("SUMMARY")) or "(No title)",
+            "notes": unescape(component.value("DESCRIPTION")),
+            "due_date": parse_date(value, parameters),
+            "priority": parse_priority(component.value("PRIORITY")),
+            "complete": (component.value("STATUS") or "").upper() == "COMPLETED" or component.value("COMPLETED") is not None,
+        }
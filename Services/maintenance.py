@@ -0,0 +1,299 @@
+"""
+    Name: Maintenance
+    Description: Removes rows nothing refers to anymore, returns free database pages to the file system in small steps,
+                 and reports database health (run with "python -m Services.maintenance [--test] [--analyze] [--collect]")
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added the health report (optimize/ANALYZE, quick check, table/index sizes, fragmentation, step timings)
+            and the command line entry point
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - The database must be migrated (incremental auto-vacuum enabled) for pages to be reclaimed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - ValueError if an unknown command line option is given
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - Deletes orphaned rows, shrinks the database file, updates the query planner's statistics (sqlite_stat1)
+    Invariants:
+        - Only rows that no item or category refers to are deleted, never items
+        - Each vacuum step frees at most VACUUM_PAGES pages, so it never holds the write lock for long
+    Known Faults:
+        - SQLite doesn't count how often an index is used, index stats show how selective each index is instead
+        - Page counts and fragmentation need SQLite's dbstat table (compiled into Python's sqlite3), they are None without it
+        - Events left behind by edits made before series were reconciled still have their recurrence,
+          they can't be told apart from events the user wants, so they (and their recurrence) are kept
+"""
+
+
+# Imports
+import sys
+from time import perf_counter
+from sqlalchemy import Connection, delete, exists
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from database import Database, get_database # for typing, and the app's database for the command line
+from Models import Event_, Task, Category, Recurrence # models
+from Models.item import Item # Superclass model
+from Models.itemCategory import item_category_association # association table
+
+
+# Most free pages returned to the file system per vacuum step (4 MB with 4 KiB pages)
+VACUUM_PAGES = 1024
+
+# Tables
+item_table = Item.__table__
+event_table = Event_.__table__
+task_table = Task.__table__
+category_table = Category.__table__
+recurrence_table = Recurrence.__table__
+
+
+def collect_garbage(session:Session) -> dict:
+    """
+    Deletes recurrences without items, category links to missing items or categories,
+    and Event_/Task rows without an Item row (the caller commits)
+
+    Parameters:
+        session (Session): session to use
+
+    Returns:
+        dict: number of rows deleted, by kind ("recurrences", "category_links", "events", "tasks")
+    """
+    links = item_category_association.c
+    statements = {
+        "recurrences": delete(recurrence_table).where(
+            ~exists().where(item_table.c.recurrence_id == recurrence_table.c.id)
+        ),
+        "category_links": delete(item_category_association).where(
+            ~exists().where(item_table.c.id == links.item_id) | ~exists().where(category_table.c.id == links.category_id)
+        ),
+        "events": delete(event_table).where(~exists().where(item_table.c.id == event_table.c.id)),
+        "tasks": delete(task_table).where(~exists().where(item_table.c.id == task_table.c.id)),
+    }
+    return {kind: session.execute(statement).rowcount for kind, statement in statements.items()}
+
+
+def free_bytes(connection:Connection) -> int:
+    """Returns the size of the database's free pages in bytes (what vacuuming can reclaim)"""
+    page_size = connection.exec_driver_sql("PRAGMA page_size").scalar()
+    return connection.exec_driver_sql("PRAGMA freelist_count").scalar() * page_size
+
+
+def incremental_vacuum(db:Database, pages:int=VACUUM_PAGES) -> int:
+    """
+    Returns up to pages free pages to the file system
+
+    Parameters:
+        db (Database): database to shrink
+        pages (int): most pages to free, VACUUM_PAGES by default
+
+    Returns:
+        int: number of bytes reclaimed (0 if incremental auto-vacuum isn't enabled)
+    """
+    with db.engine.connect() as connection:
+        before = free_bytes(connection)
+        # frees one page per step, sqlite3's execute() only steps once but executescript() runs it to completion
+        connection.connection.driver_connection.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+        after = free_bytes(connection)
+    return before - after
+
+
+def run_maintenance(db:Database, pages:int=VACUUM_PAGES) -> dict:
+    """
+    Collects garbage in one transaction, then reclaims up to pages free pages
+
+    Parameters:
+        db (Database): database to maintain
+        pages (int): most pages to free, VACUUM_PAGES by default
+
+    Returns:
+        dict: collect_garbage's counts, plus "bytes_reclaimed" and "bytes_free" (left to reclaim)
+    """
+    with db.get_session() as session, session.begin():
+        report = collect_garbage(session)
+
+    report["bytes_reclaimed"] = incremental_vacuum(db, pages)
+    with db.engine.connect() as connection:
+        report["bytes_free"] = free_bytes(connection)
+    return report
+
+
+def format_report(report:dict) -> str:
+    """Returns a one line summary of run_maintenance's report"""
+    removed = ", ".join(f"{count} {kind.replace('_', ' ')}" for kind, count in report.items() if not kind.startswith("bytes"))
+    return f"Maintenance: removed {removed}; reclaimed {report['bytes_reclaimed']} bytes, {report['bytes_free']} bytes still free"
+
+
+def optimize(db:Database, analyze:bool=False):
+    """Updates the query planner's statistics, only where they're stale (PRAGMA optimize) or for every index (ANALYZE)"""
+    with db.engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE" if analyze else "PRAGMA optimize")
+        connection.commit()
+
+
+def quick_check(db:Database) -> list[str]:
+    """Returns the problems PRAGMA quick_check finds (["ok"] if there are none)"""
+    with db.engine.connect() as connection:
+        return list(connection.exec_driver_sql("PRAGMA quick_check").scalars())
+
+
+# Pages of each table and index, how full they are, and how often the next page isn't the following one in the file
+PAGE_STATS_SQL = """
+    SELECT name, count(*), sum(pgsize), sum(unused),
+           sum(CASE WHEN previous IS NOT NULL AND pageno != previous + 1 THEN 1 ELSE 0 END)
+    FROM (SELECT name, pageno, pgsize, unused, lag(pageno) OVER (PARTITION BY name ORDER BY path) AS previous FROM dbstat)
+    GROUP BY name
+"""
+
+
+def _page_stats(connection:Connection) -> dict:
+    """Returns {name: (pages, unused fraction, fragmentation)} for every table and index ({} without dbstat)"""
+    try:
+        rows = connection.exec_driver_sql(PAGE_STATS_SQL).all()
+    except OperationalError: # SQLite compiled without dbstat
+        return {}
+
+    return {
+        name: (pages, unused / size if size else 0.0, jumps / (pages - 1) if pages > 1 else 0.0)
+        for name, pages, size, unused, jumps in rows
+    }
+
+
+def table_stats(db:Database) -> list[dict]:
+    """
+    Returns row count, page count, unused fraction of its pages, and fragmentation
+    (fraction of pages not directly after the previous one) of every table
+
+    Returns:
+        list[dict]: one dict per table, keys "name", "rows", "pages", "unused", "fragmentation"
+    """
+    with db.engine.connect() as connection:
+        names = connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        ).scalars().all()
+        pages = _page_stats(connection)
+
+        stats = []
+        for name in names:
+            pages_count, unused, fragmentation = pages.get(name, (None, None, None))
+            stats.append({
+                "name": name,
+                "rows": connection.exec_driver_sql(f'SELECT count(*) FROM "{name}"').scalar(),
+                "pages": pages_count,
+                "unused": unused,
+                "fragmentation": fragmentation,
+            })
+    return stats
+
+
+def index_stats(db:Database) -> list[dict]:
+    """
+    Returns the page count and planner statistics (from sqlite_stat1, "rows, rows per key ...") of every index
+
+    Returns:
+        list[dict]: one dict per index, keys "name", "table", "pages", "stat" (None before ANALYZE)
+    """
+    with db.engine.connect() as connection:
+        indexes = connection.exec_driver_sql(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' ORDER BY tbl_name, name"
+        ).all()
+        pages = _page_stats(connection)
+
+        has_stats = connection.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").first() is not None
+        planner_stats = dict(connection.exec_driver_sql("SELECT idx, stat FROM sqlite_stat1").all()) if has_stats else {}
+
+    return [
+        {"name": name, "table": table, "pages": pages.get(name, (None,))[0], "stat": planner_stats.get(name)}
+        for name, table in indexes
+    ]
+
+
+def health_report(db:Database, analyze:bool=False, collect:bool=False) -> dict:
+    """
+    Optimizes, checks, and measures the database, timing each step
+
+    Parameters:
+        db (Database): database to check
+        analyze (bool): whether to ANALYZE every index instead of PRAGMA optimize, False by default
+        collect (bool): whether to also collect garbage and run a vacuum step first, False by default
+
+    Returns:
+        dict: "steps" ({step: seconds}), "integrity", "tables", "indexes", "page_size", "pages", "free_pages",
+              and "maintenance" (run_maintenance's report, if collect)
+    """
+    report = {"steps": {}}
+
+    def step(name, function, *args):
+        start = perf_counter()
+        result = function(*args)
+        report["steps"][name] = perf_counter() - start
+        return result
+
+    if collect:
+        report["maintenance"] = step("collect and vacuum", run_maintenance, db)
+    step("analyze" if analyze else "optimize", optimize, db, analyze)
+    report["integrity"] = step("quick check", quick_check, db)
+    report["tables"] = step("table stats", table_stats, db)
+    report["indexes"] = step("index stats", index_stats, db)
+
+    with db.engine.connect() as connection:
+        report["page_size"] = connection.exec_driver_sql("PRAGMA page_size").scalar()
+        report["pages"] = connection.exec_driver_sql("PRAGMA page_count").scalar()
+        report["free_pages"] = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+    return report
+
+
+def _percent(fraction) -> str:
+    """Formats a fraction as a percentage ("-" if unknown)"""
+    return "-" if fraction is None else f"{fraction:.0%}"
+
+
+def format_health(report:dict) -> str:
+    """Returns health_report's report as printable lines"""
+    size = report["pages"] * report["page_size"]
+    free = report["free_pages"] / report["pages"] if report["pages"] else 0.0
+    lines = [
+        f"Integrity: {', '.join(report['integrity'])}",
+        f"Size: {size} bytes, {report['pages']} pages of {report['page_size']} bytes, {report['free_pages']} free ({_percent(free)})",
+    ]
+    if "maintenance" in report:
+        lines.append(format_report(report["maintenance"]))
+
+    lines.append("Tables (rows, pages, unused space, fragmentation):")
+    for table in report["tables"]:
+        pages = "-" if table["pages"] is None else table["pages"]
+        lines.append(f"  {table['name']}: {table['rows']} rows, {pages} pages, {_percent(table['unused'])} unused, {_percent(table['fragmentation'])} fragmented")
+
+    lines.append("Indexes (pages, planner stats: rows, rows per key):")
+    for index in report["indexes"]:
+        pages = "-" if index["pages"] is None else index["pages"]
+        lines.append(f"  {index['table']}.{index['name']}: {pages} pages, {index['stat'] or 'not analyzed'}")
+
+    lines.append("Steps:")
+    for name, seconds in report["steps"].items():
+        lines.append(f"  {name}: {seconds * 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+# Command line options
+OPTIONS = {
+    "--test": "use the test database instead of busybee.db",
+    "--analyze": "ANALYZE every index instead of PRAGMA optimize",
+    "--collect": "collect garbage and run a vacuum step first",
+}
+
+
+if __name__ == "__main__":
+    options = sys.argv[1:]
+    for option in options:
+        if option not in OPTIONS:
+            raise ValueError(f"Unknown option: {option} (choose from {', '.join(OPTIONS)})")
+
+    db = get_database(test="--test" in options)
+    print(format_health(health_report(db, analyze="--analyze" in options, collect="--collect" in options)))
@@ -0,0 +1,214 @@
+"""
+    Name: Queries
+    Description: Statements for the hot read paths (calendar month, daily view, to-do list), built once with bound parameters
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added keyset page statements for the to-do list (task ids after a key, in index order, and the records of given ids)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Event_, Task, Category, and Recurrence models must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - Each statement is built once at import and reused, so SQLAlchemy's compiled cache key is computed once
+          and every execution is a cache hit (values are only ever passed as parameters)
+        - Event range statements compare the stored start_time directly, so the index serves them
+        - Task page statements filter and order by what an index holds ((due_date, id), (priority, due_date, id), or
+          (category_id, item_id)), so a page costs the same however many tasks come before it
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+from sqlalchemy import select, Select, bindparam, case, exists, func, or_, tuple_
+from Models import Event_, Task, Category, Recurrence # models
+from Models.databaseEnums import Priority # for Task.priority
+from Models.itemCategory import item_category_association # to aggregate category names
+
+
+# Separates the aggregated category names (a control character, so names can contain commas)
+CATEGORY_SEPARATOR = "\x1f"
+
+# Task sort options, anything else sorts by due date
+SORT_OPTIONS = ("Priority", "Due Date", "Category")
+
+# Key before every stored due date (and id), to start a page of dated tasks from the beginning
+FIRST_DUE_DATE_KEY = {"due_date": datetime.min, "id": 0}
+
+# Tables (page statements use them directly, so they don't join Item)
+task_table = Task.__table__
+category_table = Category.__table__
+
+
+def build_event_records_between() -> Select:
+    """Returns statement selecting EventRecord columns of stored events with :start <= start_time < :end, ordered by start_time"""
+    return (
+        select(Event_.id, Event_.name, Event_.start_time, Event_.place)
+        .outerjoin(Recurrence, Event_.recurrence_id == Recurrence.id)
+        .where(
+            Event_.start_time >= bindparam("start"),
+            Event_.start_time < bindparam("end"),
+            or_(Event_.recurrence_id.is_(None), Recurrence.virtual.is_(False)) # virtual ones are expanded instead
+        )
+        .order_by(Event_.start_time)
+    )
+
+
+def build_virtual_event_records_before() -> Select:
+    """Returns statement selecting EventRecord columns and the rule of the first events of virtual recurrences that start before :end"""
+    return (
+        select(Event_.id, Event_.name, Event_.start_time, Event_.place, Recurrence.frequency, Recurrence.times)
+        .join(Recurrence, Event_.recurrence_id == Recurrence.id)
+        .where(Recurrence.virtual.is_(True), Event_.start_time < bindparam("end"))
+    )
+
+
+def priority_order():
+    """Returns the sort key for priorities: High (1), Medium (2), Low (3), None (-) as 4"""
+    return case(
+        (Task.priority == Priority.HIGH, 1),
+        (Task.priority == Priority.MEDIUM, 2),
+        (Task.priority == Priority.LOW, 3),
+        else_=4  # For tasks without a priority, assign the lowest order
+    )
+
+
+def build_task_records() -> Select:
+    """Returns statement selecting the TaskRecord columns of every task, one row per task"""
+    return (
+        select(
+            Task.id, Task.name, Task.due_date, Task.priority, Task.complete,
+            func.group_concat(Category.name, CATEGORY_SEPARATOR)
+        )
+        .outerjoin(item_category_association, item_category_association.c.item_id == Task.id)
+        .outerjoin(Category, Category.id == item_category_association.c.category_id)
+        .group_by(Task.id)
+    )
+
+
+def build_task_records_sorted(sort:str) -> Select:
+    """Returns build_task_records sorted by the given option (by category sorts by the task's first category name)"""
+    stmt = build_task_records()
+    if sort == "Priority":
+        return stmt.order_by(priority_order())
+    if sort == "Category":
+        return stmt.order_by(func.coalesce(func.min(Category.name), "").asc())
+    return stmt.order_by(Task.due_date.asc())
+
+
+def build_task_records_with_priority() -> Select:
+    """Returns build_task_records filtered to tasks with priority :priority"""
+    return build_task_records().where(Task.priority == bindparam("priority"))
+
+
+def build_task_records_without_priority() -> Select:
+    """Returns build_task_records filtered to tasks without a priority"""
+    return build_task_records().where(Task.priority.is_(None))
+
+
+def build_task_records_with_ids() -> Select:
+    """Returns build_task_records filtered to the tasks with ids in :ids (unordered)"""
+    return build_task_records().where(Task.id.in_(bindparam("ids", expanding=True)))
+
+
+def build_task_page_ids(priority:str, dated:bool) -> Select:
+    """
+    Returns statement selecting (id, due_date) of up to :size tasks after a key, in the due date index's order
+
+    Parameters:
+        priority (str): "any", "value" (tasks with priority :priority), or "none" (tasks without one)
+        dated (bool): whether to select tasks with a due date (after the key (:due_date, :id), ordered by due date then id)
+                      or without one (after :id, ordered by id)
+
+    Returns:
+        Select: the statement
+    """
+    stmt = select(task_table.c.id, task_table.c.due_date)
+    if priority == "value":
+        stmt = stmt.where(task_table.c.priority == bindparam("priority"))
+    elif priority == "none":
+        stmt = stmt.where(task_table.c.priority.is_(None))
+
+    if dated:
+        # a row value comparison, which SQLite answers with a range scan of the index
+        key = tuple_(bindparam("due_date", type_=task_table.c.due_date.type), bindparam("id"))
+        stmt = stmt.where(tuple_(task_table.c.due_date, task_table.c.id) > key).order_by(task_table.c.due_date, task_table.c.id)
+    else:
+        stmt = stmt.where(task_table.c.due_date.is_(None), task_table.c.id > bindparam("id")).order_by(task_table.c.id)
+    return stmt.limit(bindparam("size"))
+
+
+def build_uncategorized_task_page_ids() -> Select:
+    """Returns statement selecting ids of up to :size tasks without categories after :id, ordered by id"""
+    links = item_category_association.c
+    return (
+        select(task_table.c.id)
+        .where(task_table.c.id > bindparam("id"), ~exists().where(links.item_id == task_table.c.id))
+        .order_by(task_table.c.id)
+        .limit(bindparam("size"))
+    )
+
+
+def build_category_task_page_ids() -> Select:
+    """
+    Returns statement selecting ids of up to :size tasks after :id, ordered by id, whose first category
+    (by name, then id) is category :category_id named :name
+    """
+    links = item_category_association.c
+    other_link = item_category_association.alias("other_link")
+    other_category = category_table.alias("other_category")
+    earlier_category = (
+        exists()
+        .where(
+            other_link.c.item_id == links.item_id,
+            other_category.c.id == other_link.c.category_id,
+            tuple_(other_category.c.name, other_category.c.id) < tuple_(bindparam("name"), bindparam("category_id"))
+        )
+    )
+    return (
+        select(links.item_id)
+        .join(task_table, task_table.c.id == links.item_id)
+        .where(links.category_id == bindparam("category_id"), links.item_id > bindparam("id"), ~earlier_category)
+        .order_by(links.item_id)
+        .limit(bindparam("size"))
+    )
+
+
+def build_category_after() -> Select:
+    """Returns statement selecting (id, name) of the first category after (:name, :category_id), ordered by name then id"""
+    return (
+        select(category_table.c.id, category_table.c.name)
+        .where(tuple_(category_table.c.name, category_table.c.id) > tuple_(bindparam("name"), bindparam("category_id")))
+        .order_by(category_table.c.name, category_table.c.id)
+        .limit(1)
+    )
+
+
+# Prebuilt statements
+EVENT_RECORDS_BETWEEN = build_event_records_between() # parameters: start, end
+VIRTUAL_EVENT_RECORDS_BEFORE = build_virtual_event_records_before() # parameters: end
+TASK_RECORDS_SORTED = {sort: build_task_records_sorted(sort) for sort in SORT_OPTIONS}
+TASK_RECORDS_WITH_PRIORITY = build_task_records_with_priority() # parameters: priority
+TASK_RECORDS_WITHOUT_PRIORITY = build_task_records_without_priority()
+TASK_RECORDS_WITH_IDS = build_task_records_with_ids() # parameters: ids
+TASK_PAGE_IDS = { # parameters: size, id, and due_date (if dated), priority (if "value")
+    (priority, dated): build_task_page_ids(priority, dated) for priority in ("any", "value", "none") for dated in (False, True)
+}
+UNCATEGORIZED_TASK_PAGE_IDS = build_uncategorized_task_page_ids() # parameters: size, id
+CATEGORY_TASK_PAGE_IDS = build_category_task_page_ids() # parameters: size, id, category_id, name
+CATEGORY_AFTER = build_category_after() # parameters: name, category_id
+
+
+def task_records_sorted(sort:str) -> Select:
+    """Returns the prebuilt task records statement for a sort option (by due date if it isn't one)"""
+    return TASK_RECORDS_SORTED.get(sort, TASK_RECORDS_SORTED["Due Date"])
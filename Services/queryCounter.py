@@ -0,0 +1,68 @@
+"""
+    Name: Query Counter
+    Description: Counts the SQL statements an engine runs, to catch N+1 query patterns
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - The listener is removed when the with block ends
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - Only statements run inside the with block are counted (on any thread using the engine)
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from sqlalchemy import Engine, event
+
+
+class QueryCounter:
+    """
+    Context manager counting the statements an engine runs, e.g.
+        with QueryCounter(db.engine) as counter:
+            ...
+        print(counter.count)
+
+    Attributes:
+        engine (Engine): engine to listen to
+        statements (list[str]): SQL of each statement run, in order
+    """
+    def __init__(self, engine:Engine):
+        """
+        Initialize counter
+
+        Parameters:
+            engine (Engine): engine to listen to
+        """
+        self.engine = engine
+        self.statements: list[str] = []
+
+
+    @property
+    def count(self) -> int:
+        """Number of statements run"""
+        return len(self.statements)
+
+
+    def _record(self, connection, cursor, statement, parameters, context, executemany):
+        """Saves a statement (before_cursor_execute listener)"""
+        self.statements.append(statement)
+
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
@@ -0,0 +1,163 @@
+"""
+    Name: Recurrence Expansion
+    Description: Generators that yield the occurrences of a recurrence rule, optionally only those inside a date range
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            occurrences_between jumps straight to the first occurrence in range (Frequency.index_on_or_after)
+        - 10/17/2026 BusyBee Team
+            Added expand_dates, vectorized with NumPy datetime64 when NumPy is installed
+        - 10/17/2026 BusyBee Team
+            expand_dates raises ValueError for occurrences past datetime.max with or without NumPy
+            (NumPy's returned ints instead of datetimes)
+
+    Preconditions:
+        - Frequency enum must be implemented
+        - NumPy is optional (expand_dates falls back to pure Python without it)
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - ValueError if expand_dates would go past datetime.max (year 9999)
+    Side Effects:
+        - None
+    Invariants:
+        - Occurrences are yielded in increasing order and match the dates Frequency.get_next_date produces
+        - Occurrence 0 is the first item's own date
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+from typing import Iterator
+from Models.databaseEnums import Frequency # for recurrence frequency
+from Models.recurrence import Recurrence # for Recurrence.FOREVER
+
+# NumPy is optional, only used to vectorize expand_dates
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def occurrences(frequency:Frequency, first:datetime, times:int=Recurrence.FOREVER) -> Iterator[datetime]:
+    """
+    Yields every occurrence of a rule, in order
+
+    Parameters:
+        frequency (Frequency): how often the rule repeats
+        first (datetime): date of the first occurrence
+        times (int): number of occurrences, including the first (Recurrence.FOREVER for no end)
+
+    Yields:
+        datetime: the next occurrence
+    """
+    current = first
+    count = 0
+    while times == Recurrence.FOREVER or count < times:
+        yield current
+        count += 1
+
+        # a rule that doesn't repeat only has its first occurrence
+        if Frequency.is_no_repeat(frequency):
+            return
+        current = frequency.get_next_date(current, first)
+
+
+def occurrences_between(frequency:Frequency, first:datetime, times:int, start:datetime, end:datetime) -> Iterator[datetime]:
+    """
+    Yields the occurrences of a rule in the half-open range [start, end), in order
+
+    Parameters:
+        frequency (Frequency): how often the rule repeats
+        first (datetime): date of the first occurrence
+        times (int): number of occurrences, including the first (Recurrence.FOREVER for no end)
+        start (datetime): inclusive lower bound
+        end (datetime): exclusive upper bound
+
+    Yields:
+        datetime: the next occurrence inside the range
+    """
+    # skip the occurrences before the range without computing them
+    k = frequency.index_on_or_after(start, first)
+    while times == Recurrence.FOREVER or k < times:
+        if Frequency.is_no_repeat(frequency) and k > 0:
+            return
+        
+        occurrence = frequency.nth(k, first)
+        if occurrence >= end:
+            return
+        yield occurrence
+        k += 1
+
+
+def _nth_in_range(frequency:Frequency, k:int, first:datetime) -> datetime:
+    """Frequency.nth, raising ValueError (not OverflowError, like daily and weekly rules do) past datetime.max"""
+    try:
+        return frequency.nth(k, first)
+    except OverflowError as error:
+        raise ValueError(f"Occurrence {k} is out of range: {error}") from error
+
+
+def _expand_dates_python(frequency:Frequency, first:datetime, times:int) -> list[datetime]:
+    """expand_dates without NumPy"""
+    return [_nth_in_range(frequency, k, first) for k in range(times)]
+
+
+def _expand_dates_numpy(frequency:Frequency, first:datetime, times:int) -> list[datetime]:
+    """expand_dates with NumPy datetime64 arrays"""
+    k = np.arange(times)
+    start = np.datetime64(first, "us")
+
+    if frequency == Frequency.DAILY or frequency == Frequency.WEEKLY:
+        step = np.timedelta64(1 if frequency == Frequency.DAILY else 7, "D")
+        dates = start + k * step
+
+    else:
+        # month of each occurrence, then the day clamped to that month's length
+        months_apart = k if frequency == Frequency.MONTHLY else k * 12
+        months = np.datetime64(first, "M") + months_apart
+        month_starts = months.astype("datetime64[D]")
+        month_lengths = ((months + 1).astype("datetime64[D]") - month_starts).astype(int)
+
+        days = np.full(times, first.day)
+        if frequency == Frequency.YEARLY and first.month == 2 and first.day == 29:
+            days[1:] = 28 # Feb 29 becomes Feb 28 after the first year
+        days = np.minimum(days, month_lengths)
+
+        time_of_day = start - np.datetime64(first, "D")
+        dates = month_starts + (days - 1).astype("timedelta64[D]") + time_of_day
+
+    # past datetime.max tolist() returns ints, raise the same error as the pure Python version instead
+    if dates[-1] > np.datetime64(datetime.max, "us"):
+        _nth_in_range(frequency, int(np.argmax(dates > np.datetime64(datetime.max, "us"))), first) # the first one past it
+    return dates.astype("datetime64[us]").tolist()
+
+
+def expand_dates(frequency:Frequency, first:datetime, times:int) -> list[datetime]:
+    """
+    Returns all occurrences of a finite rule at once (the same dates Frequency.get_next_date produces)
+
+    Parameters:
+        frequency (Frequency): how often the rule repeats
+        first (datetime): date of the first occurrence
+        times (int): number of occurrences, including the first
+
+    Returns:
+        list[datetime]: the occurrences, in order
+
+    Raises:
+        ValueError: if an occurrence would be past datetime.max
+    """
+    if times <= 0:
+        return []
+    if Frequency.is_no_repeat(frequency):
+        return [first]
+    
+    if np is not None:
+        return _expand_dates_numpy(frequency, first, times)
+    
+    return _expand_dates_python(frequency, first, times)
@@ -0,0 +1,449 @@
+"""
+    Name: Series Operations
+    Description: Set-based delete and update of "this occurrence", "this and following", or "entire series" of an item's recurrence
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added reconcile_series, applying a changed recurrence rule with the fewest row changes
+        - 10/17/2026 BusyBee Team
+            delete_series takes the picked occurrence of a virtual series, "this and following" ends the series before it
+        - 10/17/2026 BusyBee Team
+            reconcile_series gives the edited item its new date before matching the others, so it's never deleted
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Item, Event_, Task, Category, Recurrence models and the Item-Category association must be implemented
+    Postconditions:
+        - Changes are visible to the given session (but not committed, the caller owns the transaction)
+    Errors/Exceptions:
+        - ValueError if the item doesn't exist, an unknown column is given, part of a virtual series is updated,
+          an occurrence of a virtual series other than a deletable first is deleted on its own, or a series is made of an item without a date
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - Inserts/deletes/updates rows in Item, Event_/Task, Item_Category and Recurrence
+    Invariants:
+        - Rows are changed with one DELETE/UPDATE per table (per CHUNK_SIZE items), never loaded as ORM objects
+        - A recurrence without items is deleted along with its last item
+        - Reconciling always keeps the edited item (on its own date if that's still an occurrence, otherwise on the nearest one),
+          and the rows (and ids) of the other occurrences whose dates don't change
+    Known Faults:
+        - A virtual series' occurrences aren't stored, so only its first occurrence can be deleted on its own
+          (the series then starts at its second occurrence, refused if that moves its other dates), "this and following" ends the series before the picked
+          occurrence, and it can only be updated as a whole
+"""
+
+
+# Imports
+from collections import Counter
+from datetime import datetime
+from enum import Enum
+from typing import Iterator, Optional
+from sqlalchemy import bindparam, delete, func, insert, select, true, update
+from sqlalchemy.orm import Session
+from Models import Event_, Task, Category, Recurrence # models
+from Models.item import Item # Superclass model
+from Models.itemCategory import item_category_association # association table
+from Models.databaseEnums import Frequency, ItemType # to find the item's subclass table
+from Services.seriesWriter import VIRTUAL_MIN_TIMES, series_dates, insert_recurrence, insert_events, insert_tasks # to add occurrences
+
+
+# Most ids in one IN (...) list
+CHUNK_SIZE = 500
+
+# Occurrences compared by first_is_deletable (4 years of months covers every month length and leap year)
+SHIFT_CHECKS = 48
+
+# Tables
+item_table = Item.__table__
+event_table = Event_.__table__
+task_table = Task.__table__
+category_table = Category.__table__
+recurrence_table = Recurrence.__table__
+
+
+class SeriesScope(Enum):
+    """Which items of a series an operation applies to"""
+    THIS = 0 # only this occurrence
+    FOLLOWING = 1 # this occurrence and the ones after it
+    ALL = 2 # the entire series
+
+
+    @staticmethod
+    def scope_options() -> list[str]:
+        """Returns a list of stringified scope options"""
+        return ["This occurrence", "This and following", "Entire series"]
+
+
+    @classmethod
+    def str2enum(cls, scope:str) -> "SeriesScope":
+        """Returns enum based on input string"""
+        str_list = cls.scope_options()
+
+        # check to make sure its a valid scope
+        if scope not in str_list:
+            raise ValueError("Invalid SeriesScope value")
+
+        return SeriesScope(str_list.index(scope))
+
+
+class SeriesItem:
+    """
+    What an operation needs to know about the item it starts from
+
+    Attributes:
+        id (int): item id
+        type (ItemType): EVENT or TASK
+        date (datetime): event start time or task due date (optional)
+        recurrence_id (int): id of the item's recurrence (None if it isn't part of a series)
+        virtual (bool): whether the recurrence is virtual
+        frequency (Frequency): recurrence frequency (None if it isn't part of a series)
+        times (int): recurrence times (None if it isn't part of a series)
+    """
+    __slots__ = ("id", "type", "date", "recurrence_id", "virtual", "frequency", "times")
+
+    def __init__(self, id, type, date, recurrence_id, virtual, frequency, times):
+        self.id = id
+        self.type = type
+        self.date = date
+        self.recurrence_id = recurrence_id
+        self.virtual = bool(virtual)
+        self.frequency = frequency
+        self.times = times
+
+
+    @property
+    def table(self):
+        """The item's subclass table (Event_ or Task)"""
+        return event_table if self.type == ItemType.EVENT else task_table
+
+
+    @property
+    def date_column(self):
+        """The subclass table's date column (start_time or due_date)"""
+        return event_table.c.start_time if self.type == ItemType.EVENT else task_table.c.due_date
+
+
+def get_series_item(session:Session, item_id:int) -> SeriesItem:
+    """Returns an item's type, date, and recurrence, raises ValueError if it doesn't exist"""
+    row = session.execute(
+        select(
+            item_table.c.id, item_table.c.type,
+            func.coalesce(event_table.c.start_time, task_table.c.due_date),
+            item_table.c.recurrence_id, recurrence_table.c.virtual, recurrence_table.c.frequency, recurrence_table.c.times
+        )
+        .outerjoin(event_table, event_table.c.id == item_table.c.id)
+        .outerjoin(task_table, task_table.c.id == item_table.c.id)
+        .outerjoin(recurrence_table, recurrence_table.c.id == item_table.c.recurrence_id)
+        .where(item_table.c.id == item_id)
+    ).one_or_none()
+
+    if row is None:
+        raise ValueError(f"No item with ID {item_id}")
+
+    id, type, date, recurrence_id, virtual, frequency, times = row
+    return SeriesItem(id, ItemType[type] if isinstance(type, str) else type, date, recurrence_id, virtual, frequency, times)
+
+
+def series_item_ids(session:Session, item:SeriesItem, scope:SeriesScope) -> list[int]:
+    """Returns the ids of the items in scope (just the item if it isn't part of a series)"""
+    if scope == SeriesScope.THIS or item.recurrence_id is None:
+        return [item.id]
+
+    stmt = select(item_table.c.id).where(item_table.c.recurrence_id == item.recurrence_id)
+    if scope == SeriesScope.FOLLOWING and item.date is not None:
+        stmt = stmt.join(item.table, item.table.c.id == item_table.c.id).where(item.date_column >= item.date)
+    return list(session.scalars(stmt))
+
+
+def _chunks(ids:list[int]) -> Iterator[list[int]]:
+    """Yields ids CHUNK_SIZE at a time"""
+    for start in range(0, len(ids), CHUNK_SIZE):
+        yield ids[start:start + CHUNK_SIZE]
+
+
+def _delete_items(session:Session, item:SeriesItem, ids:list[int]):
+    """Deletes the items' category links, subclass rows, and Item rows"""
+    for chunk in _chunks(ids):
+        session.execute(delete(item_category_association).where(item_category_association.c.item_id.in_(chunk)))
+        session.execute(delete(item.table).where(item.table.c.id.in_(chunk)))
+        session.execute(delete(item_table).where(item_table.c.id.in_(chunk)))
+
+
+def first_is_deletable(frequency:Frequency, first:datetime) -> bool:
+    """
+    Returns whether the first occurrence of a virtual series can be deleted on its own, i.e. whether starting the
+    series at its second occurrence keeps the dates of the others (not so for monthly on the 29th-31st or yearly
+    on February 29th, whose later dates are clamped from the first one)
+    """
+    second = frequency.nth(1, first)
+    return all(frequency.nth(k, second) == frequency.nth(k + 1, first) for k in range(1, SHIFT_CHECKS))
+
+
+def _delete_virtual_first(session:Session, item:SeriesItem) -> int:
+    """Deletes the first occurrence of a virtual series, which then starts at its second occurrence"""
+    remaining = None if item.times == Recurrence.FOREVER else item.times - 1
+    if remaining is not None and remaining <= 0:
+        _delete_items(session, item, [item.id])
+        session.execute(delete(recurrence_table).where(recurrence_table.c.id == item.recurrence_id))
+        return 1
+
+    session.execute(update(item.table).where(item.table.c.id == item.id).values({item.date_column.name: item.frequency.nth(1, item.date)}))
+    if remaining is not None:
+        session.execute(update(recurrence_table).where(recurrence_table.c.id == item.recurrence_id).values(times=remaining))
+    return 1
+
+
+def _delete_virtual_following(session:Session, item:SeriesItem, occurrence:datetime) -> int:
+    """Deletes the occurrences of a virtual series from the given one on, so the series ends before it"""
+    index = item.frequency.index_on_or_after(occurrence, item.date) # occurrences kept
+
+    if index == 0: # from the first occurrence on is the entire series
+        _delete_items(session, item, [item.id])
+        session.execute(delete(recurrence_table).where(recurrence_table.c.id == item.recurrence_id))
+    elif item.times != Recurrence.FOREVER and index >= item.times: # the series already ends before it
+        return 0
+    elif index == 1: # only the first occurrence is left, it's no longer a series
+        session.execute(update(item_table).where(item_table.c.id == item.id).values(recurrence_id=None))
+        session.execute(delete(recurrence_table).where(recurrence_table.c.id == item.recurrence_id))
+    else:
+        session.execute(update(recurrence_table).where(recurrence_table.c.id == item.recurrence_id).values(times=index))
+    return 1
+
+
+def delete_series(session:Session, item_id:int, scope:SeriesScope, occurrence:Optional[datetime]=None) -> int:
+    """
+    Deletes an item, the items after it in its series, or its entire series
+
+    Parameters:
+        session (Session): session to use (the caller commits)
+        item_id (int): id of the item the user picked
+        scope (SeriesScope): which items of its series to delete
+        occurrence (datetime): date of the occurrence the user picked, for a virtual series (its occurrences
+            share the first one's id), the first occurrence if not given
+
+    Returns:
+        int: number of items deleted (occurrences of a virtual series count as one)
+
+    Raises:
+        ValueError: if THIS is given for an occurrence of a virtual series other than its first (see first_is_deletable)
+    """
+    item = get_series_item(session, item_id)
+
+    # a virtual series is one stored item, cut down to the occurrences that are kept
+    if item.virtual and scope != SeriesScope.ALL:
+        occurrence = item.date if occurrence is None else occurrence
+        if scope == SeriesScope.FOLLOWING:
+            return _delete_virtual_following(session, item, occurrence)
+        if occurrence != item.date or not first_is_deletable(item.frequency, item.date):
+            raise ValueError("Only the first occurrence of a virtual series can be deleted on its own, unless that moves its other dates")
+        return _delete_virtual_first(session, item)
+
+    ids = series_item_ids(session, item, scope)
+    _delete_items(session, item, ids)
+
+    if item.recurrence_id is not None:
+        remaining = session.scalar(select(func.count()).where(item_table.c.recurrence_id == item.recurrence_id))
+        recurrence = update(recurrence_table).where(recurrence_table.c.id == item.recurrence_id)
+        if remaining == 0:
+            session.execute(delete(recurrence_table).where(recurrence_table.c.id == item.recurrence_id))
+        elif scope == SeriesScope.FOLLOWING:
+            session.execute(recurrence.values(times=remaining)) # the series now ends earlier
+
+    return len(ids)
+
+
+def update_series(session:Session, item_id:int, scope:SeriesScope, category_ids:Optional[list[int]]=None, **values) -> int:
+    """
+    Updates columns of an item, the items after it in its series, or its entire series
+
+    Parameters:
+        session (Session): session to use (the caller commits)
+        item_id (int): id of the item the user picked
+        scope (SeriesScope): which items of its series to update
+        category_ids (list[int]): replaces the items' categories if given
+        **values: new column values, Item columns (e.g. name, notes) or the subclass's (e.g. place, priority)
+
+    Returns:
+        int: number of items updated
+    """
+    item = get_series_item(session, item_id)
+    if item.virtual and scope != SeriesScope.ALL:
+        raise ValueError("A virtual series can only be updated as a whole")
+
+    # split values between the Item table and the subclass table
+    item_values = {column: value for column, value in values.items() if column in item_table.c}
+    subclass_values = {column: value for column, value in values.items() if column not in item_table.c}
+    unknown = [column for column in subclass_values if column not in item.table.c]
+    if unknown:
+        raise ValueError(f"Unknown {item.type.name.lower()} columns: {', '.join(unknown)}")
+
+    ids = series_item_ids(session, item, scope)
+    for chunk in _chunks(ids):
+        if item_values:
+            session.execute(update(item_table).where(item_table.c.id.in_(chunk)).values(item_values))
+        if subclass_values:
+            session.execute(update(item.table).where(item.table.c.id.in_(chunk)).values(subclass_values))
+
+        # replace categories, linking every item to every category in one INSERT ... SELECT
+        if category_ids is not None:
+            session.execute(delete(item_category_association).where(item_category_association.c.item_id.in_(chunk)))
+            if category_ids:
+                session.execute(
+                    insert(item_category_association).from_select(
+                        ["item_id", "category_id"],
+                        select(item_table.c.id, category_table.c.id)
+                        .join(category_table, true()) # cross join
+                        .where(item_table.c.id.in_(chunk), category_table.c.id.in_(category_ids))
+                    )
+                )
+
+    return len(ids)
+
+
+class SeriesChanges:
+    """
+    What reconcile_series changed
+
+    Attributes:
+        inserted (int): number of occurrences added
+        moved (int): number of occurrences whose date changed
+        deleted (int): number of occurrences removed
+        dates (list[datetime]): dates that gained or lost an occurrence
+        virtual (bool): whether the series was or now is virtual (its occurrences can be in any month)
+    """
+    __slots__ = ("inserted", "moved", "deleted", "dates", "virtual")
+
+    def __init__(self):
+        self.inserted = 0
+        self.moved = 0
+        self.deleted = 0
+        self.dates: list[datetime] = []
+        self.virtual = False
+
+    def __repr__(self):
+        """String representation of changes"""
+        return f"SeriesChanges(inserted={self.inserted}, moved={self.moved}, deleted={self.deleted}, virtual={self.virtual})"
+
+
+def _stored_occurrences(session:Session, item:SeriesItem) -> list[tuple[int, Optional[datetime]]]:
+    """Returns (id, date) of every stored item of the item's series, ordered by date (just the item if it isn't part of a series)"""
+    if item.recurrence_id is None:
+        return [(item.id, item.date)]
+
+    return [tuple(row) for row in session.execute(
+        select(item_table.c.id, item.date_column)
+        .join(item.table, item.table.c.id == item_table.c.id)
+        .where(item_table.c.recurrence_id == item.recurrence_id)
+        .order_by(item.date_column, item_table.c.id)
+    )]
+
+
+def _insert_like(session:Session, item:SeriesItem, dates:list[datetime]):
+    """Inserts occurrences on the given dates, copying the item's name, notes, place/priority, and categories"""
+    name, notes = session.execute(select(item_table.c.name, item_table.c.notes).where(item_table.c.id == item.id)).one()
+
+    if item.type == ItemType.EVENT:
+        place = session.scalar(select(event_table.c.place).where(event_table.c.id == item.id))
+        insert_events(session, name, notes, dates, recurrence_id=item.recurrence_id, place=place)
+    else:
+        priority = session.scalar(select(task_table.c.priority).where(task_table.c.id == item.id))
+        category_ids = session.scalars(select(item_category_association.c.category_id).where(item_category_association.c.item_id == item.id)).all()
+        insert_tasks(session, name, notes, dates, priority=priority, category_ids=category_ids, recurrence_id=item.recurrence_id)
+
+
+def reconcile_series(session:Session, item_id:int, frequency:Optional[Frequency], times:Optional[int]) -> SeriesChanges:
+    """
+    Makes an item's series follow a (changed) recurrence rule, starting at the series' earliest stored occurrence.
+    Occurrences already on a new date are kept, the rest are moved to the remaining new dates,
+    and only the difference is inserted or deleted (the item itself is always kept, on the nearest new date if its own isn't one)
+
+    Parameters:
+        session (Session): session to use (the caller commits, and flushes the item's own changes first)
+        item_id (int): id of the item the user edited
+        frequency (Frequency): new frequency (None or NO_REPEAT removes the series, keeping only the item)
+        times (int): new number of occurrences, including the first (Recurrence.FOREVER for a series that never ends)
+
+    Returns:
+        SeriesChanges: what changed
+    """
+    item = get_series_item(session, item_id)
+    changes = SeriesChanges()
+    changes.virtual = item.virtual
+    occurrences = _stored_occurrences(session, item)
+
+    # No series, only the item stays
+    if frequency is None or Frequency.is_no_repeat(frequency) or times is None:
+        others = [(id, date) for id, date in occurrences if id != item.id]
+        _delete_items(session, item, [id for id, date in others])
+        if item.recurrence_id is not None:
+            session.execute(update(item_table).where(item_table.c.id == item.id).values(recurrence_id=None))
+            session.execute(delete(recurrence_table).where(recurrence_table.c.id == item.recurrence_id))
+        changes.deleted = len(others)
+        changes.dates = [date for id, date in others]
+        return changes
+
+    first = min((date for id, date in occurrences if date is not None), default=None)
+    if first is None:
+        raise ValueError("A recurring item needs a date")
+
+    # Long event series only store their first occurrence, like new ones
+    virtual = item.type == ItemType.EVENT and (times == Recurrence.FOREVER or times >= VIRTUAL_MIN_TIMES)
+    changes.virtual = changes.virtual or virtual
+    new_dates = [first] if virtual else series_dates(frequency, first, times)
+
+    # Change the rule in place (or give the item one)
+    if item.recurrence_id is not None:
+        session.execute(
+            update(recurrence_table).where(recurrence_table.c.id == item.recurrence_id)
+            .values(frequency=frequency, times=times, virtual=virtual)
+        )
+    else:
+        item.recurrence_id = insert_recurrence(session, frequency, times, virtual=virtual)
+        session.execute(update(item_table).where(item_table.c.id == item.id).values(recurrence_id=item.recurrence_id))
+
+    # Give the item a new date before any other occurrence (its own if it's still one, otherwise the nearest), so it's never deleted
+    unmatched_dates = Counter(new_dates)
+    item_date = item.date if item.date is not None else first
+    if unmatched_dates[item_date] == 0:
+        item_date = min(new_dates, key=lambda date: abs(date - item_date))
+    unmatched_dates[item_date] -= 1
+    moves = [] if item_date == item.date else [((item.id, item.date), item_date)]
+
+    # Keep the other occurrences already on a new date
+    unmatched = []
+    for id, date in occurrences:
+        if id == item.id:
+            continue
+        if unmatched_dates[date] > 0:
+            unmatched_dates[date] -= 1
+        else:
+            unmatched.append((id, date))
+    missing_dates = sorted(unmatched_dates.elements())
+
+    # Move unmatched occurrences to missing dates
+    others_moved = list(zip(unmatched, missing_dates))
+    moves += others_moved
+    if moves:
+        session.execute(
+            update(item.table).where(item.table.c.id == bindparam("occurrence_id")).values({item.date_column.name: bindparam("new_date")}),
+            [{"occurrence_id": id, "new_date": new_date} for (id, date), new_date in moves]
+        )
+        changes.moved = len(moves)
+        changes.dates += [date for (id, date), new_date in moves if date is not None] + [new_date for (id, date), new_date in moves]
+
+    # Delete extra occurrences, insert the rest
+    extra = unmatched[len(others_moved):]
+    if extra:
+        _delete_items(session, item, [id for id, date in extra])
+        changes.deleted = len(extra)
+        changes.dates += [date for id, date in extra]
+
+    added_dates = missing_dates[len(others_moved):]
+    if added_dates:
+        _insert_like(session, item, added_dates)
+        changes.inserted = len(added_dates)
+        changes.dates += added_dates
+
+    return changes
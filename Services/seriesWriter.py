@@ -0,0 +1,238 @@
+"""
+    Name: Series Writer
+    Description: Bulk inserts for a series of events or tasks (one executemany per table instead of one ORM object per occurrence)
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added virtual recurrences (rule plus first item only)
+        - 10/17/2026 BusyBee Team
+            series_dates uses the vectorized expand_dates
+        - 10/17/2026 BusyBee Team
+            Added insert_event_rows and insert_task_rows, for many different events or tasks at once (e.g. imports)
+        - 10/17/2026 BusyBee Team
+            Added deferred_search_index, to index a bulk insert's items in one statement instead of a trigger per row
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - SQLite 3.35+ (for INSERT ... RETURNING)
+        - Item, Event_, Task, Recurrence models and the Item-Category association must be implemented
+    Postconditions:
+        - The inserted rows are visible to the given session (but not committed, the caller owns the transaction)
+    Errors/Exceptions:
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - Inserts rows into Recurrence, Item, Event_/Task and Item_Category
+        - deferred_search_index drops and recreates the search insert trigger inside the caller's transaction
+    Invariants:
+        - Returned ids are in the same order as the given dates (or rows)
+        - Item ids of one call are consecutive (Item has no AUTOINCREMENT, so a new id is always the highest + 1)
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from Models import Event_, Task, Recurrence # models
+from Models.item import Item # Superclass model
+from Models.itemCategory import item_category_association # association table
+from Models.databaseEnums import Frequency, ItemType, Priority # enums
+from Services.recurrenceExpansion import expand_dates # to compute occurrence dates
+from migrations import SEARCH_TABLE, SEARCH_INSERT_TRIGGER, SEARCH_INSERT_TRIGGER_SQL # full-text index kept in sync with Item
+
+
+# Event series with at least this many occurrences are stored as virtual recurrences
+VIRTUAL_MIN_TIMES = 100
+
+
+def series_dates(frequency:Frequency, start:datetime, times:int) -> list[datetime]:
+    """
+    Returns the dates of every occurrence of a series, including the first
+
+    Parameters:
+        frequency (Frequency): how often the series repeats
+        start (datetime): date of the first occurrence
+        times (int): how many occurrences, including the first
+
+    Returns:
+        list[datetime]: the occurrence dates, in order
+    """
+    return expand_dates(frequency, start, times)
+
+
+def insert_recurrence(session:Session, frequency:Frequency, times:int, virtual:bool=False) -> int:
+    """Inserts a recurrence and returns its id (for a virtual recurrence only insert its first item)"""
+    return session.execute(
+        insert(Recurrence).returning(Recurrence.id),
+        [{"frequency": frequency, "times": times, "virtual": virtual}]
+    ).scalar_one()
+
+
+def _insert_items(session:Session, item_type:ItemType, name:str, notes:Optional[str], count:int, recurrence_id:Optional[int]) -> list[int]:
+    """Inserts count identical Item rows and returns their ids in insertion order"""
+    rows = [{"type": item_type, "name": name, "notes": notes, "recurrence_id": recurrence_id}] * count
+    return _insert_item_rows(session, rows)
+
+
+def _insert_item_rows(session:Session, rows:list[dict]) -> list[int]:
+    """Inserts Item rows (dicts with type, name, notes, recurrence_id) and returns their ids in insertion order"""
+    item_table = Item.__table__
+
+    # the first insert takes the write lock and gets the highest id + 1, so the ids after it are free until commit
+    # (RETURNING in parameter order would make SQLAlchemy insert one row per statement on SQLite)
+    first_id = session.execute(insert(item_table).returning(item_table.c.id), rows[:1]).scalar_one()
+    ids = list(range(first_id, first_id + len(rows)))
+    if len(rows) > 1:
+        session.execute(insert(item_table), [{**row, "id": id_} for id_, row in zip(ids[1:], rows[1:])])
+    return ids
+
+
+def insert_events(session:Session, name:str, notes:Optional[str], start_times:list[datetime], recurrence_id:Optional[int]=None, place:Optional[str]=None) -> list[int]:
+    """
+    Inserts one event per start time
+
+    Parameters:
+        session (Session): session whose transaction the inserts join
+        name (str): event name
+        notes (str): event notes (optional)
+        start_times (list[datetime]): start time of each event
+        recurrence_id (int): recurrence the events belong to (optional)
+        place (str): event place (optional)
+
+    Returns:
+        list[int]: ids of the new events, in the same order as start_times
+    """
+    if not start_times:
+        return []
+
+    ids = _insert_items(session, ItemType.EVENT, name, notes, len(start_times), recurrence_id)
+    session.execute(
+        insert(Event_.__table__),
+        [{"id": id_, "start_time": start_time, "place": place} for id_, start_time in zip(ids, start_times)]
+    )
+    return ids
+
+
+def insert_tasks(session:Session, name:str, notes:Optional[str], due_dates:list[Optional[datetime]], priority:Optional[Priority]=None, category_ids:list[int]=(), recurrence_id:Optional[int]=None) -> list[int]:
+    """
+    Inserts one task per due date, each linked to the given categories
+
+    Parameters:
+        session (Session): session whose transaction the inserts join
+        name (str): task name
+        notes (str): task notes (optional)
+        due_dates (list[datetime]): due date of each task (items can be None)
+        priority (Priority): task priority (optional)
+        category_ids (list[int]): ids of categories for every task
+        recurrence_id (int): recurrence the tasks belong to (optional)
+
+    Returns:
+        list[int]: ids of the new tasks, in the same order as due_dates
+    """
+    if not due_dates:
+        return []
+
+    ids = _insert_items(session, ItemType.TASK, name, notes, len(due_dates), recurrence_id)
+    session.execute(
+        insert(Task.__table__),
+        [{"id": id_, "due_date": due_date, "priority": priority, "complete": False} for id_, due_date in zip(ids, due_dates)]
+    )
+
+    if category_ids:
+        session.execute(
+            insert(item_category_association),
+            [{"item_id": id_, "category_id": category_id} for id_ in ids for category_id in category_ids]
+        )
+    return ids
+
+
+def insert_event_rows(session:Session, events:list[dict]) -> list[int]:
+    """
+    Inserts events that each have their own values (one executemany per table)
+
+    Parameters:
+        session (Session): session whose transaction the inserts join
+        events (list[dict]): one dict per event, with name, notes, start_time, and optionally place and recurrence_id
+
+    Returns:
+        list[int]: ids of the new events, in the same order as events
+    """
+    if not events:
+        return []
+
+    ids = _insert_item_rows(session, [
+        {"type": ItemType.EVENT, "name": event["name"], "notes": event["notes"], "recurrence_id": event.get("recurrence_id")}
+        for event in events
+    ])
+    session.execute(
+        insert(Event_.__table__),
+        [{"id": id_, "start_time": event["start_time"], "place": event.get("place")} for id_, event in zip(ids, events)]
+    )
+    return ids
+
+
+def insert_task_rows(session:Session, tasks:list[dict]) -> list[int]:
+    """
+    Inserts tasks that each have their own values (one executemany per table)
+
+    Parameters:
+        session (Session): session whose transaction the inserts join
+        tasks (list[dict]): one dict per task, with name, notes, due_date, and optionally priority, complete,
+                            recurrence_id, and category_ids
+
+    Returns:
+        list[int]: ids of the new tasks, in the same order as tasks
+    """
+    if not tasks:
+        return []
+
+    ids = _insert_item_rows(session, [
+        {"type": ItemType.TASK, "name": task["name"], "notes": task["notes"], "recurrence_id": task.get("recurrence_id")}
+        for task in tasks
+    ])
+    session.execute(
+        insert(Task.__table__),
+        [
+            {"id": id_, "due_date": task["due_date"], "priority": task.get("priority"), "complete": task.get("complete", False)}
+            for id_, task in zip(ids, tasks)
+        ]
+    )
+
+    links = [{"item_id": id_, "category_id": category_id} for id_, task in zip(ids, tasks) for category_id in task.get("category_ids", ())]
+    if links:
+        session.execute(insert(item_category_association), links)
+    return ids
+
+
+@contextmanager
+def deferred_search_index(session:Session) -> Iterator[int]:
+    """
+    Indexes the items inserted inside the block for search with one statement at the end,
+    instead of the insert trigger indexing each row (several times faster for thousands of items)
+
+    Parameters:
+        session (Session): session whose transaction the inserts join (it must roll back if the block raises,
+                           which also restores the trigger)
+
+    Yields:
+        int: the first free Item id, items inserted in the block get ids from it on
+    """
+    connection = session.connection()
+    # sqlite3 only begins a transaction before DML, the trigger has to be dropped inside one
+    if not connection.connection.driver_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
+
+    connection.exec_driver_sql(f'DROP TRIGGER IF EXISTS "{SEARCH_INSERT_TRIGGER}"') # takes the write lock
+    first_id = connection.exec_driver_sql('SELECT coalesce(max(id), 0) + 1 FROM "Item"').scalar()
+    yield first_id
+
+    connection.exec_driver_sql(
+        f'INSERT INTO "{SEARCH_TABLE}"(rowid, name, notes) SELECT id, name, notes FROM "Item" WHERE id >= ?', (first_id,)
+    )
+    connection.exec_driver_sql(SEARCH_INSERT_TRIGGER_SQL)
@@ -0,0 +1,173 @@
+"""
+    Name: Task Repository
+    Description: Task list queries for the to-do list, loading every task's categories in the same statement
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - 10/17/2026 BusyBee Team
+            Added TaskRecord read model queries (only the columns the to-do list displays, in one statement)
+        - 10/17/2026 BusyBee Team
+            TaskRecord queries use the prebuilt statements in queries
+        - 10/17/2026 BusyBee Team
+            Added keyset pages of TaskRecords for each sort option (records_page)
+        - 10/17/2026 BusyBee Team
+            Removed the Task entity queries (sorted_tasks, tasks_with_priority), the to-do list only uses TaskRecords
+            (the old path is kept in Services.benchmarks as the baseline)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Task and Category models must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - None
+    Invariants:
+        - TaskRecord queries return one row per task, with its category names aggregated into the row, so a sorted list
+          is one statement and a page one per section it reaches plus one, no matter how many tasks there are
+        - A page is found from its cursor (the key of the last task shown), never by counting the tasks before it
+    Known Faults:
+        - Pages order ties differently than sorted_records: by due date then id within a priority, by id within a first category
+        - Finding uncategorized tasks (or a category's tasks that have an earlier category) skips over the others one by one,
+          so the category sort's pages get slower the fewer of the tasks they're looking through match
+"""
+
+
+# Imports
+from datetime import datetime
+from typing import Optional, Any
+from sqlalchemy.orm import Session
+from Models.databaseEnums import Priority # for Task.priority
+from Services import queries # prebuilt statements
+from Services.queries import CATEGORY_SEPARATOR # shared with the prebuilt statements
+
+
+# Tasks per page of the to-do list
+PAGE_SIZE = 50
+
+# Sections of the due date and priority sorts, in order: (page statement, its parameters)
+# undated tasks come first, like NULLs in SQLite's ascending order
+DUE_DATE_SECTIONS = [(queries.TASK_PAGE_IDS["any", False], {}), (queries.TASK_PAGE_IDS["any", True], {})]
+PRIORITY_SECTIONS = [
+    (queries.TASK_PAGE_IDS["value", dated], {"priority": priority})
+    for priority in (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+    for dated in (False, True)
+] + [(queries.TASK_PAGE_IDS["none", False], {}), (queries.TASK_PAGE_IDS["none", True], {})]
+
+class TaskRecord:
+    """
+    Lightweight, read-only copy of the task columns the to-do list displays
+
+    Attributes:
+        id (int): task id
+        name (str): task name
+        due_date (datetime): task due date (optional)
+        priority (Priority): task priority (optional)
+        complete (bool): whether the task is complete
+        categories (tuple[str, ...]): names of the task's categories
+    """
+    __slots__ = ("id", "name", "due_date", "priority", "complete", "categories")
+
+    def __init__(self, id:int, name:str, due_date:Optional[datetime], priority:Optional[Priority], complete:bool, categories:Optional[str]):
+        self.id = id
+        self.name = name
+        self.due_date = due_date
+        self.priority = priority
+        self.complete = complete
+        self.categories = tuple(categories.split(CATEGORY_SEPARATOR)) if categories else ()
+
+    def __repr__(self):
+        """String representation of task record"""
+        return f"TaskRecord(id={self.id}, name={self.name!r}, due_date={self.due_date}, priority={self.priority}, categories={self.categories})"
+
+
+class TaskRepository:
+    """Builds and runs the to-do list's task queries"""
+
+    @staticmethod
+    def sorted_records(session:Session, sort:str) -> list[TaskRecord]:
+        """Returns TaskRecords for all tasks sorted by the given option"""
+        return [TaskRecord(*row) for row in session.execute(queries.task_records_sorted(sort))]
+
+
+    @staticmethod
+    def records_with_priority(session:Session, priority:Priority|None) -> list[TaskRecord]:
+        """Returns TaskRecords for the tasks with the given priority (None for no priority)"""
+        if priority is None:
+            rows = session.execute(queries.TASK_RECORDS_WITHOUT_PRIORITY)
+        else:
+            rows = session.execute(queries.TASK_RECORDS_WITH_PRIORITY, {"priority": priority})
+        return [TaskRecord(*row) for row in rows]
+
+
+    @staticmethod
+    def records_page(session:Session, sort:str, cursor:Optional[Any]=None, size:int=PAGE_SIZE) -> tuple[list[TaskRecord], Optional[Any]]:
+        """
+        Returns a page of TaskRecords sorted by the given option, starting after the cursor
+
+        Parameters:
+            session (Session): session to use
+            sort (str): "Priority", "Due Date", or "Category" (anything else sorts by due date)
+            cursor: where the page starts, None for the first page, otherwise the cursor returned with the previous page
+            size (int): most records in the page, PAGE_SIZE by default
+
+        Returns:
+            tuple[list[TaskRecord], cursor]: the page, and the cursor of the next one (None if this was the last page)
+        """
+        if sort == "Category":
+            ids, cursor = TaskRepository._category_page_ids(session, cursor, size)
+        else:
+            sections = PRIORITY_SECTIONS if sort == "Priority" else DUE_DATE_SECTIONS
+            ids, cursor = TaskRepository._section_page_ids(session, sections, cursor, size)
+
+        if not ids:
+            return [], None
+        records = {row[0]: TaskRecord(*row) for row in session.execute(queries.TASK_RECORDS_WITH_IDS, {"ids": ids})}
+        return [records[id] for id in ids], cursor
+
+
+    @staticmethod
+    def _section_page_ids(session:Session, sections:list[tuple], cursor:Optional[tuple], size:int) -> tuple[list[int], Optional[tuple]]:
+        """Returns up to size task ids from the sections, starting after the cursor (section index, (due date, id)), and the next cursor"""
+        section, key = cursor if cursor else (0, None)
+        ids = []
+        while section < len(sections):
+            statement, parameters = sections[section]
+            key_parameters = {"due_date": key[0], "id": key[1]} if key else queries.FIRST_DUE_DATE_KEY
+            rows = session.execute(statement, {**parameters, **key_parameters, "size": size - len(ids)}).all()
+            ids.extend(row.id for row in rows)
+            if len(ids) == size:
+                return ids, (section, (rows[-1].due_date, rows[-1].id))
+            section, key = section + 1, None
+        return ids, None
+
+
+    @staticmethod
+    def _category_page_ids(session:Session, cursor:Optional[tuple], size:int) -> tuple[list[int], Optional[tuple]]:
+        """
+        Returns up to size task ids, uncategorized tasks first then by first category, starting after the cursor
+        ((category name, category id, task id), with None name and id for the uncategorized tasks), and the next cursor
+        """
+        name, category_id, task_id = cursor if cursor else (None, None, 0)
+        ids = []
+        if name is None:
+            ids.extend(session.execute(queries.UNCATEGORIZED_TASK_PAGE_IDS, {"id": task_id, "size": size}).scalars())
+            if len(ids) == size:
+                return ids, (None, None, ids[-1])
+            # no name or id comes before ("", 0)
+            category = session.execute(queries.CATEGORY_AFTER, {"name": "", "category_id": 0}).first()
+            task_id = 0
+        else:
+            category = (category_id, name)
+
+        while category:
+            category_id, name = category
+            parameters = {"category_id": category_id, "name": name, "id": task_id, "size": size - len(ids)}
+            ids.extend(session.execute(queries.CATEGORY_TASK_PAGE_IDS, parameters).scalars())
+            if len(ids) == size:
+                return ids, (name, category_id, ids[-1])
+            category = session.execute(queries.CATEGORY_AFTER, {"name": name, "category_id": category_id}).first()
+            task_id = 0
+        return ids, None
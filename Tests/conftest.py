@@ -0,0 +1,35 @@
+"""
+    Name: Test Fixtures
+    Description: Shared pytest fixtures, a fresh database per test
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed, tests are run from the repository root ("python -m pytest -q")
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Creates a database file in pytest's temporary directory
+    Invariants:
+        - Every test gets an empty, fully migrated database of its own
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import pytest
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path) -> Database:
+    """Returns a new empty database in a temporary directory, its connections closed after the test"""
+    database = Database(str(tmp_path / "busybee.db"))
+    yield database
+    database.engine.dispose()
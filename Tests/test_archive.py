@@ -0,0 +1,55 @@
+"""
+    Name: Archive Tests
+    Description: Which items archive_old_items moves into the archive database
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from Models import Task # model
+from Services.archive import archive_old_items, archive_counts # under test
+from Services.seriesWriter import insert_events, insert_tasks # to add old items
+
+
+def add_old_items(db, count:int=10):
+    """Adds count completed tasks and count events, all a year past the archive horizon"""
+    dates = [datetime.now() - timedelta(days=455 + day) for day in range(count)]
+    with db.get_session() as session, session.begin():
+        insert_events(session, "Old event", "", dates)
+        insert_tasks(session, "Old task", "", dates)
+        session.execute(update(Task).values(complete=True))
+
+
+def test_events_stay_live_by_default(db):
+    add_old_items(db)
+    report = archive_old_items(db)
+
+    assert (report["tasks"], report["events"]) == (10, 0)
+    assert archive_counts(db) == {"live_tasks": 0, "archived_tasks": 10, "live_events": 10, "archived_events": 0}
+
+
+def test_events_are_archived_when_asked(db):
+    add_old_items(db)
+    report = archive_old_items(db, events=True)
+
+    assert (report["tasks"], report["events"]) == (10, 10)
+    assert archive_counts(db) == {"live_tasks": 0, "archived_tasks": 10, "live_events": 0, "archived_events": 10}
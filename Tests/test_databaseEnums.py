@@ -0,0 +1,100 @@
+"""
+    Name: Database Enum Tests
+    Description: Frequency's direct occurrence math (nth, index_on_or_after, first_on_or_after, occurs_on) checked against
+                 chains of get_next_date over many years
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from bisect import bisect_left
+from datetime import datetime, timedelta
+import pytest
+from Models.databaseEnums import Frequency # under test
+
+
+# Starts that clamp (February 29th, the 31st), plus an ordinary one
+STARTS = [
+    datetime(2024, 2, 29, 10, 0),
+    datetime(2025, 1, 31, 9, 30),
+    datetime(2025, 3, 31, 18, 0),
+    datetime(2025, 8, 31, 0, 0),
+    datetime(2025, 12, 31, 23, 59),
+    datetime(2026, 3, 15, 12, 0),
+]
+
+# Occurrences compared per frequency, each about 20 years or more
+OCCURRENCES = {
+    Frequency.DAILY: 8000,
+    Frequency.WEEKLY: 1100,
+    Frequency.MONTHLY: 300,
+    Frequency.YEARLY: 40,
+}
+
+CASES = [(frequency, start) for frequency in OCCURRENCES for start in STARTS]
+
+
+def chain(frequency:Frequency, start:datetime) -> list[datetime]:
+    """Returns the first OCCURRENCES[frequency] occurrences, stepping through them with get_next_date"""
+    dates = [start]
+    while len(dates) < OCCURRENCES[frequency]:
+        dates.append(frequency.get_next_date(dates[-1], start))
+    return dates
+
+
+def probes(dates:list[datetime]) -> list[datetime]:
+    """Returns datetimes at, just before, just after, and between the occurrences"""
+    found = [dates[0] - timedelta(days=400)]
+    for before, after in zip(dates, dates[1:]):
+        found += [before - timedelta(seconds=1), before, before + timedelta(seconds=1), before + (after - before) / 2]
+    return found
+
+
+@pytest.mark.parametrize("frequency, start", CASES)
+def test_nth_matches_get_next_date(frequency, start):
+    dates = chain(frequency, start)
+    assert [frequency.nth(k, start) for k in range(len(dates))] == dates
+
+
+@pytest.mark.parametrize("frequency, start", CASES)
+def test_index_and_first_on_or_after_match_get_next_date(frequency, start):
+    dates = chain(frequency, start)
+    for probe in probes(dates):
+        index = bisect_left(dates, probe) # first occurrence at or after the probe
+        assert frequency.index_on_or_after(probe, start) == index, probe
+        assert frequency.first_on_or_after(probe, start) == dates[index], probe
+
+
+@pytest.mark.parametrize("frequency, start", [case for case in CASES if case[0] in (Frequency.MONTHLY, Frequency.YEARLY)])
+def test_occurs_on_matches_get_next_date(frequency, start):
+    dates = chain(frequency, start)
+    days = {date.date() for date in dates}
+    day = start.date() - timedelta(days=10)
+    while day < dates[-1].date():
+        assert frequency.occurs_on(day, start) == (day in days), day
+        day += timedelta(days=1)
+
+
+def test_no_repeat_only_occurs_on_its_date():
+    start = STARTS[0]
+    assert Frequency.NO_REPEAT.first_on_or_after(start, start) == start
+    assert Frequency.NO_REPEAT.first_on_or_after(start + timedelta(seconds=1), start) is None
+    assert Frequency.NO_REPEAT.occurs_on(start.date(), start)
+    assert not Frequency.NO_REPEAT.occurs_on(start.date() + timedelta(days=1), start)
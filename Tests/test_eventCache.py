@@ -0,0 +1,83 @@
+"""
+    Name: Event Cache Tests
+    Description: A month loading while the cache is invalidated (on another thread) isn't stored
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Starts a thread
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import threading
+from datetime import datetime
+from Services.eventCache import EventCache # under test
+from Services.eventRepository import EventRecord # cached records
+
+
+class BlockingRepository:
+    """Stands in for EventRepository, returning the current records once a load is let through"""
+    def __init__(self):
+        self.records = [EventRecord(1, "Before the import", datetime(2026, 10, 1, 9, 0))]
+        self.loading = threading.Event() # set once a load has read the records
+        self.proceed = threading.Event() # set to let the load return
+
+    def records_in_month(self, year:int, month:int) -> list[EventRecord]:
+        records = list(self.records)
+        self.loading.set()
+        self.proceed.wait(5)
+        return records
+
+
+def load_while_invalidated(invalidate) -> tuple[tuple, tuple]:
+    """Loads October on a thread, calls invalidate(cache) mid-load after a write, and returns (stale load, next lookup)"""
+    repository = BlockingRepository()
+    cache = EventCache(repository)
+    result = {}
+    loader = threading.Thread(target=lambda: result.setdefault("stale", cache.month(2026, 10)))
+    loader.start()
+
+    assert repository.loading.wait(5)
+    repository.records = [EventRecord(2, "Imported", datetime(2026, 10, 2, 9, 0))] # the write
+    invalidate(cache)
+    repository.proceed.set()
+    loader.join(5)
+
+    return result["stale"], cache.month(2026, 10)
+
+
+def test_invalidate_all_during_a_load_isnt_undone():
+    stale, fresh = load_while_invalidated(lambda cache: cache.invalidate_all())
+
+    assert [record.id for record in stale] == [1]
+    assert [record.id for record in fresh] == [2]
+
+
+def test_invalidate_during_a_load_isnt_undone():
+    stale, fresh = load_while_invalidated(lambda cache: cache.invalidate([datetime(2026, 10, 2)]))
+
+    assert [record.id for record in fresh] == [2]
+
+
+def test_months_are_cached_without_invalidation():
+    repository = BlockingRepository()
+    repository.proceed.set()
+    cache = EventCache(repository)
+    cache.month(2026, 10)
+    cache.month(2026, 10)
+
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,41 @@
+"""
+    Name: Event Repository Tests
+    Description: The event range query is served by the start_time index
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from Services import queries # the statement records_between runs
+
+
+def query_plan(db, statement) -> list[str]:
+    """Returns SQLite's EXPLAIN QUERY PLAN details for a statement (the plan doesn't depend on the parameter values)"""
+    compiled = statement.compile(db.engine)
+    with db.engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}", (None,) * len(compiled.positiontup)).all()
+    return [row[-1] for row in rows]
+
+
+def test_records_between_searches_the_start_time_index(db):
+    plan = query_plan(db, queries.EVENT_RECORDS_BETWEEN)
+
+    assert any("USING INDEX ix_Event__start_time" in step for step in plan), plan
+    assert not any(step.startswith("SCAN Event_") for step in plan), plan
@@ -0,0 +1,54 @@
+"""
+    Name: iCalendar Import Tests
+    Description: How parse_rule maps RRULEs to a Frequency and times
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+import pytest
+from Models import Recurrence # model
+from Models.databaseEnums import Frequency # repeat rules
+from Services.icsImport import parse_rule # under test
+
+
+START = datetime(2026, 3, 1, 9, 0)
+
+
+@pytest.mark.parametrize("rule, expected", [
+    ("FREQ=WEEKLY;COUNT=10", (Frequency.WEEKLY, 10, False)),
+    ("FREQ=DAILY", (Frequency.DAILY, Recurrence.FOREVER, False)),
+    ("FREQ=DAILY;UNTIL=20260305T090000", (Frequency.DAILY, 5, False)),
+    ("FREQ=DAILY;COUNT=1", (None, None, False)),
+    ("FREQ=DAILY;UNTIL=20260301T090000", (None, None, False)), # only DTSTART
+    ("FREQ=DAILY;UNTIL=20260201T090000", (None, None, False)), # UNTIL before DTSTART
+    ("FREQ=DAILY;COUNT=0", (None, None, True)),
+    ("FREQ=DAILY;COUNT=-3", (None, None, True)),
+    ("FREQ=WEEKLY;BYDAY=MO,WE", (None, None, True)),
+])
+def test_parse_rule(rule, expected):
+    assert parse_rule(rule, START) == expected
+
+
+def test_a_rule_never_repeats_forever_by_accident():
+    for rule in ("FREQ=MONTHLY;COUNT=0", "FREQ=MONTHLY;UNTIL=20250101"):
+        frequency, times, simplified = parse_rule(rule, START)
+        assert frequency is None and times is None
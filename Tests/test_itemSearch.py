@@ -0,0 +1,54 @@
+"""
+    Name: Item Search Tests
+    Description: Which events and tasks ItemSearch finds, and in what order
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed, SQLite must be compiled with FTS5
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+from Services.itemSearch import ItemSearch # under test
+from Services.seriesWriter import insert_event_rows # to add many events at once
+
+
+def add_events(db, names_and_notes:list[tuple[str, str]]) -> list[int]:
+    """Adds one event per (name, notes), oldest first, and returns their ids"""
+    with db.get_session() as session, session.begin():
+        return insert_event_rows(session, [
+            {"name": name, "notes": notes, "start_time": datetime(2025, 1, 1)} for name, notes in names_and_notes
+        ])
+
+
+def test_older_name_match_ranks_above_newer_notes_matches(db):
+    name_match, = add_events(db, [("Dentist", "")])
+    add_events(db, [(f"Errand {i}", "call the dentist") for i in range(1000)])
+
+    results = ItemSearch(db).search("dentist", limit=5)
+
+    assert len(results) == 5
+    assert results[0].id == name_match
+
+
+def test_last_word_matched_as_prefix(db):
+    dentist, = add_events(db, [("Dentist appointment", "")])
+    add_events(db, [("Dentist", "")])
+
+    assert [result.id for result in ItemSearch(db).search("dentist app")] == [dentist]
+    assert ItemSearch(db).search("dentist app ") == []
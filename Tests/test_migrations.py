@@ -0,0 +1,62 @@
+"""
+    Name: Migration Tests
+    Description: Schema version and auto-vacuum mode after migrate(), and that every step can run again
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Creates a database file in pytest's temporary directory
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from sqlalchemy import create_engine
+from migrations import MIGRATIONS, SCHEMA_VERSION, get_version, migrate # under test
+
+
+# PRAGMA auto_vacuum value of incremental mode
+INCREMENTAL = 2
+
+
+def test_every_step_can_run_again(db):
+    for description, upgrade in MIGRATIONS:
+        with db.engine.begin() as connection:
+            upgrade(connection)
+
+    with db.engine.connect() as connection:
+        assert get_version(connection) == SCHEMA_VERSION
+
+
+def test_auto_vacuum_enabled_on_existing_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    try:
+        # a database made before incremental auto-vacuum, with items in it
+        migrate(engine)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.exec_driver_sql("PRAGMA auto_vacuum = NONE")
+            connection.exec_driver_sql("VACUUM")
+            connection.exec_driver_sql("""INSERT INTO "Item" (name, type, i_created, i_last_updated) VALUES ('Dentist', 'EVENT', '2025-01-01', '2025-01-01')""")
+            connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+            assert connection.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 0
+
+        assert migrate(engine) == ["enable incremental auto-vacuum"]
+
+        with engine.connect() as connection:
+            assert get_version(connection) == SCHEMA_VERSION
+            assert connection.exec_driver_sql("PRAGMA auto_vacuum").scalar() == INCREMENTAL
+            assert connection.exec_driver_sql('SELECT name FROM "Item"').scalar() == "Dentist"
+    finally:
+        engine.dispose()
@@ -0,0 +1,65 @@
+"""
+    Name: Recurrence Expansion Tests
+    Description: expand_dates gives the same dates, or the same error, with and without NumPy
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest must be installed, NumPy too for the comparisons (they're skipped without it)
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+import pytest
+from Models.databaseEnums import Frequency # repeat rules
+from Services import recurrenceExpansion # under test
+from Services.recurrenceExpansion import _expand_dates_numpy, _expand_dates_python # both paths of expand_dates
+
+
+needs_numpy = pytest.mark.skipif(recurrenceExpansion.np is None, reason="NumPy isn't installed")
+
+
+@needs_numpy
+@pytest.mark.parametrize("frequency", [Frequency.DAILY, Frequency.WEEKLY, Frequency.MONTHLY, Frequency.YEARLY])
+@pytest.mark.parametrize("first", [datetime(2024, 2, 29, 10, 0), datetime(2025, 1, 31, 9, 30), datetime(2026, 3, 15, 12, 0)])
+def test_both_paths_give_the_same_dates(frequency, first):
+    numpy_dates = _expand_dates_numpy(frequency, first, 500)
+
+    assert numpy_dates == _expand_dates_python(frequency, first, 500)
+    assert all(type(date) is datetime for date in numpy_dates)
+
+
+@needs_numpy
+@pytest.mark.parametrize("frequency, times", [
+    (Frequency.DAILY, 400_000),
+    (Frequency.WEEKLY, 60_000),
+    (Frequency.MONTHLY, 13_000),
+    (Frequency.YEARLY, 1100),
+])
+def test_both_paths_raise_the_same_error_past_datetime_max(frequency, times):
+    first = datetime(9000, 1, 31) # about a thousand years before datetime.max
+    with pytest.raises(ValueError) as numpy_error:
+        _expand_dates_numpy(frequency, first, times)
+    with pytest.raises(ValueError) as python_error:
+        _expand_dates_python(frequency, first, times)
+
+    assert str(numpy_error.value) == str(python_error.value)
+
+
+def test_expand_dates_never_returns_ints():
+    with pytest.raises(ValueError):
+        recurrenceExpansion.expand_dates(Frequency.YEARLY, datetime(2025, 1, 1), 8000)
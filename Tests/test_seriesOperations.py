@@ -0,0 +1,154 @@
+"""
+    Name: Series Operations Tests
+    Description: Deleting occurrences of a virtual series through delete_series
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+import pytest
+from sqlalchemy import select
+from Models import Event_, Recurrence # models
+from Models.databaseEnums import Frequency # repeat rules
+from Services.eventRepository import EventRepository # to list the remaining occurrences
+from Services.seriesOperations import SeriesScope, delete_series, reconcile_series # under test
+from Services.seriesWriter import insert_recurrence, insert_events # to add the series
+
+
+FIRST = datetime(2026, 1, 31, 9, 0)
+YEAR = (datetime(2026, 1, 1), datetime(2027, 1, 1))
+
+
+def add_virtual_series(db, frequency=Frequency.MONTHLY, times=Recurrence.FOREVER) -> int:
+    """Adds a virtual series starting at FIRST and returns its (only stored) event's id"""
+    with db.get_session() as session, session.begin():
+        recurrence_id = insert_recurrence(session, frequency, times, virtual=True)
+        return insert_events(session, "Rent", None, [FIRST], recurrence_id)[0]
+
+
+def delete(db, event_id, scope, occurrence=None) -> int:
+    """Runs delete_series in its own transaction"""
+    with db.get_session() as session, session.begin():
+        return delete_series(session, event_id, scope, occurrence)
+
+
+def occurrences(db) -> list[datetime]:
+    """Returns the start times of the events in YEAR"""
+    return [record.start_time for record in EventRepository(db).records_between(*YEAR)]
+
+
+def test_following_ends_the_series_before_the_occurrence(db):
+    event_id = add_virtual_series(db)
+    fifth = Frequency.MONTHLY.nth(4, FIRST)
+
+    assert delete(db, event_id, SeriesScope.FOLLOWING, fifth) == 1
+    assert occurrences(db) == [Frequency.MONTHLY.nth(k, FIRST) for k in range(4)]
+
+
+def test_following_from_the_second_occurrence_leaves_a_single_event(db):
+    event_id = add_virtual_series(db)
+    delete(db, event_id, SeriesScope.FOLLOWING, Frequency.MONTHLY.nth(1, FIRST))
+
+    assert occurrences(db) == [FIRST]
+    with db.get_session() as session:
+        assert session.scalar(select(Event_.recurrence_id).where(Event_.id == event_id)) is None
+        assert session.scalar(select(Recurrence.id)) is None
+
+
+def test_following_from_the_first_occurrence_deletes_the_series(db):
+    event_id = add_virtual_series(db)
+    delete(db, event_id, SeriesScope.FOLLOWING, FIRST)
+
+    assert occurrences(db) == []
+
+
+def test_following_after_a_finite_series_ends_deletes_nothing(db):
+    event_id = add_virtual_series(db, times=150)
+
+    assert delete(db, event_id, SeriesScope.FOLLOWING, Frequency.MONTHLY.nth(200, FIRST)) == 0
+    assert len(occurrences(db)) == 12
+
+
+def test_this_moves_only_the_first_occurrence(db):
+    event_id = add_virtual_series(db, Frequency.WEEKLY)
+    delete(db, event_id, SeriesScope.THIS, FIRST)
+
+    assert occurrences(db)[:3] == [Frequency.WEEKLY.nth(k, FIRST) for k in range(1, 4)]
+
+
+def test_this_rejects_a_first_occurrence_whose_removal_moves_the_others(db):
+    event_id = add_virtual_series(db) # monthly on the 31st, the second occurrence is clamped to February 28th
+
+    with pytest.raises(ValueError):
+        delete(db, event_id, SeriesScope.THIS, FIRST)
+    assert len(occurrences(db)) == 12
+
+
+def test_this_rejects_a_later_occurrence(db):
+    event_id = add_virtual_series(db)
+
+    with pytest.raises(ValueError):
+        delete(db, event_id, SeriesScope.THIS, Frequency.MONTHLY.nth(3, FIRST))
+    assert len(occurrences(db)) == 12
+
+
+def add_stored_series(db, times:int=5) -> list[int]:
+    """Adds a stored daily series starting at FIRST and returns its events' ids, in date order"""
+    with db.get_session() as session, session.begin():
+        recurrence_id = insert_recurrence(session, Frequency.DAILY, times)
+        return insert_events(session, "Standup", None, [Frequency.DAILY.nth(k, FIRST) for k in range(times)], recurrence_id)
+
+
+def reconcile(db, event_id, frequency, times):
+    """Runs reconcile_series in its own transaction"""
+    with db.get_session() as session, session.begin():
+        return reconcile_series(session, event_id, frequency, times)
+
+
+def stored_events(db) -> dict[int, datetime]:
+    """Returns every stored event's start time by id"""
+    with db.get_session() as session:
+        return dict(session.execute(select(Event_.id, Event_.start_time)).all())
+
+
+def test_shrinking_from_a_later_occurrence_keeps_it(db):
+    ids = add_stored_series(db)
+    changes = reconcile(db, ids[2], Frequency.DAILY, 2)
+
+    events = stored_events(db)
+    assert ids[2] in events
+    assert sorted(events.values()) == [FIRST, Frequency.DAILY.nth(1, FIRST)]
+    assert changes.deleted == 3
+
+
+def test_making_a_series_virtual_from_a_later_occurrence_keeps_it(db):
+    ids = add_stored_series(db)
+    reconcile(db, ids[3], Frequency.DAILY, Recurrence.FOREVER)
+
+    assert stored_events(db) == {ids[3]: FIRST}
+
+
+def test_an_item_still_on_a_new_date_keeps_it(db):
+    ids = add_stored_series(db)
+    changes = reconcile(db, ids[1], Frequency.DAILY, 3)
+
+    assert stored_events(db) == {id: Frequency.DAILY.nth(k, FIRST) for k, id in enumerate(ids[:3])}
+    assert (changes.moved, changes.deleted) == (0, 2)
@@ -0,0 +1,64 @@
+"""
+    Name: Task CSV Tests
+    Description: Tasks imported by TaskCsvImporter read back through the ORM, and the statements BulkInsert builds
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Writes a CSV file in pytest's temporary directory
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+import pytest
+from sqlalchemy import select
+from Models import Task # model
+from Models.databaseEnums import Priority # enum
+from Models.item import Item # Superclass model
+from Services.taskCsv import TaskCsvImporter, BulkInsert # under test
+
+
+def test_imported_tasks_read_back(db, tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text(
+        "Name,Due_Date,Priority,Complete,Categories\n"
+        "Pay rent,2024-01-31 09:30,High,yes,Home;Bills\n"
+        ",2024-02-01,,,\n"
+        "Call back,,,,\n"
+    )
+    before = datetime.now()
+    stats = TaskCsvImporter(db).import_file(str(path))
+
+    assert (stats.imported, stats.rejected_count, stats.categories_created) == (2, 1, 2)
+    with db.get_session() as session:
+        rent, call = session.scalars(select(Task).order_by(Task.id)).all()
+        assert (rent.name, rent.due_date, rent.priority, rent.complete) == ("Pay rent", datetime(2024, 1, 31, 9, 30), Priority.HIGH, True)
+        assert sorted(category.name for category in rent.categories) == ["Bills", "Home"]
+        assert (call.due_date, call.priority, call.complete, call.categories) == (None, None, False, [])
+        # created and last updated come from the columns' defaults
+        assert rent.i_created >= before and rent.i_last_updated >= before and rent.t_created >= before
+
+
+def test_bulk_insert_adds_defaulted_columns():
+    statement = BulkInsert(Item.__table__, ["id", "name", "type", "notes"])
+    assert statement.sql == 'INSERT INTO "Item" (id, name, type, notes, i_created, i_last_updated) VALUES (?, ?, ?, ?, ?, ?)'
+    assert len(statement.default_values()) == 2
+
+
+def test_bulk_insert_needs_table_order():
+    with pytest.raises(ValueError):
+        BulkInsert(Item.__table__, ["name", "id"])
@@ -0,0 +1,95 @@
+"""
+    Name: Task Repository Tests
+    Description: The to-do list's queries (sorted_records and records_page) run a fixed number of statements, however many
+                 tasks and categories there are
+    Authors: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - pytest and SQLAlchemy must be installed
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - None
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import random
+from datetime import datetime, timedelta
+import pytest
+from Models import Category # model
+from Models.databaseEnums import Priority # task priorities
+from Services.queries import SORT_OPTIONS # the to-do list's sorts
+from Services.queryCounter import QueryCounter # counts the statements
+from Services.seriesWriter import insert_task_rows # to add tasks
+from Services.taskRepository import TaskRepository, DUE_DATE_SECTIONS, PRIORITY_SECTIONS, PAGE_SIZE # under test
+
+
+CATEGORIES = 4
+
+# Most statements for one page: a statement per section it reaches, then one for the records
+# (the category sort reads the uncategorized tasks, then each category's tasks and the category after it)
+PAGE_STATEMENTS = {
+    "Due Date": len(DUE_DATE_SECTIONS) + 1,
+    "Priority": len(PRIORITY_SECTIONS) + 1,
+    "Category": 2 + 2 * CATEGORIES + 1,
+}
+
+
+def add_tasks(db, count:int):
+    """Adds count tasks with random due dates (some without one), priorities, and up to three categories"""
+    generator = random.Random(count)
+    with db.get_session() as session, session.begin():
+        categories = [Category(name=f"Category {i}") for i in range(CATEGORIES)]
+        session.add_all(categories)
+        session.flush()
+        category_ids = [category.id for category in categories]
+        insert_task_rows(session, [
+            {
+                "name": f"Task {i}", "notes": "",
+                "due_date": None if generator.random() < 0.1 else datetime(2026, 1, 1) + timedelta(hours=generator.randrange(10_000)),
+                "priority": generator.choice([None, Priority.LOW, Priority.MEDIUM, Priority.HIGH]),
+                "category_ids": generator.sample(category_ids, generator.randrange(4)),
+            }
+            for i in range(count)
+        ])
+
+
+@pytest.mark.parametrize("tasks", [10, 400])
+@pytest.mark.parametrize("sort", SORT_OPTIONS)
+def test_sorted_records_is_one_statement(db, sort, tasks):
+    add_tasks(db, tasks)
+    with db.get_session() as session, QueryCounter(db.engine) as counter:
+        records = TaskRepository.sorted_records(session, sort)
+
+    assert len(records) == tasks
+    assert counter.count == 1, counter.statements
+
+
+@pytest.mark.parametrize("tasks", [10, 400])
+@pytest.mark.parametrize("sort", SORT_OPTIONS)
+def test_records_page_statements_dont_grow_with_the_tasks(db, sort, tasks):
+    add_tasks(db, tasks)
+    seen, cursor = 0, None
+    with db.get_session() as session:
+        while True:
+            with QueryCounter(db.engine) as counter:
+                page, cursor = TaskRepository.records_page(session, sort, cursor)
+
+            assert counter.count <= PAGE_STATEMENTS[sort], counter.statements
+            seen += len(page)
+            if cursor is None:
+                break
+            assert len(page) == PAGE_SIZE
+
+    assert seen == tasks
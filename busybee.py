@@ -15,6 +15,16 @@
 # - December 6, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 7, 2024: Added theme toggling functionality (Magaly Camacho)
 # - December 8, 2024: Theme toggling improved (Magaly Camacho)
+# - October 17, 2026: Print database startup timing report on start (BusyBee Team)
+# - October 17, 2026: Print event cache statistics on stop (BusyBee Team)
+# - October 17, 2026: Optional frame time report, database executor shut down on stop (BusyBee Team)
+# - October 17, 2026: Added the Search View screen (BusyBee Team)
+# - October 17, 2026: Database maintenance runs while the user is idle (BusyBee Team)
+# - October 17, 2026: Added open_import_modal to import .ics files (BusyBee Team)
+# - October 17, 2026: Added open_export_modal to export .ics files (BusyBee Team)
+# - October 17, 2026: Added open_task_csv_modal to import and export tasks as CSV (BusyBee Team)
+# - October 17, 2026: Idle maintenance runs on the file executor, not the one the screens load from (BusyBee Team)
+# - October 17, 2026: The to-do list is refreshed after idle maintenance archives tasks (BusyBee Team)
 #
 # Preconditions:
 # - Kivy must be installed and properly configured in the Python environment.
@@ -62,6 +72,8 @@ from screens.edittask import EditTaskModal  # Import the edit modal
 from screens.editEvent import EditEventModal # Import the edit event modal
 from kivy.uix.screenmanager import ScreenManager
 from screens.dailyview import DailyView # Import the daily view class
+from screens.searchview import SearchView # Import the search view class
+from screens.importexport import ImportModal, ExportModal, TaskCsvImportModal, TaskCsvExportModal # Import the .ics and task CSV modals
 from datetime import datetime
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager
@@ -69,6 +81,12 @@ from kivy.properties import NumericProperty
 from kivy.core.window import Window
 from kivy.utils import get_color_from_hex
 from theme import Theme
+from database import startup_report, get_database # to report database startup timing
+from Services import get_event_cache # to report event cache hit rate
+from Services.dbExecutor import get_db_executor, get_file_executor # background database work
+from frametimes import FrameTimeMonitor # to measure UI smoothness
+from idlemaintenance import IdleMaintenance # to clean up the database while idle
+import os
 
 
 # -----------------------------------------------------------------------------
@@ -146,9 +164,38 @@ class BusyBeeApp(App):
         self.screen_manager.add_widget(CalendarView(name="calendar"))
         self.screen_manager.add_widget(todo)
         self.screen_manager.add_widget(DailyView(name="daily"))
+        self.screen_manager.add_widget(SearchView(name="search"))
 
         return self.screen_manager  # Return the configured ScreenManager
 
+    def on_start(self):
+        """Print the database startup timing report once the app has started."""
+        print(startup_report())
+
+        # Record frame times if asked to (BUSYBEE_FRAME_TIMES=1)
+        self.frame_monitor = None
+        if os.environ.get("BUSYBEE_FRAME_TIMES"):
+            self.frame_monitor = FrameTimeMonitor()
+            self.frame_monitor.start()
+
+        # Remove orphaned rows and reclaim free pages while the user is idle
+        self.idle_maintenance = IdleMaintenance(
+            get_database(), get_file_executor(), on_archived=self.root.get_screen('todo').refresh_tasks
+        )
+        self.idle_maintenance.start()
+
+    def on_stop(self):
+        """Print the event cache statistics when the app closes."""
+        print(f"Event cache: {get_event_cache().stats()}")
+
+        if self.frame_monitor:
+            self.frame_monitor.stop()
+            print(self.frame_monitor.report())
+
+        self.idle_maintenance.stop()
+        get_db_executor().shutdown()  # finish queued saves before closing
+        get_file_executor().shutdown()  # and the import, export, or maintenance step that's running
+
     def open_add_task_modal(self):
         """
         Open the AddTaskModal for creating a new task.
@@ -192,6 +239,22 @@ class BusyBeeApp(App):
         add_event_modal = AddEventModal()  # Create an instance of AddEventModal
         add_event_modal.open()  # Open the modal
 
+    def open_import_modal(self):
+        """Open the ImportModal to import events and tasks from an .ics file."""
+        ImportModal().open()
+
+    def open_export_modal(self):
+        """Open the ExportModal to export every event and task to an .ics file."""
+        ExportModal().open()
+
+    def open_task_csv_modal(self, spinner):
+        """Open the task CSV import or export modal chosen in the spinner, then reset the spinner."""
+        if spinner.text == "Import CSV":
+            TaskCsvImportModal().open()
+        elif spinner.text == "Export CSV":
+            TaskCsvExportModal().open()
+        spinner.text = "Tasks CSV"  # so the same option can be chosen again
+
     def switch_to_screen(self, screen_name):
         """
         Switch between Calendar and To-Do List screens.
@@ -250,7 +313,7 @@ class BusyBeeApp(App):
         self.set_theme_settings(theme_settings)
 
         # reload screens
-        screens = [self.screen_manager.get_screen(screen_name) for screen_name in ["daily", "calendar", "todo"]]
+        screens = [self.screen_manager.get_screen(screen_name) for screen_name in ["daily", "calendar", "todo", "search"]]
         for screen in screens:
             screen.__init__()
 
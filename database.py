@@ -9,6 +9,19 @@
             Added method to get database session
         - 11/04/2024 Magaly Camacho
             Added method default db for testing (Tests/Output/test_db.db)
+        - 10/17/2026 BusyBee Team
+            Made get_database() return a shared, lazily created Database per path (one engine and
+            connection pool per process), added pool configuration and a startup timing report
+        - 10/17/2026 BusyBee Team
+            Added named SQLite performance profiles (durable, balanced, fast) applied on connect
+        - 10/17/2026 BusyBee Team
+            Create indexes declared on the models that are missing from existing databases
+        - 10/17/2026 BusyBee Team
+            Replaced create_all on every construction with versioned migrations (see migrations.py)
+        - 10/17/2026 BusyBee Team
+            Added an optional async engine and AsyncSession (SQLAlchemy asyncio with aiosqlite) next to the sync ones
+        - 10/17/2026 BusyBee Team
+            Removed the async engine, no screen used it and it answered about 3x fewer requests per second than the sync one
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -17,21 +30,64 @@
         - None
     Errors/Exceptions: 
         - Operational Error if the database cannot be created or accessed
+        - ValueError if an unknown performance profile is requested
         - SQLAlchemyError for any SQLAlchemy-related errors
     Side Effects: 
         - None
     Invariants: 
         - Base will contain all database metadata (models/tables)
-        - The database schema will be consistent with the defined models
+        - The database schema will be consistent with the defined models once migrations have run
+        - There is at most one Database (and engine) per database path in the process
     Known Faults: 
         - None
 """
 
 
 # Imports
-from sqlalchemy import create_engine
+import os # to read the performance profile from the environment
+import threading # to guard the shared database registry
+from time import perf_counter # to time database creation
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
-from Models.base import Base # base class for database models
+from migrations import migrate # to create/upgrade the schema
+
+
+# paths to the databases
+TEST_DB_PATH = "Tests/Output/test_db.db"
+APP_DB_PATH = "busybee.db"
+
+
+# SQLite pragmas applied to every new connection, by profile name
+#   durable: rollback journal and a full fsync on every commit (SQLite defaults)
+#   balanced: write-ahead log, fsync only at checkpoints, bigger page cache and memory mapped reads
+#   fast: like balanced but never fsyncs, a crash can lose the last commits (not the database itself)
+PERFORMANCE_PROFILES = {
+    "durable": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000, # negative values are KiB, 2 MB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000, # ms
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000, # 16 MB
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000, # 64 MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+DEFAULT_PROFILE = os.environ.get("BUSYBEE_DB_PROFILE", "balanced")
 
 
 class Database:
@@ -39,21 +95,44 @@ class Database:
     Class to interact with the SQLite database
     
     Attributes:
+        db_path (str): the path to the database
+        profile (str): name of the active performance profile (key of PERFORMANCE_PROFILES)
+        applied_migrations (list[str]): schema upgrade steps applied when the database was opened
         engine (Engine): database engine created from models
     """
-    def __init__(self, db_path:str="Tests/Output/test_db.db", debug:bool=False):
+    def __init__(self, db_path:str=TEST_DB_PATH, debug:bool=False, pool_size:int=5, max_overflow:int=10, pool_timeout:float=30, profile:str=None):
         """
         Initialize database from models
 
         Attributes:
             db_path (str): the path to the database (or where it should be created)
             debug (bool): whether or not to print SQL emitted by connection, False by default
+            pool_size (int): number of connections kept open in the connection pool, 5 by default
+            max_overflow (int): number of extra connections allowed when the pool is exhausted, 10 by default
+            pool_timeout (float): seconds to wait for a free connection before giving up, 30 by default
+            profile (str): performance profile to apply on connect, DEFAULT_PROFILE by default
         """
+        profile = DEFAULT_PROFILE if profile is None else profile
+        if profile not in PERFORMANCE_PROFILES:
+            raise ValueError(f"Invalid performance profile: {profile}")
+
+        self.db_path = db_path
+        self.profile = profile
+
         # engine to create database connections
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=debug)
+        self.engine = create_engine(
+            f"sqlite:///{db_path}", 
+            echo=debug,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout
+        )
+
+        # apply the profile's pragmas to every new connection
+        event.listen(self.engine, "connect", self._apply_profile)
         
-        # create database if it doesn't exist already
-        Base.metadata.create_all(self.engine) 
+        # create database if it doesn't exist already, or upgrade its schema (no-op when up to date)
+        self.applied_migrations = migrate(self.engine)
 
     
     def get_session(self) -> Session:
@@ -61,20 +140,95 @@ class Database:
         return Session(self.engine)
     
 
-def get_database(test:bool=False, debug:bool=False):
+    def _apply_profile(self, dbapi_connection, connection_record):
+        """Sets the active profile's pragmas on a new DBAPI connection"""
+        cursor = dbapi_connection.cursor()
+        for pragma, value in PERFORMANCE_PROFILES[self.profile].items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+
+    def get_pragmas(self) -> dict:
+        """
+        Returns the values SQLite reports for the profile's pragmas on a pooled connection
+
+        Returns:
+            dict: pragma name to current value, e.g. {"journal_mode": "wal", "synchronous": 1, ...}
+        """
+        pragmas = {}
+        with self.engine.connect() as connection:
+            for pragma in PERFORMANCE_PROFILES[self.profile]:
+                pragmas[pragma] = connection.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+        return pragmas
+    
+
+
+# Shared databases, one per path, created on first use
+_databases: dict[str, Database] = {}
+_databases_lock = threading.Lock()
+_startup_stats = {"created": 0, "reused": 0, "create_seconds": 0.0}
+    
+
+def get_database(test:bool=False, debug:bool=False, **pool_options) -> Database:
     """
-    Returns database object for busybee
+    Returns the shared database object for busybee, creating it on first use
     
     Parameters:
         test (bool): whether to connect to test the database (default in Database)
-        debug (bool): whether to print logs or not
+        debug (bool): whether to print logs or not (only used when the database is first created)
+        pool_options: pool_size, max_overflow, pool_timeout and/or profile for Database (only used when the database is first created)
 
     Returns:
         Database: database object
     """
-    # debugging, connect to test database
-    if test:
-        return Database(debug=debug)
-    
-    # otherwise, connect to actual database
-    return Database(db_path="busybee.db", debug=debug)
\ No newline at end of file
+    # debugging, connect to test database, otherwise, connect to actual database
+    db_path = TEST_DB_PATH if test else APP_DB_PATH
+
+    with _databases_lock:
+        db = _databases.get(db_path)
+
+        # reuse existing engine and connection pool
+        if db is not None:
+            _startup_stats["reused"] += 1
+            return db
+        
+        # first request for this path, create database
+        start = perf_counter()
+        db = Database(db_path=db_path, debug=debug, **pool_options)
+        _startup_stats["create_seconds"] += perf_counter() - start
+        _startup_stats["created"] += 1
+
+        _databases[db_path] = db
+        return db
+
+
+def dispose_databases():
+    """Closes the connection pools of all shared databases and forgets them"""
+    with _databases_lock:
+        for db in _databases.values():
+            db.engine.dispose()
+        _databases.clear()
+
+
+def startup_report() -> str:
+    """
+    Returns a summary of how many databases were created versus reused, and how long creation took
+
+    Returns:
+        str: the report, one line per statistic
+    """
+    created = _startup_stats["created"]
+    reused = _startup_stats["reused"]
+    create_ms = _startup_stats["create_seconds"] * 1000
+    average_ms = create_ms / created if created else 0
+
+    lines = [
+        f"Databases created: {created} ({create_ms:.1f} ms total, {average_ms:.1f} ms each)",
+        f"get_database() calls served by a shared database: {reused}",
+        f"Estimated startup time saved: {reused * average_ms:.1f} ms",
+    ]
+    with _databases_lock:
+        for db in _databases.values():
+            lines.append(f"{db.db_path}: {db.profile} performance profile")
+
+    return "\n".join(lines)
@@ -0,0 +1,89 @@
+# Name: idlemaintenance.py
+# Description: Runs database maintenance (archiving completed tasks, garbage collection, an incremental vacuum step, and a health check) while the user is idle
+# Programmer: BusyBee Team
+# Date Created: October 17, 2026
+# Revision History:
+# - October 17, 2026: Initial version created (Author: BusyBee Team)
+# - October 17, 2026: The first idle run also optimizes and checks the database and prints its health report (BusyBee Team)
+# - October 17, 2026: The first idle run archives completed tasks and past events first (BusyBee Team)
+# - October 17, 2026: Past events are no longer archived while idle, the calendar doesn't read the archive (BusyBee Team)
+# - October 17, 2026: Runs on the file executor, so a long step doesn't hold up the screens' queries (BusyBee Team)
+# - October 17, 2026: Schedules on_archived (the to-do list refresh) on the Clock after a run that archived tasks (BusyBee Team)
+#
+# Usage:
+# - Started and stopped by the app, each run prints how many rows were removed and bytes reclaimed.
+# - The first run of each app session moves completed tasks older than the archive horizon into the archive database
+#   (they stay listed under the to-do list's "Archived" filter), then prints the full health report (same as "python -m Services.maintenance --collect").
+#   If any tasks were archived, on_archived is scheduled on the Clock so the to-do list stops showing them.
+# - Past events are only archived when the user runs "python -m Services.archive", since the calendar, daily view,
+#   and search only show live events.
+# - Runs again after every IDLE_SECONDS without input while there are free pages left to reclaim.
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from Services.maintenance import run_maintenance, format_report, health_report, format_health
+from Services.archive import archive_old_items, format_archive_report
+
+
+class IdleMaintenance:
+    """Runs Services.maintenance on the file executor after IDLE_SECONDS without touches or key presses."""
+
+    # seconds without input before maintenance runs
+    IDLE_SECONDS = 120
+
+    def __init__(self, db, executor, on_archived=None):
+        self.db = db
+        self.executor = executor
+        self.on_archived = on_archived  # called on the Clock after tasks were archived (e.g. to refresh the to-do list)
+        self._event = None
+        self._checked = False  # whether completed tasks were archived and the health report made this session
+
+    def start(self):
+        """Start watching for input, maintenance runs once the user is idle."""
+        Window.bind(on_touch_down=self.reset, on_key_down=self.reset)
+        self.reset()
+
+    def stop(self):
+        """Stop watching for input and cancel the next run."""
+        Window.unbind(on_touch_down=self.reset, on_key_down=self.reset)
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def reset(self, *args):
+        """Restart the idle timer (on input)."""
+        if self._event is not None:
+            self._event.cancel()
+        self._event = Clock.schedule_once(self._run, self.IDLE_SECONDS)
+
+    def _run(self, dt):
+        """Run one maintenance step in the background (archiving tasks and with the health report the first time)."""
+        self._event = None
+        if not self._checked:
+            self._checked = True
+            # archive first, so garbage collection removes the recurrences left without items
+            self.executor.submit(
+                lambda session: (archive_old_items(self.db), health_report(self.db, collect=True)),
+                on_result=self._checked_health
+            )
+        else:
+            self.executor.submit(lambda session: run_maintenance(self.db), on_result=self._done)
+
+    def _checked_health(self, reports):
+        """Print the archive and health reports, then continue like any other run."""
+        archived, report = reports
+        print(format_archive_report(archived))
+        print(format_health(report))
+        if archived["tasks"] and self.on_archived is not None:
+            Clock.schedule_once(lambda dt: self.on_archived())
+        self._next(report["maintenance"])
+
+    def _done(self, report):
+        """Print the report, and keep reclaiming in small steps while idle if pages are left."""
+        print(format_report(report))
+        self._next(report)
+
+    def _next(self, report):
+        """Run again after IDLE_SECONDS if there are free pages left to reclaim."""
+        if report["bytes_free"] > 0 and self._event is None:
+            self._event = Clock.schedule_once(self._run, self.IDLE_SECONDS)
@@ -0,0 +1,187 @@
+"""
+    Name: Schema Migrations
+    Description: Ordered schema upgrade steps, with the schema version recorded in PRAGMA user_version
+    Author: BusyBee Team
+
+    Date Created: 10/17/2026
+    Revisions: 
+        - 10/17/2026 BusyBee Team
+            Added the Item_Search full-text index (FTS5), kept in sync with Item by triggers
+        - 10/17/2026 BusyBee Team
+            Enabled incremental auto-vacuum, so free pages can be returned to the file system in small steps
+        - 10/17/2026 BusyBee Team
+            Search insert trigger kept in SEARCH_INSERT_TRIGGER_SQL, so bulk inserts can recreate it
+        - 10/17/2026 BusyBee Team
+            VACUUM runs outside the step's transaction, after its version is recorded (VACUUM_AFTER),
+            and the docstrings state that DDL isn't rolled back
+
+    Preconditions: 
+        - SQLAlchemy must be installed and configured in the environment
+        - Models must be implemented
+    Postconditions: 
+        - The database's user_version equals SCHEMA_VERSION after migrate()
+    Errors/Exceptions: 
+        - SQLAlchemyError for any SQLAlchemy-related errors. The failing step's version isn't recorded, so it runs again
+          the next time the database is opened, but what it already did stays: pysqlite doesn't wrap DDL in a transaction
+        - A VACUUM that fails (e.g. the database is busy) is printed, not raised
+    Side Effects: 
+        - Creates/alters tables, indexes, and triggers in the database
+    Invariants: 
+        - Steps are only ever appended, never reordered or edited, once released
+        - Every step is idempotent (IF NOT EXISTS, or checks what exists first), so a step that failed part way can run again
+        - A database whose user_version is current is not inspected at all
+    Known Faults: 
+        - If the VACUUM after enabling incremental auto-vacuum fails, the database keeps its old auto-vacuum mode
+          until it's vacuumed by hand (the step isn't run again)
+"""
+
+
+# Imports
+from typing import Callable
+from sqlalchemy import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.schema import CreateColumn
+from Models.base import Base # base class for database models
+import Models # register all models with Base.metadata
+
+
+def _create_tables(connection:Connection):
+    """Creates any missing tables (all of them for a new database, along with their indexes)"""
+    Base.metadata.create_all(connection)
+
+
+def _create_indexes(connection:Connection):
+    """Creates indexes declared on the models that databases made before they existed don't have"""
+    existing = {
+        row[0] for row in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(connection)
+
+
+def _add_column(connection:Connection, table_name:str, column_name:str):
+    """Adds a column declared on a model to its table, if the table doesn't have it yet"""
+    existing = {row[1] for row in connection.exec_driver_sql(f'PRAGMA table_info("{table_name}")')}
+    if column_name in existing:
+        return
+    
+    column = Base.metadata.tables[table_name].c[column_name]
+    column_ddl = CreateColumn(column).compile(connection).string
+    connection.exec_driver_sql(f'ALTER TABLE "{table_name}" ADD COLUMN {column_ddl}')
+
+
+def _add_virtual_recurrence(connection:Connection):
+    """Adds Recurrence.virtual (existing recurrences have every occurrence stored)"""
+    _add_column(connection, "Recurrence", "virtual")
+
+
+# FTS5 index over Item.name and Item.notes (external content, so the text is only stored in Item)
+SEARCH_TABLE = "Item_Search"
+
+# Trigger that indexes each inserted item (bulk inserts can drop it and index the new items in one statement)
+SEARCH_INSERT_TRIGGER = f"{SEARCH_TABLE}_insert"
+SEARCH_INSERT_TRIGGER_SQL = f"""
+    CREATE TRIGGER IF NOT EXISTS "{SEARCH_INSERT_TRIGGER}" AFTER INSERT ON "Item" BEGIN
+        INSERT INTO "{SEARCH_TABLE}"(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+"""
+
+
+def _create_search_index(connection:Connection):
+    """Creates the Item_Search full-text index, triggers that keep it in sync with Item, and indexes existing items"""
+    # prefix indexes make 2 and 3 character prefix queries ("me*") as fast as whole words
+    connection.exec_driver_sql(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS "{SEARCH_TABLE}" USING fts5(
+            name, notes, 
+            content='Item', content_rowid='id', 
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+    """)
+
+    # external content tables are updated by deleting the old text and inserting the new
+    connection.exec_driver_sql(SEARCH_INSERT_TRIGGER_SQL)
+    connection.exec_driver_sql(f"""
+        CREATE TRIGGER IF NOT EXISTS "{SEARCH_TABLE}_delete" AFTER DELETE ON "Item" BEGIN
+            INSERT INTO "{SEARCH_TABLE}"("{SEARCH_TABLE}", rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+        END
+    """)
+    connection.exec_driver_sql(f"""
+        CREATE TRIGGER IF NOT EXISTS "{SEARCH_TABLE}_update" AFTER UPDATE OF name, notes ON "Item" BEGIN
+            INSERT INTO "{SEARCH_TABLE}"("{SEARCH_TABLE}", rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+            INSERT INTO "{SEARCH_TABLE}"(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+        END
+    """)
+
+    # index the items that already exist
+    connection.exec_driver_sql(f"""INSERT INTO "{SEARCH_TABLE}"("{SEARCH_TABLE}") VALUES ('rebuild')""")
+
+
+def _enable_incremental_vacuum(connection:Connection):
+    """Switches the database to incremental auto-vacuum (existing databases need a one time VACUUM for it to take effect, see VACUUM_AFTER)"""
+    connection.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+
+
+# Upgrade steps, step i upgrades a database from version i to i + 1 (append only)
+MIGRATIONS: list[tuple[str, Callable[[Connection], None]]] = [
+    ("create tables", _create_tables),
+    ("create indexes on hot columns", _create_indexes),
+    ("add Recurrence.virtual", _add_virtual_recurrence),
+    ("create full-text search index", _create_search_index),
+    ("enable incremental auto-vacuum", _enable_incremental_vacuum),
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# Steps followed by a VACUUM, run once the step's version is recorded (VACUUM can't run inside a transaction)
+VACUUM_AFTER = {_enable_incremental_vacuum}
+
+
+def get_version(connection:Connection) -> int:
+    """Returns the schema version recorded in the database (0 for new or unversioned databases)"""
+    return connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def migrate(engine:Engine) -> list[str]:
+    """
+    Brings the database up to SCHEMA_VERSION, each step in its own transaction
+
+    Parameters:
+        engine (Engine): engine connected to the database
+
+    Returns:
+        list[str]: descriptions of the steps that were applied (empty if the database was up to date)
+    """
+    with engine.connect() as connection:
+        version = get_version(connection)
+
+    # up to date, nothing to inspect or create
+    if version == SCHEMA_VERSION:
+        return []
+    
+    # made by a newer version of the app, leave it as is
+    if version > SCHEMA_VERSION:
+        print(f"Database schema version {version} is newer than this app's ({SCHEMA_VERSION})")
+        return []
+
+    applied = []
+    for step in range(version, SCHEMA_VERSION):
+        description, upgrade = MIGRATIONS[step]
+        with engine.begin() as connection:
+            upgrade(connection)
+            connection.exec_driver_sql(f"PRAGMA user_version = {step + 1}")
+        applied.append(description)
+
+        if upgrade in VACUUM_AFTER:
+            _vacuum(engine)
+
+    return applied
+
+
+def _vacuum(engine:Engine):
+    """Rebuilds the database file with VACUUM, outside of any transaction (a failure is printed, the database still works)"""
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.exec_driver_sql("VACUUM")
+    except SQLAlchemyError as error:
+        print(f"VACUUM error: {error!r}")
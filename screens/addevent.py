@@ -14,6 +14,10 @@
 #   - December 7, 2024: Fixed newly added events not being able to be edited - [Magaly Camacho, Manvir Kaur, Mariam Oraby] 
 #   - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 #   - December 8, 2024: Theme toggling (Magaly Camacho)
+#   - October 17, 2026: Series are bulk inserted in one transaction and drawn without re-querying them (BusyBee Team)
+#   - October 17, 2026: Long series are stored as virtual recurrences (BusyBee Team)
+#   - October 17, 2026: Invalidate the cached months the new event(s) fall in (BusyBee Team)
+#   - October 17, 2026: Events are saved on the database executor instead of the UI thread (BusyBee Team)
 #   - [Insert Further Revisions]: [Brief description of changes] - [Your Name]
 # Preconditions:
 #   - The `DatePicker` class must be implemented and correctly imported from `screens.usefulwidgets`.
@@ -47,9 +51,10 @@ from screens.usefulwidgets import DatePicker, RepeatOptionsModal  # Custom date
 from kivy.app import App  # Ensure App is imported
 from database import get_database  # to connect to database
 from datetime import datetime  # for date
-from sqlalchemy import select  # to query database
 from Models.databaseEnums import Frequency  # for event frequency
-from Models import Event_, Recurrence  # event model
+from Services.seriesWriter import series_dates, insert_recurrence, insert_events, VIRTUAL_MIN_TIMES  # bulk series inserts
+from Services import get_event_cache  # to invalidate cached months
+from Services.dbExecutor import get_db_executor  # to save in the background
 from kivy.metrics import dp  # Import dp for density-independent pixel values
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 
@@ -196,74 +201,60 @@ class AddEventModal(ModalView):
         # Extract additional notes
         notes = self.notes_input.text.strip()
 
-        # Connect to the database and save the event
-        with db.get_session() as session:
+        # Dates of the event and its recurrences (if specified), long series only store the first event
+        is_series = bool(times and frequency)
+        is_virtual = is_series and times >= VIRTUAL_MIN_TIMES
+        start_times = series_dates(frequency, start_time, times) if is_series and not is_virtual else [start_time]
+
+        def save(session):
+            """Save the event(s) in one transaction (runs on the database executor)"""
             with session.begin():  # Transaction started that will auto commit before exiting
-                # Create and save the main event
-                new_event = Event_(name=event_name, notes=notes, start_time=start_time)
-
-                # Add recurrence details if specified
-                if times and frequency:
-                    recurrence_id = self.save_recurrence(frequency, times)  # Save recurrence in DB
-                    new_event.recurrence_id = recurrence_id  # Link recurrence to the event
-
-                    # Generate additional events based on recurrence
-                    current_date = start_time
-                    for _ in range(times - 1):
-                        new_date = frequency.get_next_date(current_date, start_time)
-                        recurring_event = Event_(
-                            name=event_name,
-                            notes=notes,
-                            start_time=new_date,
-                            recurrence_id=recurrence_id
-                        )
-                        session.add(recurring_event)
-                        current_date = new_date  # Update the current date for the next recurrence
-                else:
-                    recurrence_id = None
-
-                session.add(new_event)  # Save the main event
-            event_id = new_event.id  # Get the ID of the newly saved event
+                recurrence_id = insert_recurrence(session, frequency, times, virtual=is_virtual) if is_series else None
+                event_ids = insert_events(session, event_name, notes, start_times, recurrence_id=recurrence_id)
+
+            # Cached months that now have new events (a virtual series can reach any month)
+            if is_virtual:
+                get_event_cache().invalidate_all()
+            else:
+                get_event_cache().invalidate(start_times)
+            return event_ids
+
+        # Save in the background, then show the new event(s)
+        get_db_executor().submit(
+            save, 
+            on_result=lambda event_ids: self.show_saved_events(event_ids, event_name, start_times, is_virtual, frequency, times)
+        )
+
+    def show_saved_events(self, event_ids, event_name, start_times, is_virtual, frequency=None, times=None):
+        """Add newly saved events to the CalendarView or DailyView and close the modal."""
+        event_id = event_ids[0]  # ID of the main event
+        start_time = start_times[0]  # Start time of the main event
 
         # Update the CalendarView or DailyView with the new event(s)
         app = App.get_running_app()
         calendar_screen = app.screen_manager.get_screen('calendar')
         daily_view_screen = app.screen_manager.get_screen('daily')
 
-        # Add recurring events to the calendar if applicable
-        if recurrence_id:
-            with db.get_session() as session:
-                stmt = select(Event_).where(Event_.recurrence_id == recurrence_id)
-                events = session.scalars(stmt)
-                for event in events:
-                    calendar_screen.add_event(
-                        event.id, event.name, event.start_time, frequency=frequency, times=times
-                    )
-
-                    # add events to daily view
-                    if app.screen_manager.current == 'daily':
-                        daily_view_screen.add_event(event.id, event.name, event.start_time)
-        else:
-            # Add a single event to the calendar
-            calendar_screen.add_event(event_id, event_name, start_time)
-
-            # Add event to daily view
+        # Virtual occurrences are expanded when the views query their range
+        if is_virtual:
+            calendar_screen.refresh_calendar()
             if app.screen_manager.current == 'daily':
-                daily_view_screen.add_event(event_id, event_name, start_time)
+                daily_view_screen.refresh_events()
+            start_times = []
+
+        # Add the event(s) to the calendar, ids and dates are already known so no re-query is needed
+        for new_id, new_start_time in zip(event_ids, start_times):
+            calendar_screen.add_event(new_id, event_name, new_start_time, frequency=frequency, times=times)
+
+            # add events to daily view
+            if app.screen_manager.current == 'daily':
+                daily_view_screen.add_event(new_id, event_name, new_start_time)
 
         # Log success and dismiss the modal
-        print(f"Event '{event_name}' scheduled for {event_date_label}, id={event_id}")
+        print(f"Event '{event_name}' scheduled for {start_time}, id={event_id}")
         self.dismiss()  # Close the modal after saving
 
 
-    def save_recurrence(self, frequency: Frequency, times: int) -> int:
-        """Save recurrence details in the database and return the recurrence ID."""
-        with db.get_session() as session:
-            with session.begin():
-                recurrence = Recurrence(times=times, frequency=frequency)
-                session.add(recurrence)
-            return recurrence.id
-
     def update_background(self, *args):
         """Update the size and position of the background rectangle."""
         self.bg_rect.pos = self.pos
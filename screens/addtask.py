@@ -14,6 +14,8 @@
 # - November 23, 2024: Updated the save_task function to handle recurrence (Matthew McManness)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 17, 2026: Recurrence is read from the repeat button and series are bulk inserted in one transaction (BusyBee Team)
+# - October 17, 2026: Categories are loaded and tasks saved on the database executor instead of the UI thread (BusyBee Team)
 #
 # Preconditions:
 # - Kivy framework must be installed and configured properly.
@@ -43,12 +45,13 @@ from screens.usefulwidgets import DatePicker # Date picker
 from screens.usefulwidgets import RepeatOptionsModal, PriorityOptionsModal, CategoryModal  # Additional modals
 from kivy.uix.label import Label  # Label widget for displaying text
 from kivy.app import App  # Ensure App is imported
-from Models import Task, Category # Task and Category classes
+from Models import Category # Category class
 from Models.databaseEnums import Priority, Frequency # for task priorities and frequency
 from database import get_database # to connect to database
 from sqlalchemy import select # to query database
 from datetime import datetime # for Task.due_date
-from Models import Recurrence  # Import the Recurrence model
+from Services.seriesWriter import series_dates, insert_recurrence, insert_tasks # bulk series inserts
+from Services.dbExecutor import get_db_executor # to use the database in the background
 from kivy.metrics import dp  # Import dp for density-independent pixel values
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 
@@ -90,12 +93,9 @@ class AddTaskModal(ModalView):
         # Access app-wide styles
         app = App.get_running_app()
 
-        # Initialize categories and the selected category list
-        with db.get_session() as session, session.begin():
-            stmt = select(Category).where(True) # sql statement
-            results = session.scalars(stmt).all() # query the database for all categories
-            self.categories = [result.name for result in results] # save the names of all categories in the database
-            self.categories_ids = [result.id for result in results] # cache ids
+        # Initialize categories (loaded in the background) and the selected category list
+        self.categories = [] # names of all categories in the database
+        self.categories_ids = [] # cache ids
         self.selected_categories = [] # initially none
 
         # Create the main layout
@@ -166,6 +166,20 @@ class AddTaskModal(ModalView):
 
         self.add_widget(layout)  # Add the layout to the modal
 
+        # Load the categories in the background
+        get_db_executor().submit(
+            lambda session: session.execute(select(Category.id, Category.name)).all(),
+            on_result=self.show_categories
+        )
+
+    def show_categories(self, rows):
+        """Save the loaded (id, name) category rows and add them to the spinner."""
+        for category_id, name in rows:
+            if name not in self.categories: # might have been added while loading
+                self.categories.append(name)
+                self.categories_ids.append(category_id)
+        self.update_category_spinner()
+
     def open_date_picker(self, instance):
         """Open the DatePicker modal to select a deadline."""
         DatePicker(self).open()
@@ -224,6 +238,14 @@ class AddTaskModal(ModalView):
         notes = self.notes_input.text
         due_date = self.deadline_label.text.split(" ", 1)[1] if "Deadline" in self.deadline_label.text else None
 
+        # Get recurrence from the repeat button ("Repeats <frequency> <times> times") if it wasn't set
+        repeat_info = self.repeat_button.text.split(" ")
+        if self.recurrence is None and len(repeat_info) == 4:
+            self.recurrence = {
+                "frequency": Frequency.str2enum(repeat_info[1]),
+                "times": int(repeat_info[2])
+            }
+
         # Ensure a valid due_date is provided if recurrence is specified
         if self.recurrence and not due_date:
             print("Due date is required for recurring tasks.")  # Debugging message
@@ -237,55 +259,37 @@ class AddTaskModal(ModalView):
         if self.recurrence is None or self.repeat_button.text == Frequency.frequency_options()[0]:
             self.recurrence = None
 
-        # Retrieve category instances
-        selected_categories_ids = [cat_id for cat_id, cat in zip(self.categories_ids, self.categories) if cat in self.selected_categories]
-
-        with db.get_session() as session:
-            # Create the main task
-            task = Task(
-                name=name,
-                notes=notes,
-                due_date=due_date,
-                priority=priority
-            )
-            task.categories = session.query(Category).filter(Category.id.in_(selected_categories_ids)).all()
-            session.add(task)
-            session.flush()  # Get task ID immediately
-
-            # Add recurrence if specified
-            if self.recurrence:
-                recurrence = Recurrence(
-                    frequency=self.recurrence["frequency"],
-                    times=self.recurrence["times"]
+        # Names of the selected categories (ids are looked up when saving, in case one was just added)
+        selected_categories = list(self.selected_categories)
+        recurrence = self.recurrence
+
+        # Due dates of the task and its repeated tasks (if specified)
+        if self.recurrence:
+            due_dates = series_dates(self.recurrence["frequency"], due_date, self.recurrence["times"])
+        else:
+            due_dates = [due_date]
+
+        def save(session):
+            """Save the task(s), with their categories, in one transaction (runs on the database executor)"""
+            with session.begin():
+                category_ids = session.scalars(select(Category.id).where(Category.name.in_(selected_categories))).all()
+
+                recurrence_id = None
+                if recurrence:
+                    recurrence_id = insert_recurrence(session, recurrence["frequency"], recurrence["times"])
+
+                task_ids = insert_tasks(
+                    session, name, notes, due_dates, 
+                    priority=priority, 
+                    category_ids=category_ids, 
+                    recurrence_id=recurrence_id
                 )
-                session.add(recurrence)
-                session.flush()
-                task.recurrence_id = recurrence.id
-
-                # Create repeated tasks based on recurrence
-                next_date = due_date
-                for _ in range(self.recurrence["times"] - 1):  # Subtract 1 because the first task is already created
-                    next_date = recurrence.frequency.get_next_date(next_date, due_date)
-                    if not next_date:  # Debugging check for invalid dates
-                        print("Error: next_date calculation returned None.")
-                        break
-                    repeated_task = Task(
-                        name=name,
-                        notes=notes,
-                        due_date=next_date,
-                        priority=priority,
-                        recurrence_id=recurrence.id
-                    )
-                    repeated_task.categories = task.categories
-                    session.add(repeated_task)
-
-             # Capture the task ID before the session is closed
-            task_id = task.id
-
-            # Commit all changes
-            session.commit()
-
-        # Refresh the to-do list view if a callback is provided
+            return task_ids[0]  # ID of the main task
+
+        get_db_executor().submit(save, on_result=self.show_saved_task)
+
+    def show_saved_task(self, task_id):
+        """Refresh the to-do list view if a callback is provided, then close the modal."""
         if self.refresh_callback:
             self.refresh_callback()
 
@@ -19,6 +19,10 @@
 #   - December 7, 2024: Fixed setting date for dailyview - [Magaly Camacho, Mariam Oraby]
 #   - December 7, 2024: Removed EventBox class since it wasn't used - [Magaly Camacho]
 #   - December 8, 2024: Theme toggling (Magaly Camacho)
+#   - October 17, 2026: Month events are queried through EventRepository (index range scan instead of extract()) - [BusyBee Team]
+#   - October 17, 2026: Month events are read from the shared event cache - [BusyBee Team]
+#   - October 17, 2026: Month events are loaded on the database executor instead of the UI thread - [BusyBee Team]
+#   - October 17, 2026: Clicked events open with their occurrence's start time, so deletes apply to that occurrence - [BusyBee Team]
 #
 # Preconditions:
 #   - The `.kv` file must define a `calendar_grid` widget ID to correctly render the calendar grid.
@@ -62,8 +66,8 @@ from kivy.clock import Clock  # Schedule functions after a delay.
 from calendar import monthcalendar  # Generate calendar layout for a given month.
 from datetime import datetime, timedelta  # Work with dates and times.
 from database import get_database # to connect to database
-from sqlalchemy import select, extract # to query database
-from Models import Event_ # task model class
+from Services import get_event_cache # cached events by month
+from Services.dbExecutor import get_db_executor # to load events in the background
 from kivy.uix.anchorlayout import AnchorLayout  # Import for anchoring widgets
 from kivy.graphics import Color, Rectangle, RoundedRectangle  # Import for rounded rectangle backgrounds
 import calendar  # Import calendar for setting first day of the week
@@ -83,12 +87,15 @@ class EventButton(UniformButton):
 calendar.setfirstweekday(calendar.SUNDAY)
 
 db = get_database()  # Get database
+event_cache = get_event_cache()  # Events by month, shared with DailyView
+db_executor = get_db_executor()  # Background database work
         
 class CalendarView(Screen):
     """Displays a monthly calendar with navigational buttons and day selection."""
 
     month_year_text = StringProperty()  # Reactive property for month and year text.
     modal_open = False
+    populate_job = None  # Background load of the month's events.
 
     def __init__(self, **kwargs):
         """Initialize the calendar with the current month and year."""
@@ -189,7 +196,7 @@ class CalendarView(Screen):
             size_hint_y=None,
             height=dp(15),
             background_normal="",
-            on_press=lambda instance, event_id=event_id: self.open_edit_event_modal(event_id)  # Pass event ID to the method
+            on_press=lambda instance, event_id=event_id, start_time=start_time: self.open_edit_event_modal(event_id, start_time)  # Pass event ID and occurrence to the method
         )
 
         # Set font_size explicitly after creation
@@ -276,26 +283,30 @@ class CalendarView(Screen):
         self.populate_calendar()
 
     def populate(self):
-        """Retrieve and display events for the current month."""
-        session = db.get_session()
-        try:
-            stmt = select(Event_).where(
-                extract("year", Event_.start_time) == self.current_year,
-                extract("month", Event_.start_time) == self.current_month
-            )
-            events = session.scalars(stmt).all()
-            events.sort(key=lambda event: event.start_time)  # Sort events by start time
-
-            for event in events:
-                start_time = event.start_time if isinstance(event.start_time, datetime) else datetime.strptime(event.start_time, "%Y-%m-%d %H:%M")
-                self.add_event(event.id, event.name, start_time, event.place)
-        finally:
-            session.close()
-
-    def open_edit_event_modal(self, event_id):
+        """Retrieve the events for the current month in the background, then display them."""
+        # Only the latest request matters
+        if self.populate_job:
+            self.populate_job.cancel()
+
+        year, month = self.current_year, self.current_month
+        self.populate_job = db_executor.submit(
+            lambda session: event_cache.month(year, month),
+            on_result=lambda events: self.display_events(year, month, events)
+        )
+
+    def display_events(self, year, month, events):
+        """Display the given month's events (sorted by start time) if that month is still shown."""
+        if (year, month) != (self.current_year, self.current_month):
+            return
+
+        for event in events:
+            start_time = event.start_time if isinstance(event.start_time, datetime) else datetime.strptime(event.start_time, "%Y-%m-%d %H:%M")
+            self.add_event(event.id, event.name, start_time, event.place)
+
+    def open_edit_event_modal(self, event_id, occurrence=None):
         """Open the Edit Event modal for a specific event ID and refresh calendar upon save."""
         self.modal_open = True
-        edit_event_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_calendar)
+        edit_event_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_calendar, occurrence=occurrence)
 
         # Reset modal_open when the modal is dismissed
         def reset_modal_open(*args):
@@ -10,6 +10,10 @@
 #   - December 7, 2024: Implemented variables for ease of UI modification - [Matthew McManness]
 #   - December 8, 2024: Removed example testing code that's unnecessary now - [Manvir Kaur]
 #   - December 8, 2024: Theme toggling (Magaly Camacho)
+#   - October 17, 2026: Day events are queried through EventRepository (index range scan instead of extract()) - [BusyBee Team]
+#   - October 17, 2026: Day events are read from the shared event cache - [BusyBee Team]
+#   - October 17, 2026: Day events are loaded on the database executor instead of the UI thread - [BusyBee Team]
+#   - October 17, 2026: Clicked events open with their occurrence's start time, so deletes apply to that occurrence - [BusyBee Team]
 
 from datetime import datetime, timedelta
 from kivy.uix.screenmanager import Screen
@@ -21,8 +25,8 @@ from kivy.properties import ObjectProperty
 from kivy.metrics import dp
 from kivy.app import App
 from database import get_database
-from sqlalchemy import select, extract
-from Models import Event_
+from Services import get_event_cache
+from Services.dbExecutor import get_db_executor
 from kivy.lang import Builder
 from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle, RoundedRectangle  
@@ -30,6 +34,8 @@ from screens.calendarview import CalendarView
 from Models.databaseEnums import Frequency
 
 db = get_database()
+event_cache = get_event_cache()
+db_executor = get_db_executor()
 
 class UniformButton(Button):
     pass
@@ -59,6 +65,7 @@ class EventBox(BoxLayout):
 
 class DailyView(Screen):  # Change inheritance to Screen
     selected_date = ObjectProperty(None)  
+    events_job = None  # Background load of the day's events
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -115,22 +122,15 @@ class DailyView(Screen):  # Change inheritance to Screen
             print("Error: No date selected.")
             return
 
-        try:
-            # Query events for the selected date
-            session = db.get_session()
-            start_of_day = datetime.combine(self.selected_date, datetime.min.time())
-            end_of_day = datetime.combine(self.selected_date, datetime.max.time())
+        # Query events for the selected date in the background, only the latest request matters
+        if self.events_job:
+            self.events_job.cancel()
 
-            stmt = select(Event_).where(
-                Event_.start_time >= start_of_day,
-                Event_.start_time <= end_of_day
-            )
-
-            events = session.scalars(stmt).all()
-            self.display_events(events)
-            session.close()
-        except Exception as e:
-            print(e)
+        selected_date = self.selected_date
+        self.events_job = db_executor.submit(
+            lambda session: event_cache.day(selected_date),
+            on_result=self.display_events
+        )
 
     def display_events(self, events):
         """
@@ -178,7 +178,7 @@ class DailyView(Screen):  # Change inheritance to Screen
 
         edit_button = EditButton(
             text="Edit",
-            on_press=lambda instance, event_id=event_id: self.open_edit_event_modal(event_id)
+            on_press=lambda instance, event_id=event_id, start_time=start_time: self.open_edit_event_modal(event_id, start_time)
         )
         
         # Add widgets to the event box
@@ -190,42 +190,35 @@ class DailyView(Screen):  # Change inheritance to Screen
         container = self.ids['event_list']
         container.add_widget(event_box)
 
-    def open_edit_event_modal(self, event_id):
+    def open_edit_event_modal(self, event_id, occurrence=None):
         """
         Open the Edit Event modal for the selected event.
         """
         from screens.editEvent import EditEventModal  # Import here to avoid circular imports
 
-        edit_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_events)
+        edit_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_events, occurrence=occurrence)
         edit_modal.open()
 
     def populate_daily_events(self):
         """Retrieve and display events for the selected day."""
-        try:
-            session = db.get_session()
-            
-            # Query events for the selected day
-            stmt = select(Event_).where(
-                extract("year", Event_.start_time) == self.selected_date.year,
-                extract("month", Event_.start_time) == self.selected_date.month,
-                extract("day", Event_.start_time) == self.selected_date.day
-            )
-            events = session.scalars(stmt).all()
-
-            # Sort events by start time
-            events.sort(key=lambda event: event.start_time)
-
-            # Clear the current event list
-            events_list = self.ids['event_list']
-            events_list.clear_widgets()
-
-            # Populate events in the list
-            for event in events:
-                event_box = EventBox()
-                event_box.add_widget(Label(text=f"{event.start_time.strftime('%H:%M')} - {event.name}"))
-                events_list.add_widget(event_box)
-            
-            session.close()
-        
-        except Exception as e:
-            print(e)
+        # Query events for the selected day (sorted by start time) in the background
+        if self.events_job:
+            self.events_job.cancel()
+
+        selected_date = self.selected_date
+        self.events_job = db_executor.submit(
+            lambda session: event_cache.day(selected_date),
+            on_result=self.list_daily_events
+        )
+
+    def list_daily_events(self, events):
+        """Display the given events as simple labels."""
+        # Clear the current event list
+        events_list = self.ids['event_list']
+        events_list.clear_widgets()
+
+        # Populate events in the list
+        for event in events:
+            event_box = EventBox()
+            event_box.add_widget(Label(text=f"{event.start_time.strftime('%H:%M')} - {event.name}"))
+            events_list.add_widget(event_box)
@@ -10,6 +10,11 @@
 # - November 20, 2024: Implemented recurrence and fixed some bugs (Magaly Camacho)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 17, 2026: Invalidate the cached months touched by saves and deletes (BusyBee Team)
+# - October 17, 2026: Events are loaded, saved, and deleted on the database executor instead of the UI thread (BusyBee Team)
+# - October 17, 2026: Recurring events are saved and deleted as this occurrence, this and following, or the entire series (BusyBee Team)
+# - October 17, 2026: Changing the repeat rule reconciles the existing series instead of adding a new one (BusyBee Team)
+# - October 17, 2026: Deleting from a virtual series applies to the occurrence that was clicked, not its first (BusyBee Team)
 #
 # Preconditions:
 # - Kivy framework must be installed and configured properly.
@@ -40,7 +45,10 @@ from database import get_database  # To connect to the database
 from sqlalchemy import select  # To query the database
 from sqlalchemy.orm import Session  # for typing
 from datetime import datetime  # For event date and time
-from screens.usefulwidgets import DatePicker, RepeatOptionsModal  # Additional modals
+from screens.usefulwidgets import DatePicker, RepeatOptionsModal, SeriesScopeModal  # Additional modals
+from Services import get_event_cache  # To invalidate cached months
+from Services.seriesOperations import SeriesScope, delete_series, update_series, reconcile_series, first_is_deletable  # To change a whole series at once
+from Services.dbExecutor import get_db_executor  # To use the database in the background
 from kivy.metrics import dp  # For consistent spacing and sizing
 from kivy.app import App  # Access the app instance for global styles
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
@@ -49,16 +57,22 @@ from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 class UniformButton(Button):
     pass
 
-db = get_database(debug=True)  # Get the database connection
+db = get_database()  # Get the shared database connection
 
 
 class EditEventModal(ModalView):
-    def __init__(self, event_id=None, refresh_callback=None, **kwargs):
+    def __init__(self, event_id=None, refresh_callback=None, occurrence=None, **kwargs):
         super().__init__(**kwargs)
         self.event_id = event_id  # Store the event ID for loading
+        self.occurrence = occurrence  # Start time of the clicked occurrence (occurrences of a virtual series share an ID)
+        self.first_time = None  # Start time of the stored event (set once loaded)
         self.size_hint = (0.95, 0.5)
         self.auto_dismiss = False
         self.refresh_callback = refresh_callback  # Store the refresh callback
+        self.in_series = False  # Whether the event is part of a recurrence (set once loaded)
+        self.virtual = False  # Whether that recurrence is virtual (set once loaded)
+        self.frequency = None  # Loaded recurrence frequency, kept unless another repeat option is picked
+        self.times = None  # Loaded recurrence times
 
         # Access app-wide styles
         app = App.get_running_app()
@@ -146,23 +160,53 @@ class EditEventModal(ModalView):
             self.load_event(event_id)
 
     def load_event(self, event_id):
-        """Load event data into fields for editing."""
-        with db.get_session() as session, session.begin():
+        """Load event data into fields for editing (queried in the background)."""
+        def load(session):
+            """Return the event's display values, or None if it doesn't exist (runs on the database executor)"""
             event = session.query(Event_).filter_by(id=event_id).first()
-            if event:
-                # Populate the title and notes fields
-                self.title_input.text = event.name
-                self.notes_input.text = event.notes
-                # Format and display the event start time
-                self.event_date_label.text = f"Event Date: {event.start_time.strftime('%Y-%m-%d %H:%M')}" if event.start_time else "Pick a date & time"
-
-                # Get recurrence info
-                if event.recurrence_id:
-                    recurrence: Recurrence = event.recurrence
-                    self.repeat_button.text = Frequency.enum2str(recurrence.frequency)
-
-                    if not Frequency.is_no_repeat(recurrence.frequency):
-                        self.repeat_button.text += f" ({recurrence.times} times)"
+            if not event:
+                return None
+            
+            recurrence: Recurrence = event.recurrence
+            return {
+                "name": event.name,
+                "notes": event.notes,
+                "start_time": event.start_time,
+                "frequency": recurrence.frequency if recurrence else None,
+                "times": recurrence.times if recurrence else None,
+                "recurrence_id": event.recurrence_id,
+                "virtual": bool(recurrence and recurrence.virtual),
+            }
+
+        get_db_executor().submit(load, on_result=self.show_event)
+
+    def show_event(self, values):
+        """Populate the fields with the loaded event values."""
+        if not values:
+            return
+
+        # Remember whether saves and deletes have to ask which part of the series to change
+        self.in_series = values["recurrence_id"] is not None
+        self.virtual = values["virtual"]
+        self.frequency = values["frequency"]
+        self.times = values["times"]
+        self.first_time = values["start_time"]
+        if self.occurrence is None:  # opened without a clicked occurrence, e.g. from search
+            self.occurrence = self.first_time
+
+        # Populate the title and notes fields
+        self.title_input.text = values["name"]
+        self.notes_input.text = values["notes"]
+        # Format and display the event start time
+        self.event_date_label.text = f"Event Date: {values['start_time'].strftime('%Y-%m-%d %H:%M')}" if values["start_time"] else "Pick a date & time"
+
+        # Get recurrence info
+        if values["frequency"]:
+            self.repeat_button.text = Frequency.enum2str(values["frequency"])
+
+            if not Frequency.is_no_repeat(values["frequency"]):
+                self.repeat_button.text += f" ({values['times']} times)"
+
     def save_event(self, *args):
         """Save the event, updating if it exists or creating a new one."""
         if not self.title_input.text:
@@ -175,52 +219,57 @@ class EditEventModal(ModalView):
         start_time = (" ").join(self.event_date_label.text.split(" ")[2:]) if "Event Date:" in self.event_date_label.text else None # remove "Event Date:"
         start_time = datetime.strptime(start_time, "%Y-%m-%d %H:%M") if start_time else None
         repeat_info = self.repeat_button.text.split(" ")
-        frequency = None if len(repeat_info) == 2 else Frequency.str2enum(repeat_info[1]) # None if "Doesn't Repeat"
-        times = None if len(repeat_info) == 2 else int(repeat_info[2]) # None if "Doesn't repeat"
+        if len(repeat_info) == 4: # "Repeats <frequency> <times> times" was picked
+            frequency = Frequency.str2enum(repeat_info[1])
+            times = int(repeat_info[2])
+        elif self.repeat_button.text == Frequency.frequency_options()[0]: # "Never Repeats" was picked
+            frequency, times = None, None
+        else: # unchanged
+            frequency, times = self.frequency, self.times
+
+        def save(scope):
+            """Save in the background, then refresh and close"""
+            get_db_executor().submit(
+                lambda session: self.save_to_database(session, name, notes, start_time, frequency, times, scope),
+                on_result=lambda result: self.refresh_and_close()
+            )
+
+        # A virtual series is one stored event, so it can only be changed as a whole
+        if self.in_series and not self.virtual:
+            SeriesScopeModal("Save recurring event", on_choice=save).open()
+        else:
+            save(SeriesScope.ALL if self.virtual else SeriesScope.THIS)
+
+    def save_to_database(self, session:Session, name, notes, start_time, frequency, times, scope=SeriesScope.THIS):
+        """Update the event (or create it), reconciling its series if the repeat rule changed (runs on the database executor)."""
+        touched_dates = [start_time] # dates whose cached months are changed by this save
+        touches_all = False # whether a virtual recurrence is changed (it can reach any month)
 
-        with db.get_session() as session, session.begin():
+        with session.begin():
             if self.event_id:
                 event = session.scalar(select(Event_).where(Event_.id == self.event_id)) # get event from database
                 # Update existing event
                 if event:
+                    touched_dates.append(event.start_time)
+                    touches_all = bool(event.recurrence_id and (event.recurrence.virtual or scope != SeriesScope.THIS))
+
+                    # Rename the other events in scope with one UPDATE (before the start time changes, it decides what "following" means)
+                    if scope != SeriesScope.THIS:
+                        update_series(session, event.id, scope, name=name, notes=notes)
+
+                    old_rule = (event.recurrence.frequency, event.recurrence.times) if event.recurrence_id else (None, None)
+
                     event.name = name
                     event.notes = notes
                     event.start_time = start_time
 
-                    make_new_recurrence = False # assume new recurrence isn't needed
-
-                    # New recurrence might be needed if times and frequency was given
-                    if times and frequency:
-                        # if event has recurrence, new recurrence is need if it doesn't match existing one
-                        if event.recurrence_id: 
-                            recurrence = event.recurrence
-                            if times != recurrence.times or frequency != recurrence.frequency:
-                                make_new_recurrence = True
-                    
-                        else: # if event doesn't have recurrence and recurrence info was given, make new recurrence
-                            make_new_recurrence = True
-                    
-                    # Make new recurrence if needed
-                    if make_new_recurrence:
-                        new_recurrence_id = self.save_recurrence(frequency, times, session=session)
-                        event.recurrence_id = new_recurrence_id
-
-                        # create other events
-                        current_date = start_time
-                        for _ in range(times - 1):
-                            new_date = frequency.get_next_date(current_date, start_time)
-
-                            # create event with same info as edited event
-                            event_i = Event_(
-                                name=name,
-                                notes=notes,
-                                start_time=new_date,
-                                recurrence_id=new_recurrence_id
-                            )
-                            print(event_i)
-
-                            current_date = new_date # save date to calculate next one
-                            session.add(event_i)
+                    # Apply a changed repeat rule to the series, only changing the occurrences that differ
+                    new_rule = (frequency, times) if frequency is not None and times is not None and not Frequency.is_no_repeat(frequency) else (None, None)
+                    if new_rule != old_rule:
+                        session.flush() # so the series starts from the new start time if it's now first
+                        changes = reconcile_series(session, event.id, *new_rule)
+                        touched_dates += changes.dates
+                        touches_all = touches_all or changes.virtual
 
                 else:
                     print(f"No event found with ID {self.event_id}.")
@@ -228,9 +277,15 @@ class EditEventModal(ModalView):
                 # Create a new event only if no event_id was provided
                 event = Event_(name=name, notes=notes, start_time=start_time)
                 session.add(event)
-                session.commit()
 
-        # Refresh the calendar after saving if callback is provided
+        # Forget cached months that changed
+        if touches_all:
+            get_event_cache().invalidate_all()
+        else:
+            get_event_cache().invalidate(touched_dates)
+
+    def refresh_and_close(self):
+        """Refresh the calendar if a callback was provided, then close the modal."""
         if self.refresh_callback:
             print("Refreshing")
             self.refresh_callback()
@@ -238,19 +293,40 @@ class EditEventModal(ModalView):
         self.cancel_and_close()
 
     def delete_event(self, *args):
-        """Delete the event from the database."""
+        """Delete the event from the database (in the background)."""
         if self.event_id:
-            with db.get_session() as session, session.begin():
-                event = session.query(Event_).filter_by(id=self.event_id).first()
-                if event:
-                    session.delete(event)
-            print(f"Event with ID {self.event_id} deleted.")
+            event_id = self.event_id
+            occurrence = self.occurrence
+
+            def delete(session, scope):
+                """Delete the event(s) and forget the cached months they changed (runs on the database executor)"""
+                with session.begin():
+                    event = session.query(Event_).filter_by(id=event_id).first()
+                    if not event:
+                        return
+                    touches_all = bool(event.recurrence_id and (event.recurrence.virtual or scope != SeriesScope.THIS))
+                    deleted_date = event.start_time
+                    session.expunge(event) # deleted with set-based statements, not by the ORM
+                    deleted = delete_series(session, event_id, scope, occurrence)
+                print(f"Deleted {deleted} event(s) starting from ID {event_id}.")
+
+                # Forget cached months that changed
+                if touches_all:
+                    get_event_cache().invalidate_all()
+                else:
+                    get_event_cache().invalidate([deleted_date])
 
-            # Call the refresh callback to update the event list after deletion
-            if self.refresh_callback:
-                self.refresh_callback()
+            def submit(scope):
+                """Delete in the background, then call the refresh callback to update the event list"""
+                get_db_executor().submit(lambda session: delete(session, scope), on_result=lambda result: self.refresh_and_close())
 
-            self.cancel_and_close()
+            # Ask which part of a series to delete (only a virtual series' first occurrence can be deleted on its own)
+            if self.in_series and self.virtual and (self.occurrence != self.first_time or not first_is_deletable(self.frequency, self.first_time)):
+                SeriesScopeModal("Delete recurring event", on_choice=submit, scopes=[SeriesScope.FOLLOWING, SeriesScope.ALL]).open()
+            elif self.in_series:
+                SeriesScopeModal("Delete recurring event", on_choice=submit).open()
+            else:
+                submit(SeriesScope.THIS)
 
     def open_date_picker(self, instance):
         """Open the DatePicker modal to select a date and time."""
@@ -260,24 +336,6 @@ class EditEventModal(ModalView):
         """Open the RepeatOptionsModal to choose a repeat option."""
         RepeatOptionsModal(self).open()
 
-    def save_recurrence(self, frequency:Frequency, times:int, session:Session) -> int:
-        """
-        Adds the given recurrence to the given session and returns its id
-        
-        Parameters:
-            frequency (Frequency): the frequency of the recurrence (daily, weekly, monthly, yearly)
-            times (int): the number of times to repeat the event 
-            session (Session): the session to add the recurrence to
-
-        Returns:
-            int: the id of the new recurrence
-        """
-        recurrence = Recurrence(times=times, frequency=frequency)
-        session.add(recurrence) 
-        session.flush() # assigns id without needing to commiting (in case of a rollback)
-        
-        return recurrence.id
-    
     def update_background(self, *args):
         """Update the size and position of the background rectangle."""
         self.bg_rect.pos = self.pos
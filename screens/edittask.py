@@ -11,6 +11,10 @@
 # - November 23, 2024: Modified the initilization, the load_task and save_task functions to handle recurrence (Matthew McManness)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 17, 2026: Categories and tasks are loaded, saved, and deleted on the database executor instead of the UI thread (BusyBee Team)
+# - October 17, 2026: Recurring tasks are saved and deleted as this occurrence, this and following, or the entire series (BusyBee Team)
+# - October 17, 2026: Changing the repeat rule reconciles the task's series instead of only changing the rule (BusyBee Team)
+# - October 17, 2026: Saving a task that was deleted in the meantime prints that it wasn't found instead of failing (BusyBee Team)
 #
 # Preconditions:
 # - Kivy framework must be installed and configured properly.
@@ -37,15 +41,16 @@ from kivy.uix.textinput import TextInput  # Input fields for user text
 from kivy.uix.spinner import Spinner  # Dropdown-style component
 from kivy.uix.button import Button  # Standard button widget
 from screens.usefulwidgets import DatePicker # Date picker
-from screens.usefulwidgets import RepeatOptionsModal, PriorityOptionsModal, CategoryModal  # Additional modals
+from screens.usefulwidgets import RepeatOptionsModal, PriorityOptionsModal, CategoryModal, SeriesScopeModal  # Additional modals
 from kivy.uix.label import Label  # Label widget for displaying text
 from kivy.app import App  # Ensure App is imported
 from Models import Task, Category # Task and Category classes
-from Models.databaseEnums import Priority # for tasl priorities
+from Models.databaseEnums import Priority, Frequency # for tasl priorities, frequency for recurrence
 from database import get_database # to connect to database
 from sqlalchemy import select # to query database
 from datetime import datetime # for Task.due_date
-from Models import Recurrence  # Import the Recurrence model
+from Services.dbExecutor import get_db_executor  # To use the database in the background
+from Services.seriesOperations import SeriesScope, delete_series, update_series, reconcile_series  # To change a whole series at once
 from kivy.metrics import dp  # Import dp for density-independent pixel values
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 
@@ -82,17 +87,16 @@ class EditTaskModal(ModalView):
         self.auto_dismiss = False
         self.refresh_callback = refresh_callback  # Store the refresh callback
         self.recurrence = None  # Placeholder for recurrence information
+        self.in_series = False  # Whether the task is part of a recurrence (set once loaded)
+        self.virtual = False  # Whether that recurrence is virtual (set once loaded)
 
 
         # Access app-wide styles
         app = App.get_running_app()
 
-        # Load categories
-        with db.get_session() as session, session.begin():
-            stmt = select(Category).where(True)
-            results = session.scalars(stmt).all()
-            self.categories = [result.name for result in results]
-            self.categories_ids = [result.id for result in results]
+        # Categories (loaded in the background)
+        self.categories = []
+        self.categories_ids = []
 
         self.selected_categories = []
 
@@ -164,10 +168,24 @@ class EditTaskModal(ModalView):
 
         self.add_widget(layout)
 
+        # Load categories in the background
+        get_db_executor().submit(
+            lambda session: session.execute(select(Category.id, Category.name)).all(),
+            on_result=self.show_categories
+        )
+
         # Load existing task data if editing
         if task_id:
             self.load_task(task_id)
 
+    def show_categories(self, rows):
+        """Save the loaded (id, name) category rows and add them to the spinner."""
+        for category_id, name in rows:
+            if name not in self.categories: # might have been added while loading
+                self.categories.append(name)
+                self.categories_ids.append(category_id)
+        self.update_category_spinner()
+
     def load_task(self, task_id):
         """
         Load task data into fields for editing.
@@ -179,25 +197,42 @@ class EditTaskModal(ModalView):
             - The task's details are pre-filled in the modal fields.
             - If the task has recurrence, the recurrence details are loaded.
         """
-        with db.get_session() as session, session.begin():
+        def load(session):
+            """Return the task's display values, or None if it doesn't exist (runs on the database executor)"""
             task = session.query(Task).filter_by(id=task_id).first()
-            if task:
-                self.title_input.text = task.name
-                self.notes_input.text = task.notes
-                self.deadline_label.text = f"Deadline: {task.due_date.strftime('%Y-%m-%d %H:%M')}" if task.due_date else "Pick a deadline"
-                self.priority_button.text = Priority.get_str_and_color(task.priority)[0] if task.priority else "Pick Priority"
-                self.selected_categories = [category.name for category in task.categories]
-                self.update_applied_categories()
-
-                # Load recurrence if it exists
-                if task.recurrence:
-                    self.recurrence = {
-                        "frequency": task.recurrence.frequency,
-                        "times": task.recurrence.times
-                    }
-                    self.repeat_button.text = f"{task.recurrence.frequency.name.capitalize()} ({task.recurrence.times} times)"
-                else:
-                    self.recurrence = None
+            if not task:
+                return None
+
+            return {
+                "name": task.name,
+                "notes": task.notes,
+                "due_date": task.due_date,
+                "priority": task.priority,
+                "categories": [category.name for category in task.categories],
+                "recurrence": {"frequency": task.recurrence.frequency, "times": task.recurrence.times} if task.recurrence else None,
+                "virtual": bool(task.recurrence and task.recurrence.virtual),
+            }
+
+        get_db_executor().submit(load, on_result=self.show_task)
+
+    def show_task(self, values):
+        """Populate the fields with the loaded task values."""
+        if not values:
+            return
+
+        self.title_input.text = values["name"]
+        self.notes_input.text = values["notes"]
+        self.deadline_label.text = f"Deadline: {values['due_date'].strftime('%Y-%m-%d %H:%M')}" if values["due_date"] else "Pick a deadline"
+        self.priority_button.text = Priority.get_str_and_color(values["priority"])[0] if values["priority"] else "Pick Priority"
+        self.selected_categories = values["categories"]
+        self.update_applied_categories()
+
+        # Load recurrence if it exists
+        self.recurrence = values["recurrence"]
+        self.in_series = self.recurrence is not None
+        self.virtual = values["virtual"]
+        if self.recurrence:
+            self.repeat_button.text = f"{self.recurrence['frequency'].name.capitalize()} ({self.recurrence['times']} times)"
 
     def save_task(self, *args):
         """
@@ -219,61 +254,85 @@ class EditTaskModal(ModalView):
         due_date = datetime.strptime(due_date, "%Y-%m-%d %H:%M") if due_date else None
         priority = Priority.str2enum(self.priority_button.text) if "Pick Priority" != self.priority_button.text else None
 
-        # Retrieve category instances
-        selected_categories_ids = [cat_id for cat_id, cat in zip(self.categories_ids, self.categories) if cat in self.selected_categories]
+        # Get recurrence from the repeat button ("Repeats <frequency> <times> times") if another option was picked
+        repeat_info = self.repeat_button.text.split(" ")
+        if len(repeat_info) == 4:
+            recurrence = {"frequency": Frequency.str2enum(repeat_info[1]), "times": int(repeat_info[2])}
+        elif self.repeat_button.text == Frequency.frequency_options()[0]: # "Never Repeats"
+            recurrence = None
+        else: # unchanged
+            recurrence = self.recurrence
+
+        # Ensure a valid due_date is provided if recurrence is specified
+        if recurrence and not due_date:
+            print("Due date is required for recurring tasks.")
+            return
+
+        # Names of the selected categories (ids are looked up when saving, in case one was just added)
+        selected_categories = list(self.selected_categories)
+
+        def save(scope):
+            """Save in the background, then refresh and close"""
+            get_db_executor().submit(
+                lambda session: self.save_to_database(session, name, notes, due_date, priority, selected_categories, recurrence, scope),
+                on_result=self.show_saved_task
+            )
+
+        # A virtual series is one stored task, so it can only be changed as a whole
+        if self.in_series and not self.virtual:
+            SeriesScopeModal("Save recurring task", on_choice=save).open()
+        else:
+            save(SeriesScope.ALL if self.virtual else SeriesScope.THIS)
+
+    def save_to_database(self, session, name, notes, due_date, priority, selected_categories, recurrence=None, scope=SeriesScope.THIS):
+        """Update the task (or create it), reconciling its series if the repeat rule changed, and return its ID, or None if it no longer exists (runs on the database executor)."""
+        new_rule = (recurrence["frequency"], recurrence["times"]) if recurrence else (None, None)
 
-        with db.get_session() as session:
+        with session.begin():
+            categories = session.query(Category).filter(Category.name.in_(selected_categories)).all()
             if self.task_id:
                 task = session.query(Task).filter_by(id=self.task_id).first()
+                if not task:
+                    print(f"No task found with ID {self.task_id}.")
+                    return None
+
+                # Update the other tasks in scope with one statement per table (before the due date changes, it decides what "following" means)
+                if scope != SeriesScope.THIS:
+                    category_ids = [category.id for category in categories]
+                    update_series(session, task.id, scope, category_ids=category_ids, name=name, notes=notes, priority=priority)
+
+                old_rule = (task.recurrence.frequency, task.recurrence.times) if task.recurrence_id else (None, None)
+
                 task.name = name
                 task.notes = notes
                 task.due_date = due_date
                 task.priority = priority
-                task.categories = session.query(Category).filter(Category.id.in_(selected_categories_ids)).all()
-
-                # Update recurrence if it exists
-                if self.recurrence:
-                    if task.recurrence:
-                        task.recurrence.frequency = self.recurrence["frequency"]
-                        task.recurrence.times = self.recurrence["times"]
-                    else:
-                        recurrence = Recurrence(
-                            frequency=self.recurrence["frequency"],
-                            times=self.recurrence["times"]
-                        )
-                        session.add(recurrence)
-                        session.flush()  # Get recurrence ID
-                        task.recurrence_id = recurrence.id
-                else:
-                    task.recurrence = None  # Clear recurrence if none is selected
+                task.categories = categories
             else:
+                old_rule = (None, None)
                 task = Task(
                     name=name,
                     notes=notes,
                     due_date=due_date,
                     priority=priority
                 )
-                task.categories = session.query(Category).filter(Category.id.in_(selected_categories_ids)).all()
+                task.categories = categories
                 session.add(task)
-                session.flush()  # Get task ID immediately
 
-                # Add recurrence if specified
-                if self.recurrence:
-                    recurrence = Recurrence(
-                        frequency=self.recurrence["frequency"],
-                        times=self.recurrence["times"]
-                    )
-                    session.add(recurrence)
-                    session.flush()
-                    task.recurrence_id = recurrence.id
+            # Apply a changed repeat rule to the series, only changing the tasks that differ
+            if new_rule != old_rule:
+                session.flush()  # Get task ID, and the new due date decides where the series starts
+                reconcile_series(session, task.id, *new_rule)
 
-            # Commit the session
-            session.commit()
+        return task.id
 
+    def show_saved_task(self, task_id):
+        """Refresh the to-do list view if a callback is provided, then close the modal."""
         if self.refresh_callback:
             self.refresh_callback()
 
-        print(f"Task {'updated' if self.task_id else 'saved'} with ID: {self.task_id or task.id}")
+        if task_id is not None:
+            print(f"Task {'updated' if self.task_id else 'saved'} with ID: {task_id}")
         self.dismiss()
 
     def open_repeat_window(self, instance):
@@ -290,19 +349,32 @@ class EditTaskModal(ModalView):
 
 
     def delete_task(self, *args):
-        """Delete the task from the database."""
+        """Delete the task from the database (in the background)."""
         if self.task_id:
-            with db.get_session() as session, session.begin():
-                task = session.query(Task).filter_by(id=self.task_id).first()
-                if task:
-                    session.delete(task)
-            print(f"Task with ID {self.task_id} deleted.")
+            task_id = self.task_id
+
+            def delete(session, scope):
+                """Delete the task(s) with set-based statements (runs on the database executor)"""
+                with session.begin():
+                    deleted = delete_series(session, task_id, scope)
+                print(f"Deleted {deleted} task(s) starting from ID {task_id}.")
 
-            # Call the refresh callback to update the ToDoListView after deletion
-            if self.refresh_callback:
-                self.refresh_callback()
+            def submit(scope):
+                """Delete in the background, then refresh and close"""
+                get_db_executor().submit(lambda session: delete(session, scope), on_result=lambda result: self.refresh_and_close())
 
-            self.dismiss()
+            # Ask which part of a series to delete
+            if self.in_series:
+                SeriesScopeModal("Delete recurring task", on_choice=submit).open()
+            else:
+                submit(SeriesScope.THIS)
+
+    def refresh_and_close(self):
+        """Call the refresh callback to update the ToDoListView, then close the modal."""
+        if self.refresh_callback:
+            self.refresh_callback()
+
+        self.dismiss()
 
     def open_date_picker(self, instance):
         """Open the DatePicker modal to select a deadline."""
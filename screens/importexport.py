@@ -0,0 +1,282 @@
+# Prologue Comments:
+# Code Artifact: ImportModal, ExportModal, TaskCsvImportModal, and TaskCsvExportModal Class Definitions
+# Brief Description: This code defines the `ImportModal` and `ExportModal` classes, modals that import events and tasks from
+#                    an iCalendar (.ics) file and export them to one, and the `TaskCsvImportModal` and `TaskCsvExportModal`
+#                    classes, that do the same for tasks in a CSV file
+# Programmer: BusyBee Team
+# Date Created: October 17, 2026
+# Dates Revised:
+#   - October 17, 2026: Initial creation, imports on the database executor and shows its progress - [BusyBee Team]
+#   - October 17, 2026: Added ExportModal, both modals share FileModal's layout - [BusyBee Team]
+#   - October 17, 2026: Added TaskCsvImportModal and TaskCsvExportModal - [BusyBee Team]
+#   - October 17, 2026: Files are imported and exported on the file executor, so the other screens keep loading - [BusyBee Team]
+#   - October 17, 2026: FileModal takes the work to run as an argument instead of a run() each subclass overrides - [BusyBee Team]
+#   - October 17, 2026: The import invalidates the event cache itself, right after its last commit - [BusyBee Team]
+# Preconditions:
+#   - This class should be used in the Kivy application, with the "calendar", "daily", and "todo" screens.
+# Postconditions:
+#   - Imported events and tasks are saved and the calendar and to-do list refreshed, exported ones are written to the file.
+# Error and Exception Conditions:
+#   - A file that can't be read or written, or a database error, is shown in the modal's status.
+# Side Effects:
+#   - Importing invalidates the event cache, exporting creates or overwrites the file.
+# Known Faults:
+#   - The path has to be typed in, there is no file browser.
+
+from kivy.uix.modalview import ModalView
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.textinput import TextInput
+from kivy.uix.progressbar import ProgressBar
+from kivy.uix.button import Button
+from kivy.metrics import dp
+from kivy.app import App
+from kivy.graphics import Color, RoundedRectangle
+from database import get_database
+from Services import get_event_cache
+from Services.dbExecutor import get_file_executor, kivy_dispatch
+from Services.icsImport import IcsImporter
+from Services.icsExport import IcsExporter
+from Services.taskCsv import TaskCsvImporter, export_tasks
+import os
+
+# Rejected rows listed in the CSV import modal (all of them are printed to the console)
+SHOWN_REJECTED = 3
+
+class UniformButton(Button):
+    pass
+
+def import_calendar(path, on_progress):
+    """Import an .ics file, committing each chunk, then forget the cached months (once the last chunk is committed)."""
+    try:
+        return IcsImporter(get_database()).import_file(path, on_progress=on_progress)
+    finally:
+        # on the thread that committed, so it's after every write (a month still loading isn't stored, see EventCache)
+        get_event_cache().invalidate_all()
+
+def export_calendar(path, on_progress):
+    """Export every event and task to an .ics file."""
+    return IcsExporter(get_database()).export_file(path, on_progress=on_progress)
+
+def import_task_csv(path, on_progress):
+    """Import tasks from a CSV file, committing each chunk."""
+    return TaskCsvImporter(get_database()).import_file(path, on_progress=on_progress)
+
+def export_task_csv(path, on_progress):
+    """Export every task to a CSV file, returns how many were written (no progress until it's done)."""
+    return export_tasks(get_database(), path)
+
+class FileModal(ModalView):
+    """A modal with a path input, a progress bar, and a status, that runs a file import or export in the background."""
+
+    def __init__(self, title, action, job, path="", **kwargs):
+        """
+        Initializes the FileModal.
+
+        Args:
+            title (str): The title shown at the top of the modal.
+            action (str): The text of the button that starts the work.
+            job (callable): Called with the path and an on_progress callback on the file executor's thread, returns the stats shown.
+            path (str): The path the input starts with.
+            **kwargs: Additional keyword arguments passed to the superclass.
+        """
+        super().__init__(**kwargs)
+        self.size_hint = (0.8, 0.5)  # Set modal size
+        self.auto_dismiss = False  # Keep open while working
+        self.working = False
+        self.job = job  # The import or export
+
+        # Access app-wide styles
+        app = App.get_running_app()
+
+        layout = BoxLayout(orientation='vertical', padding=10, spacing=10)
+
+        # Add a custom background color with rounded corners
+        with layout.canvas.before:
+            Color(rgba=app.Background_Color)
+            self.bg_rect = RoundedRectangle(pos=layout.pos, size=layout.size, radius=[dp(20)])
+        layout.bind(pos=self.update_background, size=self.update_background)
+
+        layout.add_widget(Label(text=title, font_size=app.title_font_size, color=app.Title_Color))
+
+        # Path of the file
+        self.path_input = TextInput(text=path, hint_text="Path to .ics file", multiline=False, size_hint_y=None, height=dp(40))
+        layout.add_widget(self.path_input)
+
+        # Progress and what was done so far
+        self.progress_bar = ProgressBar(max=1, value=0, size_hint_y=None, height=dp(20))
+        layout.add_widget(self.progress_bar)
+        self.status_label = Label(text="", font_size=app.label_font_size, color=app.Text_Color)
+        layout.add_widget(self.status_label)
+
+        # Buttons
+        buttons = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        self.action_button = UniformButton(text=action, on_release=self.start)
+        self.close_button = UniformButton(text="CLOSE", on_release=self.dismiss)
+        buttons.add_widget(self.action_button)
+        buttons.add_widget(self.close_button)
+        layout.add_widget(buttons)
+
+        self.add_widget(layout)
+
+    def update_background(self, *args):
+        """Update the size and position of the background rectangle."""
+        self.bg_rect.pos = args[0].pos
+        self.bg_rect.size = args[0].size
+
+    def start(self, instance):
+        """Check the path, then run the work on the file executor, reporting progress as it goes."""
+        path = os.path.expanduser(self.path_input.text.strip())
+        if self.working:
+            return
+        problem = self.check_path(path)
+        if problem:
+            self.status_label.text = problem
+            return
+
+        self.working = True
+        self.action_button.disabled = True
+        self.close_button.disabled = True
+        self.progress_bar.value = 0
+        self.status_label.text = "Working..."
+
+        on_progress = lambda stats: kivy_dispatch(lambda: self.show_progress(stats))
+        get_file_executor().submit(
+            lambda session: self.job(path, on_progress),
+            on_result=self.finish,
+            on_error=self.failed
+        )
+
+    def check_path(self, path):
+        """Returns why the path can't be used, or None if it can (on the UI thread)."""
+        return None
+
+    def show_progress(self, stats):
+        """Show how far along the work is (on the UI thread)."""
+        self.progress_bar.value = stats.progress
+
+    def finish(self, stats):
+        """Show the totals once the work is done."""
+        self.show_progress(stats)
+        self.stop_working()
+
+    def failed(self, error):
+        """Show the error."""
+        print(f"{self.action_button.text.title()} error: {error!r}")
+        self.status_label.text = f"Stopped: {error}"
+        self.stop_working()
+
+    def stop_working(self):
+        """Re-enable the buttons."""
+        self.working = False
+        self.action_button.disabled = False
+        self.close_button.disabled = False
+
+
+class ImportModal(FileModal):
+    """A modal that imports an .ics file in the background, with a progress bar."""
+
+    def __init__(self, **kwargs):
+        """Initializes the ImportModal."""
+        super().__init__("Import Calendar (.ics)", "IMPORT", import_calendar, **kwargs)
+
+    def check_path(self, path):
+        """The file has to exist."""
+        return None if os.path.isfile(path) else "File not found"
+
+    def show_progress(self, stats):
+        """Show how far through the file the import is."""
+        super().show_progress(stats)
+        self.status_label.text = f"{stats.events} events, {stats.tasks} tasks ({stats.events_per_second:.0f} per second)"
+
+    def finish(self, stats):
+        """Show the totals and refresh the views."""
+        super().finish(stats)
+        self.status_label.text += f"\nDone in {stats.seconds:.1f} s, {stats.skipped} skipped, {stats.simplified_rules} repeat rules simplified"
+        self.refresh_views()
+
+    def failed(self, error):
+        """Show the error, and refresh the views since chunks before it were committed."""
+        super().failed(error)
+        self.refresh_views()
+
+    def refresh_views(self):
+        """Show the imported events and tasks (the import already invalidated the event cache)."""
+        app = App.get_running_app()
+        app.screen_manager.get_screen('calendar').refresh_calendar()
+        if app.screen_manager.current == 'daily':
+            app.screen_manager.get_screen('daily').refresh_events()
+        app.screen_manager.get_screen('todo').refresh_tasks()
+
+
+class ExportModal(FileModal):
+    """A modal that exports every event and task to an .ics file in the background, with a progress bar."""
+
+    def __init__(self, **kwargs):
+        """Initializes the ExportModal, suggesting busybee.ics in the home directory."""
+        super().__init__("Export Calendar (.ics)", "EXPORT", export_calendar, path=os.path.join("~", "busybee.ics"), **kwargs)
+
+    def check_path(self, path):
+        """The file's directory has to exist."""
+        return None if os.path.isdir(os.path.dirname(os.path.abspath(path))) else "Folder not found"
+
+    def show_progress(self, stats):
+        """Show how many items have been exported."""
+        super().show_progress(stats)
+        self.status_label.text = f"{stats.items} of {stats.total_items} items ({stats.items_per_second:.0f} per second)"
+
+    def finish(self, stats):
+        """Show the totals."""
+        super().finish(stats)
+        self.status_label.text += f"\nDone in {stats.seconds:.1f} s, {stats.collapsed} series saved as repeat rules"
+
+
+class TaskCsvImportModal(FileModal):
+    """A modal that imports tasks from a CSV file in the background, listing the rows it rejected."""
+
+    def __init__(self, **kwargs):
+        """Initializes the TaskCsvImportModal."""
+        super().__init__("Import Tasks (.csv)", "IMPORT", import_task_csv, **kwargs)
+        self.path_input.hint_text = "Path to .csv file (name, notes, due_date, priority, complete, categories)"
+
+    def check_path(self, path):
+        """The file has to exist."""
+        return None if os.path.isfile(path) else "File not found"
+
+    def show_progress(self, stats):
+        """Show how far through the file the import is."""
+        super().show_progress(stats)
+        self.status_label.text = f"{stats.imported} tasks imported, {stats.rejected_count} rejected ({stats.rows_per_second:.0f} rows per second)"
+
+    def finish(self, stats):
+        """Show the totals and the first rejected rows, print every kept rejected row, and refresh the to-do list."""
+        super().finish(stats)
+        self.status_label.text += f"\nDone in {stats.seconds:.1f} s, {stats.categories_created} categories created"
+        if stats.rejected:
+            shown = ", ".join(f"line {row.line} ({row.reason})" for row in stats.rejected[:SHOWN_REJECTED])
+            self.status_label.text += f"\nRejected: {shown}"
+            for row in stats.rejected:
+                print(f"CSV import rejected line {row.line}: {row.reason}")
+        App.get_running_app().screen_manager.get_screen('todo').refresh_tasks()
+
+    def failed(self, error):
+        """Show the error, and refresh the to-do list since chunks before it were committed."""
+        super().failed(error)
+        App.get_running_app().screen_manager.get_screen('todo').refresh_tasks()
+
+
+class TaskCsvExportModal(FileModal):
+    """A modal that exports every task to a CSV file in the background."""
+
+    def __init__(self, **kwargs):
+        """Initializes the TaskCsvExportModal, suggesting busybee_tasks.csv in the home directory."""
+        super().__init__("Export Tasks (.csv)", "EXPORT", export_task_csv, path=os.path.join("~", "busybee_tasks.csv"), **kwargs)
+
+    def check_path(self, path):
+        """The file's directory has to exist."""
+        return None if os.path.isdir(os.path.dirname(os.path.abspath(path))) else "Folder not found"
+
+    def show_progress(self, count):
+        """Show how many tasks were exported (only once it's done)."""
+        self.progress_bar.value = 1
+        self.status_label.text = f"{count} tasks exported"
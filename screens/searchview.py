@@ -0,0 +1,150 @@
+# Prologue Comments:
+# Code Artifact: SearchView Class Definition
+# Brief Description: This code defines the `SearchView` class, a screen that searches event and task names and notes as the user types
+# Programmer: BusyBee Team
+# Date Created: October 17, 2026
+# Dates Revised:
+#   - October 17, 2026: Initial creation, searches on the database executor after the user stops typing - [BusyBee Team]
+# Preconditions:
+#   - This class should be part of a ScreenManager in the Kivy application, with the "calendar" and "todo" screens.
+#   - The database must be migrated (the Item_Search full-text index must exist).
+# Postconditions:
+#   - Matching events and tasks are listed, best matches first.
+# Error and Exception Conditions:
+#   - Database errors are printed to the console by the database executor.
+# Side Effects:
+#   - Opens the edit modals for the chosen result.
+# Known Faults:
+#   - Only the first occurrence of a virtual recurrence is listed.
+
+from kivy.uix.screenmanager import Screen
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.button import Button
+from kivy.metrics import dp
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
+from database import get_database
+from Models.databaseEnums import ItemType
+from Services.itemSearch import ItemSearch
+from Services.dbExecutor import get_db_executor
+
+item_search = ItemSearch(get_database())
+db_executor = get_db_executor()
+
+# Seconds to wait after the last key press before searching
+DEBOUNCE_SECONDS = 0.15
+
+class UniformButton(Button):
+    pass
+class EditButton(UniformButton):
+    pass
+
+class ResultBox(BoxLayout):
+    """A BoxLayout to hold a search result"""
+
+    def __init__(self, **kwargs):
+        """Initialize the ResultBox"""
+        super().__init__(**kwargs)  # Initialize BoxLayout class
+        app = App.get_running_app()
+        # Initialize size of ResultBox and give it the event box color
+        with self.canvas.before:
+            Color(*app.Event_Box)
+            self.rect = Rectangle(size=self.size, pos=self.pos)
+
+        # When ResultBox is updated, make sure size is correct
+        self.bind(size=self.update_rect, pos=self.update_rect)
+
+    def update_rect(self, *args):
+        """Update rectangle to match the size and position of the ResultBox"""
+        self.rect.pos = self.pos
+        self.rect.size = self.size
+
+class SearchView(Screen):
+    search_event = None  # Scheduled (debounced) search
+    search_job = None  # Background search, only the latest one matters
+
+    def on_search_text(self, text):
+        """Search for the text once the user stops typing for DEBOUNCE_SECONDS."""
+        if self.search_event:
+            self.search_event.cancel()
+        self.search_event = Clock.schedule_once(lambda dt: self.run_search(text), DEBOUNCE_SECONDS)
+
+    def run_search(self, text):
+        """Search in the background, then display the results."""
+        if self.search_job:
+            self.search_job.cancel()
+
+        self.search_job = db_executor.submit(
+            lambda session: item_search.search(text),
+            on_result=lambda results: self.display_results(text, results)
+        )
+
+    def refresh_results(self):
+        """Search again for the current text (after a result was edited or deleted)."""
+        self.run_search(self.ids.search_input.text)
+
+    def display_results(self, text, results):
+        """
+        Display the search results in the `result_list`.
+        """
+        container = self.ids['result_list']
+        container.clear_widgets()  # Clear existing widgets
+        app = App.get_running_app()
+
+        if not results:
+            # Only say nothing matched if something was typed
+            message = "No matches." if text.strip() else "Type to search events and tasks."
+            container.add_widget(Label(text=message, size_hint_y=None, height=dp(40), color=app.Text_Color))
+            return
+
+        for result in results:
+            self.add_result(result)
+
+    def add_result(self, result):
+        """
+        Add a single search result to the container.
+        """
+        app = App.get_running_app()
+        result_box = ResultBox(orientation='horizontal', size_hint_y=None, height=dp(50), spacing=dp(5), padding=dp(10))
+
+        # Clip name if it's too long
+        name = result.name
+        max_char = 55
+        if len(name) > max_char:
+            name = name[:max_char] + "..."
+
+        # Display whether it's an event or task, its date, and its name
+        kind = "Event" if result.type == ItemType.EVENT else "Task"
+        when = result.when.strftime('%Y-%m-%d %H:%M') if result.when else "-"
+        result_box.add_widget(Label(text=kind, size_hint_x=None, width=dp(60), color=app.Text_Color))
+        result_box.add_widget(Label(text=when, size_hint_x=None, width=dp(140), color=app.Text_Color))
+        result_box.add_widget(Label(text=name, color=app.Text_Color))
+
+        edit_button = EditButton(
+            text="Edit",
+            on_press=lambda instance, result=result: self.open_edit_modal(result)
+        )
+        result_box.add_widget(edit_button)
+
+        self.ids['result_list'].add_widget(result_box)
+
+    def open_edit_modal(self, result):
+        """
+        Open the Edit Event or Edit Task modal for the selected result.
+        """
+        from screens.editEvent import EditEventModal  # Import here to avoid circular imports
+        from screens.edittask import EditTaskModal
+
+        if result.type == ItemType.EVENT:
+            modal = EditEventModal(event_id=result.id, refresh_callback=self.refresh_after_edit)
+        else:
+            modal = EditTaskModal(task_id=result.id, refresh_callback=self.refresh_after_edit)
+        modal.open()
+
+    def refresh_after_edit(self):
+        """Refresh the results, calendar, and to-do list after a result was edited or deleted."""
+        self.refresh_results()
+        self.manager.get_screen('calendar').refresh_calendar()
+        self.manager.get_screen('todo').refresh_tasks()
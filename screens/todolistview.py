@@ -20,6 +20,12 @@
 #   - December 07, 2024: Implemented variables for ease of UI modification - [Matthew McManness]
 #   - December 08, 2024: Removed update_task_order since we do not need that based on our requirements - [Manvir Kaur]
 #   - December 08, 2024: Theme toggling (Magaly Camacho)
+#   - October 17, 2026: Tasks are loaded and saved on the database executor instead of the UI thread - [BusyBee Team]
+#   - October 17, 2026: Task lists come from TaskRepository, which loads all categories in one query instead of one per task - [BusyBee Team]
+#   - October 17, 2026: Task lists are loaded as TaskRecords (only the displayed columns) instead of Task entities - [BusyBee Team]
+#   - October 17, 2026: Added the "Archived" filter, listing archived tasks (read-only) from the archive database - [BusyBee Team]
+#   - October 17, 2026: Sorted tasks are loaded a page at a time (keyset pagination), the next page when the list is scrolled near its end - [BusyBee Team]
+#   - October 17, 2026: Removed the SQLAlchemy and Category imports left unused since the queries moved to TaskRepository - [BusyBee Team]
 #  - [Insert Further Revisions]: [Brief description of changes] - [Your Name]
 # Preconditions:
 #   - This class should be part of a ScreenManager in the Kivy application to function correctly.
@@ -48,18 +54,21 @@ from kivy.uix.label import Label  # label widget to display text
 from kivy.graphics import Color, Rectangle  # to control color and size of task background
 from kivy.properties import ObjectProperty
 from database import get_database  # to connect to database
-from sqlalchemy import select  # to query database
 from Models import Task  # task model class
 from Models.databaseEnums import Priority  # for Task.priority
 from kivy.app import App
 from kivy.uix.dropdown import DropDown
-from sqlalchemy.orm import aliased
-from sqlalchemy.sql import func
-from Models import Category  # Ensure the Category model is imported
-from sqlalchemy.sql import case
+from kivy.clock import Clock
+from Services.taskRepository import TaskRepository  # task list queries
 from kivy.uix.button import Button
+from Services.dbExecutor import get_db_executor  # background database work
+from Services.archive import archived_task_records  # archived tasks, only read when asked for
 
 db = get_database()  # get database
+db_executor = get_db_executor()  # to load and save tasks in the background
+
+# The next page of tasks is loaded once the list is scrolled this close to its end (scroll_y is 0 at the bottom)
+NEXT_PAGE_SCROLL_Y = 0.1
 
 class UniformButton(Button):
     pass
@@ -158,6 +167,9 @@ class TaskBox(BoxLayout):
 class ToDoListView(Screen):
     """A screen for displaying the To-Do List."""
 
+    tasks_job = None  # Background load of the displayed tasks
+    page_cursor = None  # Where the next page of sorted tasks starts, None if the last page (or a filtered list) is shown
+
     def __init__(self, **kwargs):
         """Initialize the ToDoListView screen."""
         super().__init__(**kwargs)  # Initialize the superclass with provided arguments.
@@ -165,8 +177,8 @@ class ToDoListView(Screen):
         self.current_sort = "Due Date"  # Default sorting criterion
 
 
-    def add_task(self, task_id, name, priority=None, due_date=None, categories=None, complete=False):
-        """Add a new task to the to-do list."""
+    def add_task(self, task_id, name, priority=None, due_date=None, categories=None, complete=False, editable=True):
+        """Add a new task to the to-do list (archived tasks aren't editable: no edit button, and the checkbox is disabled)."""
         app = App.get_running_app()
         # Create a TaskBox and pass `on_task_click` as the click callback
         task_box = TaskBox(on_click_callback=self.on_task_click, edit_callback=self.on_edit_task_click, padding="15dp", spacing="5dp", size_hint_y=None, height="60dp", size_hint_x=1)
@@ -175,6 +187,7 @@ class ToDoListView(Screen):
         # Add checkbox for Task.complete and bind it to toggle_complete
         task_box.add_checkbox(lambda instance: self.toggle_complete(instance, task_id, task_box))
         task_box.check_box.active = complete  # Set initial checkbox state
+        task_box.check_box.disabled = not editable
 
         # Check/update info to display None if needed
         if due_date is None:
@@ -199,7 +212,8 @@ class ToDoListView(Screen):
         task_box.add_widget(priority_label)
         task_box.add_widget(Label(text=categories, size_hint_x=0.5, color=app.Text_Color))
         
-        task_box.add_edit_button()
+        if editable:
+            task_box.add_edit_button()
 
         # Grey out task if already complete
         if complete:
@@ -212,60 +226,95 @@ class ToDoListView(Screen):
 
     def populate(self):
         """
-        Populate the ToDoListView with tasks from the database, sorted based on the current_sort attribute.
+        Populate the ToDoListView with the first page of tasks from the database, sorted based on the current_sort attribute.
         
         Postconditions:
-            - Retrieves all tasks, including those created through recurrence.
-            - Tasks are displayed in the to-do list, ordered by due date.
+            - Retrieves the first page of tasks (taskRepository.PAGE_SIZE), including those created through recurrence, in the background.
+            - Tasks are displayed in the to-do list, ordered by due date; the rest are loaded a page at a time as the list is scrolled.
+        """
+        sort = self.current_sort
+        self.load_in_background(lambda session: self.load_page(session, sort, None), on_result=self.show_first_page)
+
+    def load_in_background(self, load, on_result=None):
+        """Run load(session) on the database executor and show the task rows it returns with on_result, show_tasks by default (only the latest load matters)."""
+        if self.tasks_job:
+            self.tasks_job.cancel()
+        self.page_cursor = None  # until a sorted page says there's another one
+        self.tasks_job = db_executor.submit(load, on_result=on_result or self.show_tasks)
+
+    @staticmethod
+    def load_page(session, sort, cursor):
+        """
+        Query a page of tasks sorted by the given option, starting at the cursor (runs on the database executor).
+
+        Returns:
+            tuple[list[tuple], cursor]: display rows (see task_row), and where the next page starts (None after the last one)
         """
-        with db.get_session() as session:
-            stmt = None  # Initialize stmt to avoid UnboundLocalError
-
-            # Determine sorting order based on the selected option
-            if self.current_sort == "Priority":
-                # Define custom priority order: High (1), Medium (2), Low (3), None (-) as 4
-                priority_order = case(
-                    (Task.priority == 'HIGH', 1),
-                    (Task.priority == 'MEDIUM', 2),
-                    (Task.priority == 'LOW', 3),
-                    else_=4  # For tasks without a priority, assign the lowest order
-                )
-                stmt = select(Task).order_by(priority_order)
-            elif self.current_sort == "Due Date":
-                stmt = select(Task).order_by(Task.due_date.asc())
-            elif self.current_sort == "Category":
-                # Sort by the name of the first associated category
-                stmt = (
-                    select(Task)
-                    .outerjoin(Task.categories)  # Join tasks with categories
-                    .order_by(func.coalesce(Category.name, "").asc())  # Order by category name, null-safe
-                )
-            else:
-                # Default to sorting by Due Date
-                stmt = select(Task).order_by(Task.due_date.asc())
-
-            # Fetch tasks from the database
-            tasks = session.scalars(stmt).all()
-
-            # Debugging: Print fetched tasks and their sort order
-            print(f"Sorting by: {self.current_sort}")
-            for task in tasks:
-                category_names = [cat.name for cat in task.categories] if task.categories else "-"
-                print(f"Task: {task.name}, Priority: {task.priority}, Due Date: {task.due_date}, Categories: {category_names}")
-
-            # Clear the current task list
-            self.ids.task_list.clear_widgets()
-
-            # Add each task to the list view
-            for task in tasks:
-                # Format due date as a string, or set to "-" if None
-                due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
-
-                # Format categories as a comma-separated string, or set to "-" if none exist
-                categories = ", ".join([cat.name for cat in task.categories]) if task.categories else "-"
-
-                # Add the task to the view
-                self.add_task(task.id, task.name, task.priority, due_date, categories, complete=task.complete)
+        # Fetch task records (with their category names) from the database
+        tasks, next_cursor = TaskRepository.records_page(session, sort, cursor)
+
+        # Debugging: Print fetched tasks and their sort order
+        print(f"Sorting by: {sort}, loaded {len(tasks)} tasks")
+        for task in tasks:
+            category_names = list(task.categories) if task.categories else "-"
+            print(f"Task: {task.name}, Priority: {task.priority}, Due Date: {task.due_date}, Categories: {category_names}")
+
+        return [ToDoListView.task_row(task) for task in tasks], next_cursor
+
+    def show_first_page(self, page):
+        """Replace the displayed tasks with the first page's rows, and remember where the next page starts."""
+        rows, self.page_cursor = page
+        self.show_tasks(rows)
+        Clock.schedule_once(self.fill_view)  # once the list's height is updated
+
+    def show_next_page(self, page):
+        """Add the next page's rows below the displayed tasks, and remember where the page after it starts."""
+        rows, self.page_cursor = page
+        self.tasks_job = None
+        for task_id, name, priority, due_date, categories, complete in rows:
+            self.add_task(task_id, name, priority, due_date, categories, complete=complete)
+        Clock.schedule_once(self.fill_view)  # once the list's height is updated
+
+    def load_next_page(self):
+        """Load the next page of sorted tasks in the background, unless one is loading or the last page is shown."""
+        if self.page_cursor is None or (self.tasks_job and not self.tasks_job.done()):
+            return
+        sort, cursor = self.current_sort, self.page_cursor
+        self.tasks_job = db_executor.submit(lambda session: self.load_page(session, sort, cursor), on_result=self.show_next_page)
+
+    def on_task_scroll(self, scroll_view):
+        """Load the next page once the task list is scrolled near its end."""
+        if scroll_view.scroll_y <= NEXT_PAGE_SCROLL_Y:
+            self.load_next_page()
+
+    def fill_view(self, *args):
+        """Load the next page if the tasks shown don't fill the list yet (it can't be scrolled until they do)."""
+        if self.ids.task_list.height <= self.ids.task_scroll.height:
+            self.load_next_page()
+
+    @staticmethod
+    def task_row(task):
+        """Return (id, name, priority, due date text, categories text, complete) for a TaskRecord, as add_task takes them."""
+        # Format due date as a string, or set to "-" if None
+        due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
+
+        # Format categories as a comma-separated string, or set to "-" if none exist
+        categories = ", ".join(task.categories) if task.categories else "-"
+
+        return task.id, task.name, task.priority, due_date, categories, task.complete
+
+    def show_tasks(self, rows, editable=True):
+        """Replace the displayed tasks with the given rows (see task_row)."""
+        # Clear the current task list
+        self.ids.task_list.clear_widgets()
+
+        # Add each task to the list view
+        for task_id, name, priority, due_date, categories, complete in rows:
+            self.add_task(task_id, name, priority, due_date, categories, complete=complete, editable=editable)
+
+    def show_archived_tasks(self, rows):
+        """Replace the displayed tasks with the given archived rows (see task_row), which can't be edited."""
+        self.show_tasks(rows, editable=False)
 
     def on_task_click(self, task_id):
         """Open the EditTaskModal for the clicked task."""
@@ -282,13 +331,15 @@ class ToDoListView(Screen):
         """Toggle the completion status of a task."""
         complete = checkbox.active  # True if checked, False if unchecked
 
-        # Update the task in the database
-        with db.get_session() as session:
+        # Update the task in the database (in the background)
+        def update(session):
             task = session.query(Task).filter_by(id=task_id).first()
             if task:
                 task.complete = complete  # Assume `complete` is a field in the Task model
                 session.commit()
 
+        db_executor.submit(update)
+
         # Update the visual appearance of the task
         if complete:
             # Set text and background color to greyed-out
@@ -356,31 +407,23 @@ class ToDoListView(Screen):
         Filter tasks based on the selected priority level.
 
         Args:
-            priority_filter (str): The selected priority filter (e.g., "High", "Medium", "Low", "-", "All").
+            priority_filter (str): The selected priority filter (e.g., "High", "Medium", "Low", "-", "All", "Archived").
         """
         if priority_filter == "All":
             print("Displaying all tasks.")
             self.populate()  # Reset and show all tasks
             return
 
+        # Handle the "Archived" option, the only one that reads the archive database
+        if priority_filter == "Archived":
+            print("Displaying archived tasks.")
+            self.load_in_background(self.load_archived_tasks, on_result=self.show_archived_tasks)
+            return
+
         # Handle the "-" option to display tasks with no priority
         if priority_filter == "-":
             print("Displaying tasks with no priority.")
-            with db.get_session() as session:
-                tasks = session.query(Task).filter(Task.priority == None).all()  # Fetch tasks with NULL priority
-
-                # Debugging: Log tasks with no priority
-                print(f"Tasks with no priority:")
-                for task in tasks:
-                    print(f"Task: {task.name}, Priority: {task.priority}")
-
-                # Clear the current task list and add filtered tasks
-                self.ids.task_list.clear_widgets()
-                for task in tasks:
-                    due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
-                    categories = ", ".join([cat.name for cat in task.categories]) if task.categories else "-"
-                    self.add_task(task.id, task.name, task.priority, due_date, categories, complete=task.complete)
-
+            self.load_in_background(lambda session: self.load_filtered_tasks(session, None))
             return  # Exit the method after handling "-"
 
         try:
@@ -391,20 +434,36 @@ class ToDoListView(Screen):
             return
 
         # Query tasks filtered by the selected priority
-        with db.get_session() as session:
-            tasks = session.query(Task).filter_by(priority=priority_enum).all()
-
-            # Debugging: Log tasks for the selected priority
-            print(f"Filtering tasks by priority: {priority_filter}")
-            for task in tasks:
-                print(f"Task: {task.name}, Priority: {task.priority}")
-
-            # Clear the current task list and add filtered tasks
-            self.ids.task_list.clear_widgets()
-            for task in tasks:
-                due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
-                categories = ", ".join([cat.name for cat in task.categories]) if task.categories else "-"
-                self.add_task(task.id, task.name, task.priority, due_date, categories, complete=task.complete)
+        print(f"Filtering tasks by priority: {priority_filter}")
+        self.load_in_background(lambda session: self.load_filtered_tasks(session, priority_enum))
+
+    @staticmethod
+    def load_filtered_tasks(session, priority):
+        """
+        Query tasks with the given priority, None for tasks without one (runs on the database executor).
+
+        Returns:
+            list[tuple]: display rows, see task_row
+        """
+        tasks = TaskRepository.records_with_priority(session, priority)  # None fetches tasks with NULL priority
+
+        # Debugging: Log the filtered tasks
+        for task in tasks:
+            print(f"Task: {task.name}, Priority: {task.priority}")
+
+        return [ToDoListView.task_row(task) for task in tasks]
+
+    @staticmethod
+    def load_archived_tasks(session):
+        """
+        Query the archived tasks, latest due first (runs on the database executor, attaching the archive only for this query).
+
+        Returns:
+            list[tuple]: display rows, see task_row
+        """
+        tasks = archived_task_records(get_database())
+        print(f"Archived tasks: {len(tasks)}")
+        return [ToDoListView.task_row(task) for task in tasks]
 
     def on_edit_task_click(self, task_id):
         """Opens the edit modal when the edit button is clicked."""
@@ -16,6 +16,8 @@
 # - December 5, 2024: Updated the logic and UI for the RepeatOptionsModal to match what the group decided (Matthew McManness)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 17, 2026: CategoryModal saves new categories on the database executor instead of the UI thread (BusyBee Team)
+# - October 17, 2026: Added SeriesScopeModal (BusyBee Team)
 #
 # Preconditions:
 # - Kivy framework must be installed and functional.
@@ -47,6 +49,8 @@ from datetime import datetime  # Date and time utilities
 from Models import Category # Category model
 from Models.databaseEnums import Priority, Frequency # priorities for tasks, frequency for recurrence
 from database import get_database # class to interact with database
+from Services.dbExecutor import get_db_executor # to use the database in the background
+from Services.seriesOperations import SeriesScope # scopes of series changes
 import calendar  # Import calendar for setting first day of the week
 from kivy.metrics import dp
 from kivy.properties import NumericProperty
@@ -546,6 +550,71 @@ class PriorityOptionsModal(ModalView):
         """Update the size and position of the background rectangle."""
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
+
+class SeriesScopeModal(ModalView):
+    """A modal that asks which part of a series a change applies to: this occurrence, this and following, or the entire series."""
+
+    def __init__(self, title, on_choice, scopes=None, **kwargs):
+        """
+        Initializes the SeriesScopeModal.
+
+        Args:
+            title (str): What is being done, e.g. "Delete recurring event".
+            on_choice (callable): Called with the chosen SeriesScope.
+            scopes (list[SeriesScope]): The scopes to offer, all of them by default.
+            **kwargs: Additional keyword arguments passed to the superclass.
+        """
+        super().__init__(**kwargs)
+        self.size_hint = (0.6, 0.45)  # Set modal size
+        self.auto_dismiss = False  # Prevent accidental dismissal
+        self.on_choice = on_choice  # Store the callback
+
+        # Access app-wide styles
+        app = App.get_running_app()
+
+        # Create the main layout for scope options
+        layout = BoxLayout(orientation='vertical', padding=10, spacing=10)
+
+        # Add a custom background color with rounded corners
+        with layout.canvas.before:
+            Color(rgba=app.Background_Color)  # Use the app's background color
+            self.bg_rect = RoundedRectangle(
+                pos=layout.pos,
+                size=layout.size,
+                radius=[dp(20)]
+            )
+
+        # Bind the position and size of the layout to update the background rectangle dynamically
+        layout.bind(pos=self.update_background, size=self.update_background)
+
+        layout.add_widget(Label(text=title, color=app.Text_Color, size_hint_y=None, height=50))
+
+        # Add buttons for each scope option
+        for scope in scopes or list(SeriesScope):
+            button = UniformButton(text=SeriesScope.scope_options()[scope.value], size_hint_y=None, height=50)
+            button.bind(on_release=self.set_scope_option)  # Bind selection to handler
+            layout.add_widget(button)
+
+        # Add a cancel button to dismiss the modal
+        cancel_button = UniformButton(text="CANCEL", size_hint_y=None, height=50, on_release=self.dismiss)
+        layout.add_widget(cancel_button)
+
+        self.add_widget(layout)  # Add the layout to the modal
+
+    def set_scope_option(self, instance):
+        """
+        Closes the modal and passes the selected scope to the callback.
+
+        Args:
+            instance (Button): The button representing the selected scope option.
+        """
+        self.dismiss()  # Close the modal
+        self.on_choice(SeriesScope.str2enum(instance.text))
+
+    def update_background(self, *args):
+        """Update the size and position of the background rectangle."""
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
 ####################### Category Modals ###########################
 class CategoryModal(ModalView):
     """A modal for adding a new category to tasks."""
@@ -612,16 +681,16 @@ class CategoryModal(ModalView):
             self.task_modal.categories.append(new_category)  # Add category
             self.task_modal.update_category_spinner()  # Update spinner options
 
-            category_object = Category(name=new_category) # make a category object
-
-            # save new category
-            with db.get_session() as session: # connect to database with a session
+            def save(session):
+                """Insert the new category and return its generated id (runs on the database executor)"""
+                category_object = Category(name=new_category) # make a category object
                 with session.begin(): # start transaction (auto commits)
                     session.add(category_object) # insert new category
-                
-                category_id = category_object.id # get generated id
-                self.task_modal.categories_ids.append(category_id) # cache id
-                
+                return category_object.id # get generated id
+
+            # save new category in the background, then cache its id
+            get_db_executor().submit(save, on_result=self.task_modal.categories_ids.append)
+
             CategoryConfirmationModal(new_category).open()  # Open confirmation modal
         else:
             DuplicateCategoryModal().open()  # Open duplicate error modal